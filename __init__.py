@@ -1 +1,16 @@
-from .core import Tkpp
\ No newline at end of file
+import importlib
+
+# Submodules are imported on first use so `import tkinterpp` stays cheap.
+__all__ = ["Model", "Tkpp", "widgets"]
+
+
+def __getattr__(name):
+    if name == "Tkpp":
+        from .core import Tkpp
+        return Tkpp
+    if name == "Model":
+        from .binding import Model
+        return Model
+    if name == "widgets":
+        return importlib.import_module(".widgets", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
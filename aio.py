@@ -0,0 +1,155 @@
+import asyncio
+import tkinter
+
+import _tkinter
+
+
+def _noop(*args):
+    pass
+
+
+class _Bridge:
+    """
+    Runs Tk inside an asyncio loop without polling. The asyncio selector's
+    fd is registered as a Tk file handler and a Tk timer is armed for the
+    next asyncio deadline, so blocking in Tk's dooneevent() wakes up as soon
+    as either side has work. Where that is not possible (Windows, proactor
+    loops) it falls back to an adaptive sleep between Tk passes.
+    """
+    MIN_SLEEP = 0.001
+    MAX_SLEEP = 0.02
+    MAX_DRAIN = 100
+
+    def __init__(self, root, loop):
+        self.root = root
+        self.loop = loop
+        self.alive = True
+        self.fd = self._selector_fd(loop, root.tk)
+        self._bind_id = root.bind("<Destroy>", self._on_destroy, add="+")
+
+    @staticmethod
+    def _selector_fd(loop, tk):
+        # Tk has no file handlers on Windows
+        selector = getattr(loop, "_selector", None)
+        if selector is None or not hasattr(tk, "createfilehandler"):
+            return None
+        try:
+            return selector.fileno()
+        except (AttributeError, NotImplementedError, OSError):
+            return None
+
+    def _on_destroy(self, event):
+        if event.widget is self.root:
+            self.alive = False
+
+    def _timeout(self):
+        """Seconds until asyncio needs to run again, or None for no deadline."""
+        if getattr(self.loop, "_ready", None):
+            return 0
+        scheduled = getattr(self.loop, "_scheduled", None)
+        if scheduled:
+            return max(0, scheduled[0].when() - self.loop.time())
+        return None
+
+    def _drain(self):
+        # bounded, so a steady stream of Tk events cannot starve asyncio
+        tk = self.root.tk
+        for _ in range(self.MAX_DRAIN):
+            if not self.alive or not tk.dooneevent(_tkinter.DONT_WAIT):
+                break
+
+    async def run(self):
+        try:
+            if self.fd is None:
+                await self._run_polling()
+            else:
+                await self._run_blocking()
+        finally:
+            if self.alive:
+                self._unbind()
+
+    def _unbind(self):
+        # before Python 3.13, unbind(sequence, funcid) deletes the whole
+        # <Destroy> script, other add="+" handlers included; drop our line only
+        root = self.root
+        marker = f"[{self._bind_id} "
+        script = root.bind("<Destroy>")
+        root.bind("<Destroy>", "\n".join(line for line in script.split("\n") if marker not in line))
+        root.deletecommand(self._bind_id)
+
+    async def _run_blocking(self):
+        tk = self.root.tk
+        while self.alive:
+            timeout = self._timeout()
+            if timeout != 0:
+                timer = None
+                if timeout is not None:
+                    timer = self.root.after(max(1, int(timeout * 1000)), _noop)
+                # sleeps until a Tk event, the asyncio fd or the timer fires.
+                # The fd stays readable until asyncio runs, so the handler is
+                # only installed while blocked.
+                tk.createfilehandler(self.fd, tkinter.READABLE, _noop)
+                try:
+                    tk.dooneevent(0)
+                finally:
+                    tk.deletefilehandler(self.fd)
+                if timer is not None and self.alive:
+                    self.root.after_cancel(timer)
+            self._drain()
+            await asyncio.sleep(0)
+
+    async def _run_polling(self):
+        delay = self.MIN_SLEEP
+        tk = self.root.tk
+        while self.alive:
+            handled = False
+            for _ in range(self.MAX_DRAIN):
+                if not self.alive or not tk.dooneevent(_tkinter.DONT_WAIT):
+                    break
+                handled = True
+            # back off while idle, snap back as soon as events arrive
+            delay = self.MIN_SLEEP if handled else min(delay * 2, self.MAX_SLEEP)
+            await asyncio.sleep(delay)
+
+
+async def run(root):
+    """Drive `root` until it is destroyed, sharing the thread with asyncio."""
+    bridge = _Bridge(root, asyncio.get_running_loop())
+    await bridge.run()
+
+
+def _future():
+    return asyncio.get_running_loop().create_future()
+
+
+def _resolve(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def wait_animation(animation):
+    """
+    Future resolved when `animation` ends: True if it ran to completion,
+    False if it was stopped. An animation that has already ended resolves
+    to None straight away.
+    """
+    future = _future()
+    if animation.start_time is not None and not animation.running:
+        _resolve(future, None)
+    else:
+        animation.add_done_callback(lambda anim, completed: _resolve(future, completed))
+    return future
+
+
+def wait_command(widget):
+    """Future resolved the next time a Button's (or Switch's) command fires."""
+    future = _future()
+
+    def fired():
+        widget.remove_command_listener(fired)
+        _resolve(future, None)
+
+    widget.add_command_listener(fired)
+    future.add_done_callback(lambda f: widget.remove_command_listener(fired))
+    return future
+
@@ -1,8 +1,56 @@
+import sys
 import time
 import math
+import weakref
+
+from . import color
+from .batch import WriteBatch
+from .compositor import Compositor
+from .easing import ease
+from .profiler import Profiler
+
+class ColorTween:
+    """
+    Update function for color animations. The easing is baked into the
+    precomputed table, so a frame is one lookup and one buffered write.
+    """
+    __slots__ = ("batch", "widget", "target", "frames", "last", "value")
+
+    def __init__(self, batch, widget, target, frames):
+        self.batch = batch
+        self.widget = widget
+        self.target = target
+        self.frames = frames
+        self.last = len(frames) - 1
+        self.value = frames[0]
+
+    def __call__(self, progress):
+        self.value = self.frames[int(round(progress * self.last))]
+        self.batch.write(self.widget, **{self.target: self.value})
+
+
+class MoveTween:
+    __slots__ = ("batch", "widget", "x", "y", "dx", "dy", "value")
+
+    def __init__(self, batch, widget, from_pos, to_pos):
+        self.batch = batch
+        self.widget = widget
+        self.x, self.y = from_pos
+        self.dx = to_pos[0] - from_pos[0]
+        self.dy = to_pos[1] - from_pos[1]
+        self.value = tuple(from_pos)
+
+    def __call__(self, progress):
+        self.value = (int(self.x + self.dx * progress), int(self.y + self.dy * progress))
+        self.batch.place(self.widget, x=self.value[0], y=self.value[1])
+
 
 class Animation:
-    def __init__(self, widget, duration, update_func, on_complete=None, easing="linear"):
+    __slots__ = ("widget", "duration", "update_func", "on_complete", "start_time", "running",
+                 "easing", "steps", "_name", "group", "slot", "_done_callbacks")
+
+    def __init__(self, widget, duration, update_func, on_complete=None, easing="linear", steps=None, name=None,
+                 slot=None):
         self.widget = widget
         self.duration = duration
         self.update_func = update_func
@@ -10,65 +58,123 @@ class Animation:
         self.start_time = None
         self.running = False
         self.easing = easing
+        self.steps = steps
+        self._name = name
+        self.group = None
+        # (widget, property) this animation owns, or a set of them; starting
+        # another animation on one takes it over (see retire)
+        self.slot = slot
+        self._done_callbacks = None
+
+    @property
+    def name(self):
+        """Label used by the profiler; defaults to the update function and widget."""
+        if self._name:
+            return self._name
+        func = self.update_func
+        return f"{getattr(func, '__qualname__', type(func).__qualname__)} on {self.widget}"
 
     def start(self):
-        self.start_time = time.time()
+        manager = AnimationManager.for_widget(self.widget)
+        self.start_time = manager.clock()
         self.running = True
-        self._step()
+        if self.slot is not None:
+            manager.claim(self)
+        # first frame is applied immediately, the rest run on the shared clock
+        if self._step(self.start_time):
+            manager.add(self)
 
     def _ease(self, t):
-        if self.easing == "ease_in_out":
-            return t * t * (3 - 2 * t)
-        elif self.easing == "ease_out":
-            return 1 - (1 - t) * (1 - t)
-        elif self.easing == "ease_in":
-            return t * t
-        return t  # linear
-
-    def _step(self):
+        return ease(self.easing, t)
+
+    def _step(self, now):
+        """Advance to `now`. Returns True while the animation wants more frames."""
         if not self.running:
-            return
+            return False
 
-        elapsed = time.time() - self.start_time
-        progress = min(elapsed / self.duration, 1.0)
+        if self.duration > 0:
+            progress = min((now - self.start_time) / self.duration, 1.0)
+        else:
+            progress = 1.0
+        if self.steps:
+            progress = math.floor(progress * self.steps) / self.steps
         eased = self._ease(progress)
 
         self.update_func(eased)
 
         if progress < 1.0:
-            self.widget.after(16, self._step)
-        else:
-            self.running = False
-            if self.on_complete:
-                self.on_complete()
+            return True
+        self.running = False
+        if self.on_complete:
+            self.on_complete()
+        self._finish(True)
+        return False
 
     def stop(self):
-        self.running = False
+        if self.running:
+            self.running = False
+            self._finish(False)
 
-    @staticmethod
-    def animate_color(widget, from_color, to_color, duration=300, target="bg"):
-        def update(progress):
-            r1, g1, b1 = widget.winfo_rgb(from_color)
-            r2, g2, b2 = widget.winfo_rgb(to_color)
+    def retire(self, key):
+        """
+        Give up slot `key` to a newer animation. An animation owning several
+        slots stops writing that one and keeps running the rest; the last
+        slot stops it. Returns True if the animation stopped.
+        """
+        slot = self.slot
+        if isinstance(slot, set) and len(slot) > 1 and self._drop(key):
+            slot.discard(key)
+            return False
+        self.stop()
+        return True
+
+    def _drop(self, key):
+        """Stop writing slot `key`; returns False if this animation cannot."""
+        if self.group is None:
+            return False
+        self.group.drop(*key)
+        return True
 
-            r = int(r1 + (r2 - r1) * progress) // 256
-            g = int(g1 + (g2 - g1) * progress) // 256
-            b = int(b1 + (b2 - b1) * progress) // 256
+    def add_done_callback(self, func):
+        """Call func(animation, completed) once it completes or is stopped."""
+        if self._done_callbacks is None:
+            self._done_callbacks = []
+        self._done_callbacks.append(func)
 
-            new_color = f"#{r:02x}{g:02x}{b:02x}"
-            widget.config(**{target: new_color})
+    def _finish(self, completed):
+        if self.slot is not None:
+            AnimationManager.for_widget(self.widget).release(self)
+        callbacks, self._done_callbacks = self._done_callbacks, None
+        for func in callbacks or ():
+            func(self, completed)
+
+    @staticmethod
+    def color_frames(widget, from_color, to_color, duration=300, steps=None, easing="linear"):
+        """Precomputed hex sequence for a color tween, shared between callers."""
+        if not steps:
+            steps = max(2, int(duration / AnimationManager.frame_interval))
+        return color.gradient(
+            color.to_rgb(from_color, widget), color.to_rgb(to_color, widget), steps, easing
+        )
 
-        animation = Animation(widget, duration / 1000.0, update)
+    @staticmethod
+    def animate_color(widget, from_color, to_color, duration=300, target="bg", easing="linear", steps=None):
+        manager = AnimationManager.for_widget(widget)
+        # retarget from wherever a running animation of this property is
+        from_color = manager.current(widget, target, from_color)
+        frames = Animation.color_frames(widget, from_color, to_color, duration, steps, easing)
+        tween = ColorTween(manager.batch, widget, target, frames)
+        animation = Animation(widget, duration / 1000.0, tween, steps=steps, slot=(widget, target))
         animation.start()
         return animation
 
     @staticmethod
-    def animate_move(widget, from_pos, to_pos, duration=300):
-        def update(progress):
-            x = int(from_pos[0] + (to_pos[0] - from_pos[0]) * progress)
-            y = int(from_pos[1] + (to_pos[1] - from_pos[1]) * progress)
-            widget.place(x=x, y=y)
-        animation = Animation(widget, duration / 1000.0, update)
+    def animate_move(widget, from_pos, to_pos, duration=300, steps=None, easing="linear"):
+        manager = AnimationManager.for_widget(widget)
+        from_pos = manager.current(widget, "position", from_pos)
+        tween = MoveTween(manager.batch, widget, from_pos, to_pos)
+        animation = Animation(widget, duration / 1000.0, tween, easing=easing, steps=steps,
+                              slot=(widget, "position"))
         animation.start()
         return animation
 
@@ -77,21 +183,318 @@ class Animation:
         def update(progress):
             alpha = from_opacity + (to_opacity - from_opacity) * progress
             window.attributes("-alpha", alpha)
-        animation = Animation(window, duration / 1000.0, update)
+        animation = Animation(window, duration / 1000.0, update, slot=(window, "alpha"))
         animation.start()
         return animation
 
 class AnimationManager:
-    def __init__(self, root, theme):
-        self.root = root
+    """
+    Owns the frame clock for one Tk root. Every running Animation on that
+    root is advanced from a single after() chain, which stops as soon as
+    nothing is running. Property writes made during a frame go through
+    `batch` and reach Tk as one configure per widget.
+
+    With `adaptive` on, the interval stretches towards max_frame_interval
+    while frames cost more than half of it and shrinks back when they are
+    cheap; `fps_cap` bounds the rate for power saving. The clock stops
+    while the root window is unmapped (not shown yet, withdrawn or
+    iconified) and the animations resume where they were.
+    """
+    frame_interval = 16  # ms, the fastest rate
+    max_frame_interval = 50  # ms, the slowest the adaptive scheduler goes
+    adaptive = True
+    clock = staticmethod(time.monotonic)
+
+    _managers = weakref.WeakKeyDictionary()
+
+    def __init__(self, root, theme=None):
+        # weak: the registry value must not keep its own key alive
+        self._root = weakref.ref(root)
         self.theme = theme
+        self.animations = []
+        self.frame_count = 0
+        self.skipped_frames = 0
+        self.batch = WriteBatch(root)
+        self.profiler = None
+        self.tracer = None
+        self.slots = {}
+        self.superseded = 0
+        self.fps_cap = None
+        self.interval = self.frame_interval
+        self.frame_cost = 0.0  # ms, moving average
+        self.suspended_at = None
+        self._after_id = None
+        self._next_frame = None
+        AnimationManager._managers[root] = self
+        root.bind("<Unmap>", self._on_unmap, add="+")
+        root.bind("<Map>", self._on_map, add="+")
+        if not root.winfo_ismapped():
+            # not shown yet (Tkpp withdraws the root until mainloop): hidden
+            # since before any animation started, until the first <Map>
+            self.suspended_at = -math.inf
+
+    @property
+    def root(self):
+        return self._root()
+
+    @classmethod
+    def for_widget(cls, widget):
+        """Return the manager driving `widget`'s root, creating one if needed."""
+        root = widget._root()
+        manager = cls._managers.get(root)
+        if manager is None:
+            manager = cls(root)
+        return manager
+
+    def add(self, animation):
+        self.animations.append(animation)
+        self._schedule()
+
+    def claim(self, animation):
+        """
+        Make `animation` the owner of its slots. Each previous owner gives
+        up the keys it loses and is retired once it has none left.
+        """
+        slot = animation.slot
+        slots = self.slots
+        for key in slot if isinstance(slot, set) else (slot,):
+            previous = slots.get(key)
+            if previous is not None and previous is not animation and previous.retire(key):
+                self.superseded += 1
+            slots[key] = animation
+
+    def release(self, animation):
+        slot = animation.slot
+        slots = self.slots
+        for key in slot if isinstance(slot, set) else (slot,):
+            if slots.get(key) is animation:
+                del slots[key]
+
+    def current(self, widget, prop, default=None):
+        """In-flight value of `prop` on `widget`, or `default` if it is not animating."""
+        animation = self.slots.get((widget, prop))
+        if animation is None:
+            return default
+        return getattr(animation.update_func, "value", default)
+
+    @property
+    def fps(self):
+        """Current target frame rate."""
+        return 1000.0 / self.interval
+
+    def set_fps_cap(self, fps):
+        """Never tick faster than `fps` frames per second; None removes the cap."""
+        self.fps_cap = fps
+        self.interval = max(self.interval, self._min_interval())
+
+    def _min_interval(self):
+        if self.fps_cap:
+            return max(self.frame_interval, 1000.0 / self.fps_cap)
+        return self.frame_interval
+
+    def _adapt(self, cost):
+        self.frame_cost = cost if not self.frame_cost else self.frame_cost * 0.8 + cost * 0.2
+        floor = self._min_interval()
+        if self.frame_cost > self.interval * 0.5:
+            self.interval = min(max(self.max_frame_interval, floor), self.interval * 1.25)
+        elif self.frame_cost < self.interval * 0.25:
+            self.interval = max(floor, self.interval * 0.9)
+
+    # --- suspension while the window is hidden ---
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self.suspend()
+
+    def _on_map(self, event):
+        if event.widget is self.root:
+            self.resume()
+
+    def suspend(self):
+        """Stop the clock; running animations keep their progress."""
+        if self.suspended_at is not None:
+            return
+        self.suspended_at = self.clock()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._next_frame = None
+
+    def resume(self):
+        """Restart the clock, shifting every animation by the time spent suspended."""
+        if self.suspended_at is None:
+            return
+        now = self.clock()
+        suspended_at, self.suspended_at = self.suspended_at, None
+        for animation in self.animations:
+            if animation.start_time is not None:
+                # animations started while suspended have not advanced at all
+                animation.start_time += now - max(suspended_at, animation.start_time)
+        self._schedule()
+
+    def _schedule(self):
+        if self._after_id is not None or not self.animations or self.suspended_at is not None:
+            return
+        now = self.clock()
+        interval = self.interval / 1000.0
+        if self._next_frame is None or self._next_frame < now:
+            self._next_frame = now + interval
+        delay = max(1, int(round((self._next_frame - now) * 1000)))
+        profiler = self.profiler
+        if profiler is None:
+            self._after_id = self.root.after(delay, self._tick)
+        else:
+            self._after_id = profiler.timed(self.root, "after", self.root.after, delay, self._tick)
+
+    def _tick(self):
+        began_frame = time.perf_counter()
+        start = self.clock()
+        animations = self.animations
+        self.animations = []
+        profiler = self.profiler
+        self.batch.in_frame = True
+        alive = []
+        for animation in animations:
+            try:
+                if profiler is None:
+                    running = animation._step(start)
+                else:
+                    began = time.perf_counter()
+                    running = animation._step(start)
+                    profiler.record_animation(animation, time.perf_counter() - began)
+                if running:
+                    alive.append(animation)
+            except Exception:
+                # a broken update_func only ends its own animation
+                animation.running = False
+                self.root.report_callback_exception(*sys.exc_info())
+                animation._finish(False)
+        # animations started from inside a callback were queued meanwhile
+        self.animations = alive + self.animations
+        self.batch.in_frame = False
+        self.batch.flush()
+        self.frame_count += 1
+        cost = time.perf_counter() - began_frame
+        if profiler is not None:
+            profiler.record_frame(cost)
+        if self.adaptive:
+            self._adapt(cost * 1000.0)
+
+        # skip whole frames when this one ran over budget instead of
+        # queueing catch-up ticks back to back
+        interval = self.interval / 1000.0
+        end = self.clock()
+        self._next_frame = (self._next_frame or start) + interval
+        if end > self._next_frame:
+            missed = int((end - self._next_frame) // interval) + 1
+            self.skipped_frames += missed
+            self._next_frame += missed * interval
+
+        self._after_id = None
+        if self.animations:
+            self._schedule()
+        else:
+            self._next_frame = None
+
+    def enable_profiling(self, history=600):
+        """Start collecting per-frame stats; read them with self.profiler.stats()."""
+        if self.tracer is not None:
+            if self.tracer.inner is None:
+                self.tracer.inner = Profiler(history)
+            return self.tracer.inner
+        if self.profiler is None:
+            self.profiler = Profiler(history)
+            self.batch.profiler = self.profiler
+        return self.profiler
+
+    def enable_tracing(self, capacity=100000):
+        """
+        Record the last `capacity` frame, update_func, write and command
+        spans; export them with self.tracer.dump().
+        """
+        if self.tracer is None:
+            from .trace import Tracer
+            self.tracer = Tracer(capacity, inner=self.profiler)
+            self.profiler = self.batch.profiler = self.tracer
+        return self.tracer
+
+    def enable_compositing(self, canvas):
+        """
+        Move widgets hosted on `canvas` with canvas.coords instead of place().
+        Host widgets with the returned Compositor's add(widget, x, y).
+        """
+        if self.batch.compositor is None or self.batch.compositor.canvas is not canvas:
+            self.batch.flush()
+            self.batch.compositor = Compositor(canvas)
+        return self.batch.compositor
+
+    def disable_profiling(self):
+        if self.tracer is not None:
+            self.tracer.inner = None
+            return
+        self.profiler = None
+        self.batch.profiler = None
+
+    def disable_tracing(self):
+        if self.tracer is not None:
+            self.tracer.stop_signal()
+            self.profiler = self.batch.profiler = self.tracer.inner
+            self.tracer = None
+
+    def stop_all(self):
+        for animation in self.animations:
+            animation.stop()
+        self.animations = []
+        self.slots.clear()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._next_frame = None
+
+    def animate_group(self, widgets, from_colors=None, to_colors=None, from_pos=None, to_pos=None,
+                      duration=300, target="bg", easing="linear", on_complete=None):
+        """
+        Animate the colors and/or positions of many widgets as one animation.
+        Each endpoint is a single value for all widgets or one per widget;
+        from_* default to the widgets' current values. The group owns the
+        animated property of every widget: it retires animations already
+        running on them, and one started later on a widget takes over only
+        that widget.
+        """
+        # group pulls in NumPy, so only apps that use it pay for the import
+        from .group import GroupAnimation
+        group = GroupAnimation(self.batch, widgets, from_colors, to_colors, from_pos, to_pos, target)
+        slots = set()
+        if group.colors is not None:
+            slots.update((widget, target) for widget in group.widgets)
+        if group.positions is not None:
+            slots.update((widget, "position") for widget in group.widgets)
+        animation = Animation(self.root, duration / 1000.0, group.update, on_complete, easing,
+                              name=f"group of {len(group.widgets)}", slot=slots)
+        animation.group = group
+        animation.start()
+        return animation
+
+    def play(self, timeline, widgets, stagger=0, on_complete=None):
+        """
+        Play a timeline.Timeline on a widget, or on several widgets each
+        `stagger` ms behind the previous one. The timeline is compiled
+        once for this manager's frame interval and reused afterwards.
+        """
+        from .timeline import TimelineAnimation
+        if not isinstance(widgets, (list, tuple)):
+            widgets = [widgets]
+        widgets = [getattr(widget, "widget", widget) for widget in widgets]
+        compiled = timeline.compile(self.frame_interval, widgets[0])
+        animation = TimelineAnimation(compiled, widgets, stagger, on_complete)
+        animation.start()
+        return animation
 
     def create(self, duration, update_func, on_complete=None, easing="linear"):
         return Animation(self.root, duration, update_func, on_complete, easing)
 
     # Forward convenience methods
-    def animate_color(self, widget, from_color, to_color, duration=300, target="bg"):
-        return Animation.animate_color(widget, from_color, to_color, duration, target)
+    def animate_color(self, widget, from_color, to_color, duration=300, target="bg", easing="linear"):
+        return Animation.animate_color(widget, from_color, to_color, duration, target, easing)
 
     def animate_move(self, widget, from_pos, to_pos, duration=300):
         return Animation.animate_move(widget, from_pos, to_pos, duration)
@@ -0,0 +1,271 @@
+"""
+Rounded widget backgrounds rendered off the UI thread. An asset is
+described by a plain tuple spec (shape, size, radius and colors taken
+from the theme); its image is rendered in a process pool and stored as a
+binary PPM in a content-addressed cache directory, so later launches map
+the file in instead of rendering it again.
+"""
+import hashlib
+import math
+import mmap
+import os
+import sys
+import tkinter
+import weakref
+
+from . import color
+from .updates import UpdateChannel
+
+# bump when the renderer output changes, so old cache entries are not reused
+RENDER_VERSION = 1
+CACHE_DIR = os.environ.get("TKINTERPP_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "tkinterpp", "assets")
+
+
+def rounded_spec(width, height, radius, fill, bg, border=None, border_width=0, shadow=2):
+    """Spec of a rounded rectangle image; colors must be hex strings."""
+    return ("rounded", int(width), int(height), int(radius), fill.lower(), bg.lower(),
+            border.lower() if border else None, int(border_width), int(shadow))
+
+
+def asset_key(spec):
+    return hashlib.sha256(repr((RENDER_VERSION, spec)).encode("utf-8")).hexdigest()
+
+
+def _rounded_distance(x, y, left, top, right, bottom, radius):
+    cx, cy = (left + right) / 2.0, (top + bottom) / 2.0
+    qx = abs(x - cx) - ((right - left) / 2.0 - radius)
+    qy = abs(y - cy) - ((bottom - top) / 2.0 - radius)
+    outside = math.hypot(max(qx, 0.0), max(qy, 0.0))
+    return outside + min(max(qx, qy), 0.0) - radius
+
+
+def render(spec):
+    """Render `spec` to binary PPM bytes. Pure Python, so it runs in any worker."""
+    _, width, height, radius, fill, bg, border, border_width, shadow = spec
+    fill, bg = color.to_rgb(fill), color.to_rgb(bg)
+    border = color.to_rgb(border) if border else fill
+    right, bottom = width - 1.0, height - 1.0 - shadow
+    radius = min(radius, (right - 1.0) / 2.0, (bottom - 1.0) / 2.0)
+    pixels = bytearray()
+    for py in range(height):
+        y = py + 0.5
+        for px in range(width):
+            x = px + 0.5
+            pixel = bg
+            if shadow:
+                d = _rounded_distance(x, y, 1.0, 1.0 + shadow, right, bottom + shadow, radius)
+                alpha = 0.3 * min(1.0, max(0.0, (shadow - d) / (2.0 * shadow)))
+                pixel = [c * (1 - alpha) for c in pixel]
+            d = _rounded_distance(x, y, 1.0, 1.0, right, bottom, radius)
+            outer = color.coverage(d)
+            if outer:
+                inner = color.coverage(d + border_width) if border_width else outer
+                pixel = [c + (b - c) * outer for c, b in zip(pixel, border)]
+                pixel = [c + (f - c) * inner for c, f in zip(pixel, fill)]
+            pixels.extend(int(round(c)) for c in pixel)
+    return b"P6\n%d %d\n255\n" % (width, height) + bytes(pixels)
+
+
+def read(path):
+    """Contents of a cache file through a read-only memory map, or None."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:]
+    except OSError:
+        return None
+
+
+def _write(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def render_to_cache(spec, directory):
+    """Worker job: render, store under the content key, return the data."""
+    data = render(spec)
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            _write(os.path.join(directory, asset_key(spec) + ".ppm"), data)
+        except OSError:
+            pass
+    return data
+
+
+class _Delivery:
+    __slots__ = ("pipeline", "key")
+
+    def __init__(self, pipeline, key):
+        self.pipeline = pipeline
+        self.key = key
+
+    def set_result(self, result):
+        self.pipeline._delivered(self.key, result)
+
+
+class AssetPipeline:
+    """
+    Per-root asset loader. request() hands back a PhotoImage: from memory,
+    from the disk cache, or after a process pool worker rendered it. Worker
+    results come back to the Tk thread through the root's UpdateChannel.
+    Workers start in fresh interpreters (forkserver, or spawn where that
+    is missing) that import the main module, so scripts need the usual
+    `if __name__ == "__main__":` guard.
+    """
+    _pipelines = weakref.WeakKeyDictionary()
+
+    def __init__(self, root, directory=CACHE_DIR, workers=None):
+        # weak: the registry value must not keep its own key alive
+        self._root = weakref.ref(root)
+        self.directory = directory
+        self.workers = workers or min(2, os.cpu_count() or 1)
+        self.images = {}
+        self.pending = {}
+        self.rendered = 0
+        self.loaded = 0
+        self._executor = None
+        self._channel = UpdateChannel.for_widget(root)
+        AssetPipeline._pipelines[root] = self
+
+    @property
+    def root(self):
+        return self._root()
+
+    @classmethod
+    def for_widget(cls, widget):
+        root = widget._root()
+        pipeline = cls._pipelines.get(root)
+        if pipeline is None:
+            pipeline = cls(root)
+        return pipeline
+
+    def _pool(self):
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # never fork the Tk process: the child would inherit the X
+            # connection and locks held by other threads
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._executor
+
+    def request(self, spec, callback=None):
+        """
+        Call callback(image) on the Tk thread once `spec` is available;
+        immediately if it already is. Returns the image or None.
+        """
+        key = asset_key(spec)
+        image = self.images.get(key)
+        if image is not None:
+            if callback is not None:
+                callback(image)
+            return image
+
+        if key in self.pending:
+            if callback is not None:
+                self.pending[key].append(callback)
+            return None
+
+        data = read(os.path.join(self.directory, key + ".ppm")) if self.directory else None
+        if data is not None:
+            self.loaded += 1
+            return self._ready(key, data, [callback] if callback else [])
+
+        self.pending[key] = [callback] if callback else []
+        future = self._pool().submit(render_to_cache, spec, self.directory)
+        delivery = _Delivery(self, key)
+        channel = self._channel
+
+        def done(future):
+            # runs on a pool thread; the channel hands the result to the Tk thread
+            try:
+                result = future.result()
+            except Exception as e:
+                result = e
+            channel.post(delivery, "result", result)
+        future.add_done_callback(done)
+        return None
+
+    def _delivered(self, key, result):
+        callbacks = self.pending.pop(key, [])
+        if isinstance(result, Exception):
+            raise result
+        self.rendered += 1
+        self._ready(key, result, callbacks)
+
+    def _ready(self, key, data, callbacks):
+        image = tkinter.PhotoImage(master=self.root, data=data, format="ppm")
+        self.images[key] = image
+        for callback in callbacks:
+            callback(image)
+        return image
+
+    def prewarm(self, theme, sizes=((96, 32),), radius=8):
+        """
+        Queue the rounded button and entry backgrounds of `theme` (a theme
+        dict or a theme name) for every size and state.
+        """
+        if isinstance(theme, str):
+            from .ttkpp import load_theme
+            theme = load_theme(theme)[1]
+        for width, height in sizes:
+            for kind in ("button", "entry"):
+                for spec in theme_specs(theme, width, height, radius, kind).values():
+                    self.request(spec)
+
+    def request_states(self, theme, width, height, radius, kind, callback):
+        """Request every state of a rounded `kind`; callback(state, image) per state."""
+        for state, spec in theme_specs(theme, width, height, radius, kind).items():
+            self.request(spec, lambda image, state=state: callback(state, image))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=sys.version_info >= (3, 9))
+            self._executor = None
+
+
+def theme_specs(theme, width, height, radius, kind="button"):
+    """State name -> spec for a rounded button or entry in `theme`."""
+    bg = theme.get("bg", "#ffffff")
+    if kind == "entry":
+        fill = theme.get("entry_bg", "#ffffff")
+        return {
+            "normal": rounded_spec(width, height, radius, fill, bg, theme.get("fg"), 1, 0),
+            "focus": rounded_spec(width, height, radius, fill, bg, theme.get("accent"), 2, 0),
+        }
+    fill = theme.get("button_bg", "#dddddd")
+    accent = theme.get("accent", fill)
+    pressed = color.to_hex([c * 0.8 for c in color.to_rgb(accent)])
+    return {
+        "normal": rounded_spec(width, height, radius, fill, bg),
+        "hover": rounded_spec(width, height, radius, accent, bg),
+        "active": rounded_spec(width, height, radius, pressed, bg, shadow=0),
+    }
+
+
+def resolve_theme(wrapper):
+    """
+    Hex colors for rounding `wrapper`: its theme, or its current widget
+    options where the theme is silent. "bg" is the parent's background,
+    which shows in the corners.
+    """
+    widget = wrapper.widget
+    theme = dict(wrapper.theme or {})
+    for key, option in wrapper.theme_options.items():
+        if key not in theme:
+            theme[key] = widget.cget(option)
+    try:
+        theme["bg"] = widget.master.cget("bg")
+    except tkinter.TclError:
+        # ttk parents have no bg option
+        theme.setdefault("bg", "#ffffff")
+    theme.setdefault("accent", widget.cget("highlightcolor"))
+    theme.setdefault("fg", widget.cget("fg"))
+    return {key: color.to_hex(color.to_rgb(theme[key], widget))
+            for key in ("bg", "fg", "accent", "button_bg", "entry_bg") if theme.get(key)}
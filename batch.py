@@ -0,0 +1,138 @@
+import time
+import weakref
+
+
+class WriteBatch:
+    """
+    Coalesces configure() and place() writes per tkinter widget. Options
+    written between two flushes are merged (last write wins) and sent as
+    one call. Pending writes are flushed by the frame clock, or on idle
+    when nothing is animating. Moves of widgets hosted by `compositor`
+    become canvas coords updates instead of place() calls.
+    """
+    def __init__(self, root):
+        self._root = weakref.ref(root)
+        self.pending = {}
+        self.pending_place = {}
+        self.profiler = None
+        self.compositor = None
+        self.requested = 0
+        self.issued = 0
+        # set by the frame clock while it ticks; it flushes at the end itself
+        self.in_frame = False
+        self._idle_id = None
+
+    @property
+    def root(self):
+        return self._root()
+
+    @property
+    def saved(self):
+        """Tcl configure calls avoided by coalescing."""
+        return self.requested - self.issued
+
+    def write(self, widget, **options):
+        pending = self.pending.get(widget)
+        if pending is None:
+            self.pending[widget] = options
+        else:
+            pending.update(options)
+        self.requested += 1
+        if self._idle_id is None and not self.in_frame:
+            self._idle_id = self.root.after_idle(self._flush_idle)
+
+    def place(self, widget, **options):
+        compositor = self.compositor
+        if compositor is not None and compositor.hosts(widget):
+            compositor.move(widget, **options)
+            self.requested += 1
+            if self._idle_id is None and not self.in_frame:
+                self._idle_id = self.root.after_idle(self._flush_idle)
+            return
+        pending = self.pending_place.get(widget)
+        if pending is None:
+            self.pending_place[widget] = options
+        else:
+            pending.update(options)
+        self.requested += 1
+        if self._idle_id is None and not self.in_frame:
+            self._idle_id = self.root.after_idle(self._flush_idle)
+
+    def configure(self, widget, **options):
+        """
+        Configure `widget` right away, merged with its pending writes so
+        they cannot land on top later. The wrappers' direct setters use
+        this, so the profiler sees them like the batched writes.
+        """
+        pending = self.pending.pop(widget, None)
+        if pending:
+            pending.update(options)
+            options = pending
+        self.requested += 1
+        self._configure(widget, options)
+
+    def call(self, widget, kind, func, **options):
+        """Run a direct Tk call such as pack() now, timed like the writes."""
+        self.requested += 1
+        self._call(widget, kind, func, options)
+
+    def cget(self, widget, option):
+        """Current value of `option`, including writes not flushed yet."""
+        pending = self.pending.get(widget)
+        if pending and option in pending:
+            return pending[option]
+        return widget.cget(option)
+
+    def flush(self, widget=None):
+        if widget is not None:
+            options = self.pending.pop(widget, None)
+            if options:
+                self._configure(widget, options)
+            options = self.pending_place.pop(widget, None)
+            if options:
+                self._place(widget, options)
+            compositor = self.compositor
+            if (not self.pending and not self.pending_place and self._idle_id is not None
+                    and not (compositor is not None and compositor.pending)):
+                self.root.after_cancel(self._idle_id)
+                self._idle_id = None
+            return
+
+        if self._idle_id is not None:
+            self.root.after_cancel(self._idle_id)
+            self._idle_id = None
+        pending, self.pending = self.pending, {}
+        for widget, options in pending.items():
+            self._configure(widget, options)
+        pending, self.pending_place = self.pending_place, {}
+        for widget, options in pending.items():
+            self._place(widget, options)
+        if self.compositor is not None and self.compositor.pending:
+            self.issued += self.compositor.flush(self.profiler)
+
+    def _flush_idle(self):
+        self._idle_id = None
+        self.flush()
+
+    def _configure(self, widget, options):
+        self._call(widget, "config", widget.configure, options)
+
+    def _place(self, widget, options):
+        self._call(widget, "place", widget.place_configure, options)
+
+    def _call(self, widget, kind, func, options):
+        self.issued += 1
+        profiler = self.profiler
+        start = time.perf_counter() if profiler is not None else 0.0
+        try:
+            func(**options)
+        except Exception:
+            # the widget may have been destroyed while the write was pending
+            if widget.winfo_exists():
+                raise
+        if profiler is not None:
+            profiler.record_call(widget, kind, time.perf_counter() - start)
+
+    def reset_stats(self):
+        self.requested = 0
+        self.issued = 0
@@ -0,0 +1,16 @@
+"""
+Headless benchmarks for the animation engine. Everything runs against
+FakeTk on a virtual clock, so no display and no real-time waits are
+needed. `python -m tkinterpp.benchmarks` prints the results and compares
+them with baselines.json; `--update` rewrites the baselines.
+"""
+from .harness import compare, load_baselines, save_baselines
+from .scenarios import run
+
+
+def check_baselines(counts=None, slowdown=3.0):
+    """Run every scenario and raise AssertionError on a regression."""
+    results = run(counts) if counts else run()
+    problems = compare(results, load_baselines(), slowdown)
+    assert not problems, "\n".join(problems)
+    return results
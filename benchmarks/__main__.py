@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from . import compare, load_baselines, run, save_baselines
+from .scenarios import COUNTS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless tkinterpp animation benchmarks")
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS))
+    parser.add_argument("--only", nargs="+", help="scenario names to run")
+    parser.add_argument("--no-allocations", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    args = parser.parse_args(argv)
+
+    results = run(args.counts, args.only, not args.no_allocations)
+    columns = ("frames", "fps", "tcl_calls_per_frame", "alloc_kib_per_frame", "frame_ms_p50", "frame_ms_p95", "frame_ms_p99")
+    print(f"{'scenario':<20}" + "".join(f"{c:>21}" for c in columns))
+    for scenario, metrics in results.items():
+        print(f"{scenario:<20}" + "".join(f"{metrics.get(c, 0.0):>21.2f}" for c in columns))
+
+    if args.update:
+        baselines = load_baselines()
+        baselines.update(results)
+        save_baselines(baselines)
+        return 0
+    problems = compare(results, load_baselines())
+    for problem in problems:
+        print("REGRESSION", problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Cost of the rounded button and entry backgrounds of every bundled
+theme: rendering them inline on the UI thread, rendering them
+in the process pool (cold cache), and loading them from the disk cache
+with memory-mapped reads (a later launch). PhotoImage creation is left
+out, so no display is needed:
+
+    python -m tkinterpp.benchmarks.assets
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from ..assets import asset_key, read, render, render_to_cache, theme_specs
+from ..ttkpp import load_themes
+
+SIZES = ((96, 32), (160, 36))
+RADIUS = 8
+
+
+def specs():
+    result = []
+    for theme in load_themes().values():
+        for width, height in SIZES:
+            for kind in ("button", "entry"):
+                result.extend(theme_specs(theme, width, height, RADIUS, kind).values())
+    return result
+
+
+def run(workers=None):
+    items = specs()
+    directory = tempfile.mkdtemp(prefix="tkpp-assets-")
+    try:
+        start = time.perf_counter()
+        for spec in items[:20]:
+            render(spec)
+        inline = (time.perf_counter() - start) / 20 * len(items)
+
+        with ProcessPoolExecutor(max_workers=workers or min(2, os.cpu_count() or 1)) as pool:
+            pool.submit(int).result()  # start the workers outside the timing
+            start = time.perf_counter()
+            futures = [pool.submit(render_to_cache, spec, directory) for spec in items]
+            submitted = time.perf_counter() - start
+            wait(futures)
+            cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = sum(read(os.path.join(directory, asset_key(spec) + ".ppm")) is not None for spec in items)
+        warm = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return {"assets": len(items), "loaded": loaded, "inline_s": inline,
+            "submit_s": submitted, "pool_s": cold, "mmap_s": warm}
+
+
+def main():
+    r = run()
+    print(f"{r['assets']} assets ({r['loaded']} loaded back from the cache)")
+    print(f"inline render (est.)    {r['inline_s'] * 1000:>9.1f} ms of UI thread")
+    print(f"process pool, cold      {r['pool_s'] * 1000:>9.1f} ms wall, {r['submit_s'] * 1000:.1f} ms to submit")
+    print(f"mmap load, warm         {r['mmap_s'] * 1000:>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
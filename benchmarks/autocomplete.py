@@ -0,0 +1,105 @@
+"""
+Keystroke-to-suggestion latency of Entry autocomplete over a large symbol
+list. The debounce delay is left out: timing starts when the lookup
+fires and stops when the suggestions reach the Entry's completer, either
+inline or through the worker pool and the UpdateChannel. No display is
+needed, the popup is not drawn:
+
+    python -m tkinterpp.benchmarks.autocomplete
+"""
+import random
+import string
+import sys
+import time
+
+from ..completion import PrefixIndex
+from ..updates import UpdateChannel
+from ..widgets.entry import _Completer
+from .harness import FakeTk, FakeWidget, percentile
+
+SYMBOLS = 500000
+KEYSTROKES = 2000
+LIMIT = 8
+
+
+def symbols(count=SYMBOLS, seed=0):
+    rng = random.Random(seed)
+    suffixes = ("", ".L", ".PA", ".DE", ".TO", ".HK")
+    names = set()
+    while len(names) < count:
+        length = rng.randint(2, 6)
+        names.add("".join(rng.choice(string.ascii_uppercase) for _ in range(length)) + rng.choice(suffixes))
+    return sorted(names)
+
+
+def keystrokes(items, count=KEYSTROKES, seed=1):
+    """Prefixes as typed: a random symbol cut after 1 to 5 characters."""
+    rng = random.Random(seed)
+    return [item[:rng.randint(1, min(5, len(item)))].lower() for item in rng.sample(items, count)]
+
+
+class _FakeEntry:
+    theme = None
+    theme_options = {}
+
+    def __init__(self, root):
+        self.widget = FakeWidget(root)
+        self.text = ""
+
+    def get_text(self):
+        return self.text
+
+
+class _Recorder(_Completer):
+    def show(self, items):
+        self.shown = items
+
+
+def _pipeline(index, prefixes, background):
+    root = FakeTk()
+    channel = UpdateChannel.for_widget(root)
+    completer = _Recorder(_FakeEntry(root))
+    completer.lookup = lambda text: index.complete(text, LIMIT)
+    times = []
+    for prefix in prefixes:
+        completer.generation += 1
+        completer.latency = None
+        completer.keystroke = time.perf_counter()
+        completer._run(completer.lookup, prefix, "suggestions", background)
+        while completer.latency is None:
+            # the Tk loop drains the channel every `interval` ms; sleep(0)
+            # hands the GIL to the worker like an idle Tk loop would
+            time.sleep(0)
+            channel.drain()
+        times.append(completer.latency)
+    channel.close()
+    return times
+
+
+def run(count=SYMBOLS, keystroke_count=KEYSTROKES):
+    items = symbols(count)
+    start = time.perf_counter()
+    index = PrefixIndex(items)
+    build = time.perf_counter() - start
+    prefixes = keystrokes(items, keystroke_count)
+
+    results = {"build_ms": build * 1000}
+    for name, background in (("inline", False), ("worker", True)):
+        times = _pipeline(index, prefixes, background)
+        results[name] = {p: percentile(times, p) * 1e6 for p in (50, 95, 99)}
+    return results
+
+
+def main():
+    results = run()
+    print(f"{SYMBOLS} symbols, index built in {results['build_ms']:.0f} ms")
+    print(f"{'path':<8}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}")
+    for name in ("inline", "worker"):
+        r = results[name]
+        print(f"{name:<8}{r[50]:>10.1f}{r[95]:>10.1f}{r[99]:>10.1f}")
+    print("worker results also wait for the UpdateChannel drain, 16 ms after the first post by default")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+import heapq
+import itertools
+import json
+import os
+import time
+import tracemalloc
+from collections import Counter
+
+from ..animation import AnimationManager
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+
+class VirtualClock:
+    """Deterministic stand-in for time.monotonic, advanced by FakeTk."""
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    """
+    Records the Tcl-facing calls the animation code makes instead of
+    talking to Tk: config, place, after and friends.
+    """
+    def __init__(self, root, **options):
+        self.root = root
+        self.options = {"bg": "#000000", "fg": "#ffffff"}
+        self.options.update(options)
+        self.x = 0
+        self.y = 0
+        self.mapped = True
+
+    def _root(self):
+        return self.root
+
+    def after(self, ms, func, *args):
+        return self.root.after(ms, func, *args)
+
+    def after_idle(self, func, *args):
+        return self.root.after_idle(func, *args)
+
+    def after_cancel(self, id):
+        self.root.after_cancel(id)
+
+    def configure(self, **options):
+        self.root.calls["config"] += 1
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, option):
+        return self.options.get(option, "")
+
+    def winfo_rgb(self, color):
+        self.root.calls["winfo_rgb"] += 1
+        digits = color.lstrip("#")
+        return tuple(int(digits[i:i + 2], 16) * 257 for i in (0, 2, 4))
+
+    def winfo_x(self):
+        return self.x
+
+    def winfo_y(self):
+        return self.y
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_ismapped(self):
+        return self.mapped
+
+    def place(self, x=None, y=None, **kwargs):
+        self.root.calls["place"] += 1
+        self.x = self.x if x is None else x
+        self.y = self.y if y is None else y
+
+    place_configure = place
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def report_callback_exception(self, *exc_info):
+        raise exc_info[1]
+
+
+class FakeCanvas(FakeWidget):
+    """Records create_window/coords calls for compositor scenarios."""
+    def __init__(self, root):
+        super().__init__(root)
+        self.items = {}
+
+    def create_window(self, x, y, window=None, anchor=None):
+        self.root.calls["create_window"] += 1
+        item = len(self.items) + 1
+        self.items[item] = window
+        window.x, window.y = x, y
+        return item
+
+    def coords(self, item, x, y):
+        self.root.calls["coords"] += 1
+        window = self.items[item]
+        window.x, window.y = x, y
+
+    def delete(self, item):
+        self.items.pop(item, None)
+
+
+class FakeTk(FakeWidget):
+    """Root with an after() queue that runs on a VirtualClock."""
+    def __init__(self, clock=None):
+        self.clock = clock or VirtualClock()
+        self.calls = Counter()
+        self._queue = []
+        self._ids = itertools.count()
+        self._cancelled = set()
+        super().__init__(self)
+
+    def after(self, ms, func, *args):
+        self.calls["after"] += 1
+        id = next(self._ids)
+        heapq.heappush(self._queue, (self.clock.now + ms / 1000.0, id, func, args))
+        return id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, id):
+        self._cancelled.add(id)
+
+    def run(self, until, on_call=None):
+        """Run queued callbacks in time order up to `until` seconds of virtual time."""
+        while self._queue and self._queue[0][0] <= until:
+            when, id, func, args = heapq.heappop(self._queue)
+            if id in self._cancelled:
+                self._cancelled.discard(id)
+                continue
+            self.clock.now = max(self.clock.now, when)
+            if on_call is None:
+                func(*args)
+            else:
+                on_call(func, args)
+        self.clock.now = max(self.clock.now, until)
+
+
+def fake_manager(root):
+    manager = AnimationManager(root)
+    manager.clock = root.clock
+    # frame costs are real time but the clock is virtual, so keep the rate
+    # fixed to make frame counts deterministic
+    manager.adaptive = False
+    return manager
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def measure(root, manager, duration):
+    """
+    Run the fake event loop for `duration` virtual seconds and collect
+    per-frame cost. Only manager ticks count as frames.
+    """
+    frame_times = []
+    frame_calls = []
+    tick = manager._tick
+
+    def on_call(func, args):
+        if func != tick:
+            func(*args)
+            return
+        calls = sum(root.calls.values())
+        start = time.perf_counter()
+        func(*args)
+        frame_times.append(time.perf_counter() - start)
+        frame_calls.append(sum(root.calls.values()) - calls)
+
+    root.run(root.clock.now + duration, on_call)
+    frames = len(frame_times)
+    total = sum(frame_times)
+    return {
+        "frames": frames,
+        "fps": frames / total if total else 0.0,
+        "tcl_calls_per_frame": sum(frame_calls) / frames if frames else 0.0,
+        "frame_ms_p50": percentile(frame_times, 50) * 1000,
+        "frame_ms_p95": percentile(frame_times, 95) * 1000,
+        "frame_ms_p99": percentile(frame_times, 99) * 1000,
+    }
+
+
+def measure_allocations(root, manager, duration):
+    """
+    Same run as measure() but under tracemalloc, which is too slow to
+    time frames with. Reports the average peak of memory allocated while
+    a frame runs, in KiB.
+    """
+    peaks = []
+    tick = manager._tick
+
+    def on_call(func, args):
+        if func != tick:
+            func(*args)
+            return
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func(*args)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+    tracemalloc.start()
+    try:
+        root.run(root.clock.now + duration, on_call)
+    finally:
+        tracemalloc.stop()
+    return {"alloc_kib_per_frame": sum(peaks) / len(peaks) / 1024 if peaks else 0.0}
+
+
+def load_baselines(path=BASELINES):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(results, path=BASELINES):
+    rounded = {
+        scenario: {key: round(value, 4) for key, value in metrics.items()}
+        for scenario, metrics in results.items()
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rounded, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+
+# Deterministic counters must not grow at all; wall-clock metrics only fail
+# on large slowdowns so the check stays usable across machines. Tail
+# percentiles over a few dozen frames are mostly GC noise, so only the
+# median is checked, with a small absolute allowance for tiny scenarios.
+EXACT = ("tcl_calls_per_frame",)
+TIMED = ("frame_ms_p50",)
+TIMED_SLACK_MS = 0.25
+
+
+def compare(results, baselines, slowdown=3.0):
+    """List the regressions of `results` against `baselines`."""
+    problems = []
+    for scenario, metrics in results.items():
+        baseline = baselines.get(scenario)
+        if not baseline:
+            continue
+        for key in EXACT:
+            if key in baseline and metrics[key] > baseline[key] + 1e-3:
+                problems.append(f"{scenario}: {key} {metrics[key]:.2f} > baseline {baseline[key]:.2f}")
+        for key in TIMED:
+            if key in baseline and metrics[key] > baseline[key] * slowdown + TIMED_SLACK_MS:
+                problems.append(f"{scenario}: {key} {metrics[key]:.3f} ms > {slowdown}x baseline {baseline[key]:.3f} ms")
+    return problems
@@ -0,0 +1,349 @@
+"""
+Input latency under animation load. A scripted or recorded stream of
+clicks and keystrokes is injected into a Button, an Entry and a Switch
+with event_generate while N background animations run, and every event
+is timed at three points:
+
+    event     its scheduled time; an event that waits for a busy Tk loop
+              is charged for the wait, as real input would be
+    callback  the widget's class bindings have run (the Button/Switch
+              command fired, the Entry inserted the character)
+    idle      an after_idle queued by the callback ran, i.e. the repaint
+              the event caused is done
+
+Needs a display; without one a private Xvfb is started if it is on PATH:
+
+    python -m tkinterpp.benchmarks.input_latency --rate 60 --animations 0 200 1000
+    python -m tkinterpp.benchmarks.input_latency --record session.jsonl
+    python -m tkinterpp.benchmarks.input_latency --stream session.jsonl
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import tkinter
+import _tkinter
+from collections import deque
+
+from ..animation import AnimationManager
+from ..timeline import Keyframes
+from ..widgets import Button, Entry, Label, Switch
+from .harness import percentile
+
+TARGETS = ("button", "entry", "switch")
+STAGES = ("event_to_callback", "callback_to_idle", "event_to_idle")
+# histogram bucket upper bounds in ms; the last bucket is open
+BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+# bindtag appended after the class bindings, so it fires once they are done
+_TAG = "tkpp-latency"
+
+
+@contextlib.contextmanager
+def display(width=1280, height=1024):
+    """Use $DISPLAY, or start a private Xvfb for the duration."""
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("no $DISPLAY and Xvfb is not on PATH")
+    number = next(n for n in range(99, 200) if not os.path.exists(f"/tmp/.X{n}-lock"))
+    server = subprocess.Popen([xvfb, f":{number}", "-screen", "0", f"{width}x{height}x24", "-nolisten", "tcp"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("Xvfb did not start")
+            time.sleep(0.05)
+        os.environ["DISPLAY"] = f":{number}"
+        yield os.environ["DISPLAY"]
+    finally:
+        os.environ.pop("DISPLAY", None)
+        server.terminate()
+        server.wait()
+
+
+# --- event streams: lists of (ms from start, target, action, arg) ---
+
+def scripted(rate=60, duration=10, targets=TARGETS, seed=0):
+    """`rate` events per second spread over `targets`; entry keys type and erase a word."""
+    rng = random.Random(seed)
+    word = "latency"
+    typed = 0
+    events = []
+    for i in range(int(rate * duration)):
+        target = rng.choice(targets)
+        if target == "entry":
+            keysym = word[typed % len(word)] if typed < len(word) else "BackSpace"
+            typed = (typed + 1) % (2 * len(word))
+            events.append((i * 1000.0 / rate, target, "key", keysym))
+        else:
+            events.append((i * 1000.0 / rate, target, "click", None))
+    return events
+
+
+def save_stream(events, path):
+    with open(path, "w") as f:
+        for t, target, action, arg in events:
+            f.write(json.dumps({"t": round(t, 3), "target": target, "action": action, "arg": arg}) + "\n")
+
+
+def load_stream(path):
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [(r["t"], r["target"], r["action"], r.get("arg")) for r in records]
+
+
+class Bench:
+    """The three widgets under test plus the background load."""
+    def __init__(self, root, animations=0):
+        self.root = root
+        frame = tkinter.Frame(root)
+        frame.pack(side="left", anchor="n")
+        self.widgets = {
+            "button": Button(frame, text="Button"),
+            "entry": Entry(frame),
+            "switch": Switch(frame),
+        }
+        for wrapper in self.widgets.values():
+            wrapper.pack(padx=8, pady=8)
+        self.labels = []
+        self.load = []
+        if animations:
+            area = tkinter.Frame(root)
+            area.pack(side="left", fill="both", expand=True)
+            columns = 40
+            for i in range(animations):
+                label = Label(area, text=" ")
+                label.grid(row=i // columns, column=i % columns)
+                self.labels.append(label)
+
+    def start_load(self):
+        """One endless color animation per label, sharing one compiled timeline."""
+        manager = AnimationManager.for_widget(self.root)
+        cycle = Keyframes("bg", {0: "#202020", 0.5: "#00aaff", 1: "#202020"}, duration=1000).repeat()
+        for label in self.labels:
+            self.load.append(manager.play(cycle, label))
+
+    def stop_load(self):
+        for animation in self.load:
+            animation.stop()
+        self.load = []
+
+
+class Driver:
+    """Injects an event stream on schedule and records per-event timings."""
+    def __init__(self, bench):
+        self.bench = bench
+        self.root = bench.root
+        self.pending = {target: deque() for target in TARGETS}
+        self.samples = {target: {stage: [] for stage in STAGES} for target in TARGETS}
+        self.lag = []
+        self.invoked = dict.fromkeys(TARGETS, 0)
+        self.events = []
+        self.index = 0
+        self.start = None
+        self.done = False
+        for target, wrapper in bench.widgets.items():
+            widget = wrapper.widget
+            widget.bindtags(widget.bindtags() + (_TAG + target,))
+            sequence = "<KeyPress>" if target == "entry" else "<ButtonRelease-1>"
+            widget.bind_class(_TAG + target, sequence, lambda event, target=target: self._handled(target))
+            if target != "entry":
+                wrapper.add_command_listener(lambda target=target: self._count(target))
+
+    def _count(self, target):
+        self.invoked[target] += 1
+
+    def run(self, events):
+        """Inject `events` and return when they are all handled (or dropped)."""
+        self.events = sorted(events, key=lambda event: event[0])
+        self.index = 0
+        self.done = False
+        self.bench.widgets["entry"].widget.focus_force()
+        self.root.update()
+        self.start = time.perf_counter()
+        self._next()
+        while not self.done:
+            self.root.dooneevent(0)
+        # let the tail of the stream reach its callbacks and idle handlers
+        deadline = time.perf_counter() + 2
+        while any(self.pending.values()) and time.perf_counter() < deadline:
+            if not self.root.dooneevent(_tkinter.DONT_WAIT):
+                time.sleep(0.001)
+        self.root.update()
+
+    def _next(self):
+        # inject everything that is due, then sleep in after() until the next event
+        while self.index < len(self.events):
+            t, target, action, arg = self.events[self.index]
+            scheduled = self.start + t / 1000.0
+            delay = scheduled - time.perf_counter()
+            if delay > 0.0005:
+                self.root.after(max(1, int(delay * 1000)), self._next)
+                return
+            self.index += 1
+            self._inject(scheduled, target, action, arg)
+        self.done = True
+
+    def _inject(self, scheduled, target, action, arg):
+        now = time.perf_counter()
+        self.lag.append(now - scheduled)
+        widget = self.bench.widgets[target].widget
+        self.pending[target].append(scheduled)
+        if action == "key":
+            widget.event_generate("<KeyPress>", keysym=arg, when="tail")
+            widget.event_generate("<KeyRelease>", keysym=arg, when="tail")
+        else:
+            x, y = widget.winfo_width() // 2, widget.winfo_height() // 2
+            widget.event_generate("<Enter>", x=x, y=y, when="tail")
+            widget.event_generate("<ButtonPress-1>", x=x, y=y, when="tail")
+            widget.event_generate("<ButtonRelease-1>", x=x, y=y, when="tail")
+
+    def _handled(self, target):
+        now = time.perf_counter()
+        pending = self.pending[target]
+        if not pending:
+            return
+        scheduled = pending.popleft()
+        samples = self.samples[target]
+        samples["event_to_callback"].append(now - scheduled)
+
+        def idle():
+            done = time.perf_counter()
+            samples["callback_to_idle"].append(done - now)
+            samples["event_to_idle"].append(done - scheduled)
+        self.root.after_idle(idle)
+
+    def summary(self):
+        result = {"dispatch_lag_ms_p99": percentile(self.lag, 99) * 1000}
+        for target in TARGETS:
+            samples = self.samples[target]
+            if not samples["event_to_callback"]:
+                continue
+            entry = result[target] = {"events": len(samples["event_to_callback"]), "lost": len(self.pending[target])}
+            if target != "entry":
+                entry["invoked"] = self.invoked[target]
+            for stage in STAGES:
+                values = samples[stage]
+                entry[stage] = {f"p{p}": percentile(values, p) * 1000 for p in (50, 95, 99)}
+                entry[stage]["max"] = max(values, default=0.0) * 1000
+                entry[stage]["histogram"] = histogram(values)
+        return result
+
+
+def histogram(seconds):
+    """Counts per BUCKETS bound (in ms), plus the overflow count last."""
+    counts = [0] * (len(BUCKETS) + 1)
+    for value in seconds:
+        ms = value * 1000
+        i = 0
+        while i < len(BUCKETS) and ms > BUCKETS[i]:
+            i += 1
+        counts[i] += 1
+    return counts
+
+
+def run(events, animations=(0,)):
+    """Replay `events` once per background animation count; results by count."""
+    results = {}
+    with display():
+        for n in animations:
+            root = tkinter.Tk()
+            root.geometry("1200x800")
+            try:
+                bench = Bench(root, n)
+                driver = Driver(bench)
+                root.update()
+                bench.start_load()
+                driver.run(events)
+                bench.stop_load()
+                result = driver.summary()
+                result["fps"] = AnimationManager.for_widget(root).fps
+                results[n] = result
+            finally:
+                root.destroy()
+    return results
+
+
+def record(path):
+    """Open the bench window and write the user's clicks and keystrokes to `path`."""
+    events = []
+    with display():
+        root = tkinter.Tk()
+        bench = Bench(root)
+        start = time.perf_counter()
+
+        def log(target, action, arg=None):
+            events.append(((time.perf_counter() - start) * 1000, target, action, arg))
+        for target, wrapper in bench.widgets.items():
+            if target == "entry":
+                wrapper.widget.bind("<KeyPress>", lambda event: log("entry", "key", event.keysym), add="+")
+            else:
+                wrapper.add_command_listener(lambda target=target: log(target, "click"))
+        root.mainloop()
+    save_stream(events, path)
+    return events
+
+
+def _print(results):
+    bounds = [f"<={b:g}" for b in BUCKETS] + [f">{BUCKETS[-1]:g}"]
+    for n, result in results.items():
+        print(f"\n{n} background animations, {result['fps']:.0f} fps, "
+              f"dispatch lag p99 {result['dispatch_lag_ms_p99']:.2f} ms")
+        print(f"{'target':<8}{'stage':<20}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}  events")
+        for target in TARGETS:
+            entry = result.get(target)
+            if entry is None:
+                continue
+            for stage in STAGES:
+                s = entry[stage]
+                print(f"{target:<8}{stage:<20}{s['p50']:>9.2f}{s['p95']:>9.2f}{s['p99']:>9.2f}{s['max']:>9.2f}"
+                      f"  {entry['events']} ({entry['lost']} lost)")
+            counts = entry["event_to_idle"]["histogram"]
+            peak = max(counts) or 1
+            for bound, count in zip(bounds, counts):
+                if count:
+                    print(f"{'':<8}{bound:>8} ms {'#' * max(1, count * 40 // peak)} {count}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Event-to-repaint latency of tkinterpp widgets under animation load")
+    parser.add_argument("--rate", type=float, default=60, help="scripted events per second")
+    parser.add_argument("--duration", type=float, default=10, help="scripted stream length in seconds")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--animations", type=int, nargs="+", default=[0, 200, 1000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stream", help="replay a recorded JSON-lines event stream")
+    parser.add_argument("--save-stream", help="write the scripted stream to a file and exit")
+    parser.add_argument("--record", help="record clicks and keystrokes to a file")
+    parser.add_argument("--json", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.record:
+            print(f"recorded {len(record(args.record))} events")
+            return 0
+        events = load_stream(args.stream) if args.stream else scripted(args.rate, args.duration, args.targets, args.seed)
+        if args.save_stream:
+            save_stream(events, args.save_stream)
+            return 0
+        results = run(events, args.animations)
+    except (RuntimeError, tkinter.TclError) as e:
+        print(f"input latency benchmark needs a display: {e}")
+        return 2
+    _print(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
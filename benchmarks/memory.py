@@ -0,0 +1,87 @@
+"""
+Per-wrapper memory and construction time for large forms. The tkinter
+classes the wrappers instantiate are swapped for a minimal stand-in, so
+the numbers cover the wrapper layer only and need no display:
+
+    python -m tkinterpp.benchmarks.memory
+"""
+import sys
+import time
+import tkinter
+import tracemalloc
+from contextlib import contextmanager
+
+from ..widgets.button import Button
+from ..widgets.entry import Entry
+from ..widgets.label import Label
+from ..widgets.switch import Switch
+
+COUNT = 10000
+WRAPPERS = {
+    "Button": (Button, "Button"),
+    "Entry": (Entry, "Entry"),
+    "Label": (Label, "Label"),
+    "Switch": (Switch, "Checkbutton"),
+}
+
+
+class _TkStandIn:
+    __slots__ = ("master",)
+
+    def __init__(self, master=None, *args, **kwargs):
+        self.master = master
+
+
+@contextmanager
+def _stand_ins():
+    saved = {name: getattr(tkinter, name) for name in ("Button", "Entry", "Label", "Checkbutton", "BooleanVar")}
+    for name in saved:
+        setattr(tkinter, name, _TkStandIn)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(tkinter, name, value)
+
+
+def _measure(factory, count):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        objects = [factory() for _ in range(count)]
+        elapsed = time.perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del objects
+    return size, elapsed
+
+
+def run(count=COUNT):
+    results = {}
+    with _stand_ins():
+        # the stand-in and list overhead, subtracted from every wrapper
+        base_size, base_time = _measure(_TkStandIn, count)
+        for name, (cls, _) in WRAPPERS.items():
+            size, elapsed = _measure(cls, count)
+            # Switch also creates a BooleanVar, i.e. a second stand-in
+            extra = base_size if name == "Switch" else 0
+            results[name] = {
+                "bytes_per_widget": (size - base_size - extra) / count,
+                "construct_us_per_widget": max(elapsed - base_time, 0.0) * 1e6 / count,
+            }
+    return results
+
+
+def main():
+    results = run()
+    print(f"{COUNT} wrappers each (tkinter widgets replaced by a stand-in)")
+    print(f"{'wrapper':<10}{'bytes/widget':>14}{'us/widget':>12}")
+    for name, metrics in results.items():
+        print(f"{name:<10}{metrics['bytes_per_widget']:>14.1f}{metrics['construct_us_per_widget']:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Real-Tk comparison of moving widgets with place() against hosting them on
+a compositing Canvas. Unlike the other scenarios this needs a display
+(Xvfb is enough):
+
+    python -m tkinterpp.benchmarks.relayout
+"""
+import sys
+import time
+import tkinter
+
+from ..animation import AnimationManager
+from .harness import percentile
+
+COUNTS = (10, 50, 200, 1000)
+FRAMES = 60
+
+
+def _frame_times(root, batch, widgets, frames):
+    times = []
+    for step in range(frames):
+        start = time.perf_counter()
+        for i, widget in enumerate(widgets):
+            batch.place(widget, x=(step * 3) % 400, y=(i * 7) % 560)
+        batch.flush()
+        # geometry management and redisplay both run as idle handlers
+        root.update_idletasks()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run(counts=COUNTS, frames=FRAMES):
+    root = tkinter.Tk()
+    root.geometry("820x620")
+    manager = AnimationManager.for_widget(root)
+    results = {}
+    try:
+        for mode in ("place", "canvas"):
+            for n in counts:
+                container = tkinter.Frame(root, width=800, height=600)
+                container.pack()
+                if mode == "canvas":
+                    parent = tkinter.Canvas(container, width=800, height=600, highlightthickness=0)
+                    parent.place(x=0, y=0)
+                    compositor = manager.enable_compositing(parent)
+                else:
+                    parent = container
+                    manager.batch.compositor = None
+                widgets = [tkinter.Label(parent, text=str(i)) for i in range(n)]
+                for i, widget in enumerate(widgets):
+                    if mode == "canvas":
+                        compositor.add(widget, 0, (i * 7) % 560)
+                    else:
+                        widget.place(x=0, y=(i * 7) % 560)
+                root.update()
+
+                times = _frame_times(root, manager.batch, widgets, frames)
+                results[f"{mode}_{n}"] = {
+                    "frame_ms_p50": percentile(times, 50) * 1000,
+                    "frame_ms_p95": percentile(times, 95) * 1000,
+                }
+                manager.batch.compositor = None
+                container.destroy()
+    finally:
+        root.destroy()
+    return results
+
+
+def main():
+    try:
+        results = run()
+    except tkinter.TclError as e:
+        print(f"relayout benchmark needs a display: {e}")
+        return 2
+    print(f"{'widgets':>8}{'place p50':>12}{'canvas p50':>12}{'place p95':>12}{'canvas p95':>12}")
+    for n in COUNTS:
+        place, canvas = results[f"place_{n}"], results[f"canvas_{n}"]
+        print(f"{n:>8}{place['frame_ms_p50']:>12.3f}{canvas['frame_ms_p50']:>12.3f}"
+              f"{place['frame_ms_p95']:>12.3f}{canvas['frame_ms_p95']:>12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+from ..animation import Animation
+from ..binding import Model
+from ..timeline import Keyframes, Parallel
+from ..widget import Widget
+from ..widgets.label import Label
+from .harness import FakeCanvas, FakeTk, FakeWidget, fake_manager, measure, measure_allocations
+
+COUNTS = (1, 100, 10000)
+DURATION = 500  # ms of virtual time per scenario
+
+
+def _fake_label(root):
+    label = Label.__new__(Label)
+    Widget.__init__(label, root)
+    label.widget = FakeWidget(root)
+    return label
+
+
+def color(n):
+    root = FakeTk()
+    manager = fake_manager(root)
+    for _ in range(n):
+        Animation.animate_color(FakeWidget(root), "#000000", "#ffffff", DURATION)
+    return root, manager
+
+
+def move(n):
+    root = FakeTk()
+    manager = fake_manager(root)
+    for i in range(n):
+        Animation.animate_move(FakeWidget(root), (0, i), (400, i), DURATION)
+    return root, manager
+
+
+def move_canvas(n):
+    """move() with the widgets hosted on a compositing canvas."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    compositor = manager.enable_compositing(FakeCanvas(root))
+    for i in range(n):
+        widget = FakeWidget(root)
+        compositor.add(widget, 0, i)
+        Animation.animate_move(widget, (0, i), (400, i), DURATION)
+    return root, manager
+
+
+def label_bg_fg(n):
+    """Two concurrent color animations per label, as in hover effects."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    for _ in range(n):
+        label = _fake_label(root)
+        label.animate_bg("#ff0000", DURATION)
+        label.animate_fg("#00ff00", DURATION)
+    return root, manager
+
+
+def hover_storm(n):
+    """Five quick hover in/out bg animations per label; only the last one runs."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    for _ in range(n):
+        label = _fake_label(root)
+        for color in ("#ff0000", "#0000ff", "#ff0000", "#0000ff", "#ff0000"):
+            label.animate_bg(color, DURATION)
+    return root, manager
+
+
+def group_color(n):
+    """The same work as color(), as one animate_group call."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    widgets = [FakeWidget(root) for _ in range(n)]
+    manager.animate_group(widgets, "#000000", "#ffffff", duration=DURATION)
+    return root, manager
+
+
+def model_refresh(n):
+    """A dashboard pushing every field each frame, of which one in ten changed."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    model = Model()
+    names = [f"field{i}" for i in range(n)]
+    for name in names:
+        model.bind(_fake_label(root), "text", name)
+
+    def refresh(progress):
+        tick = int(progress * 1000)
+        for i, name in enumerate(names):
+            model.set(name, tick if i % 10 == 0 else 0)
+        model.flush()
+
+    Animation(root, DURATION / 1000.0, refresh).start()
+    return root, manager
+
+
+def timeline(n):
+    """One compiled color + move timeline shared by every widget, staggered."""
+    root = FakeTk()
+    manager = fake_manager(root)
+    shared = Parallel(
+        Keyframes("bg", {0: "#000000", 0.5: "#ff0000", 1: "#ffffff"}, duration=DURATION / 2, easing="ease_out"),
+        Keyframes("position", {0: (0, 0), 1: (400, 0)}, duration=DURATION / 2),
+    )
+    manager.play(shared, [FakeWidget(root) for _ in range(n)], stagger=DURATION / 2 / max(1, n))
+    return root, manager
+
+
+SCENARIOS = {
+    "color": color,
+    "move": move,
+    "move_canvas": move_canvas,
+    "label_bg_fg": label_bg_fg,
+    "hover_storm": hover_storm,
+    "group_color": group_color,
+    "model_refresh": model_refresh,
+    "timeline": timeline,
+}
+
+
+def _build(scenario, n):
+    root, manager = scenario(n)
+    # let the idle flush of the first frame run before measuring
+    root.run(root.clock.now)
+    return root, manager
+
+
+def run(counts=COUNTS, names=None, allocations=True):
+    results = {}
+    duration = DURATION / 1000.0 + 0.05
+    for name, scenario in SCENARIOS.items():
+        if names and name not in names:
+            continue
+        for n in counts:
+            metrics = measure(*_build(scenario, n), duration)
+            if allocations:
+                metrics.update(measure_allocations(*_build(scenario, n), duration))
+            results[f"{name}_{n}"] = metrics
+    return results
@@ -0,0 +1,143 @@
+import sys
+
+from .animation import AnimationManager
+
+_UNSET = object()
+
+
+class Binding:
+    __slots__ = ("wrapper", "prop", "fields", "transform", "last")
+
+    def __init__(self, wrapper, prop, fields, transform):
+        self.wrapper = wrapper
+        self.prop = prop
+        self.fields = fields
+        self.transform = transform
+        self.last = _UNSET
+
+    def value(self, values):
+        args = [values[field] for field in self.fields]
+        if self.transform is None:
+            return args[0]
+        return self.transform(*args)
+
+
+class Model:
+    """
+    Observable fields that widget properties bind to:
+
+        model = Model(price=0.0, limit=100.0)
+        model.bind(label, "text", "price", "{:.2f}".format)
+        model.bind(label, "fg", ("price", "limit"), lambda p, l: "red" if p > l else "black")
+        model.price = 101.5
+
+    Setting a field marks the bindings that read it; they are recomputed
+    once, on idle, and a value equal to the last one applied is skipped.
+    Config options go through the write batch, so a widget bound to
+    several fields still gets one configure call per flush. Writes made
+    to a bound property outside the model are not seen by the cache.
+    """
+    def __init__(self, **fields):
+        object.__setattr__(self, "_values", dict(fields))
+        object.__setattr__(self, "_bindings", {})
+        object.__setattr__(self, "_dirty", {})
+        object.__setattr__(self, "_root", None)
+        object.__setattr__(self, "_idle_id", None)
+        object.__setattr__(self, "applied", 0)
+        object.__setattr__(self, "skipped", 0)
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        if name in ("applied", "skipped"):
+            object.__setattr__(self, name, value)
+        else:
+            self.set(name, value)
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+    def set(self, name, value):
+        values = self._values
+        if name in values and values[name] == value:
+            return
+        values[name] = value
+        for binding in self._bindings.get(name, ()):
+            self._dirty[binding] = None
+        if self._dirty:
+            self._schedule()
+
+    def update(self, **fields):
+        for name, value in fields.items():
+            self.set(name, value)
+
+    def bind(self, wrapper, prop, fields, transform=None):
+        """
+        Keep `wrapper`'s `prop` equal to transform(*fields) (or the single
+        field's value). The current value is applied right away.
+        """
+        if isinstance(fields, str):
+            fields = (fields,)
+        for field in fields:
+            self._values.setdefault(field, None)
+        binding = Binding(wrapper, prop, tuple(fields), transform)
+        for field in binding.fields:
+            self._bindings.setdefault(field, []).append(binding)
+        if self._root is None:
+            object.__setattr__(self, "_root", getattr(wrapper, "widget", wrapper)._root())
+        self._dirty[binding] = None
+        self.flush()
+        return binding
+
+    def unbind(self, wrapper, prop=None):
+        for field, bindings in self._bindings.items():
+            bindings[:] = [b for b in bindings
+                           if not (b.wrapper is wrapper and (prop is None or b.prop == prop))]
+        for binding in list(self._dirty):
+            if binding.wrapper is wrapper and (prop is None or binding.prop == prop):
+                del self._dirty[binding]
+
+    def _schedule(self):
+        if self._idle_id is None and self._root is not None:
+            object.__setattr__(self, "_idle_id", self._root.after_idle(self._flush_idle))
+
+    def _flush_idle(self):
+        object.__setattr__(self, "_idle_id", None)
+        self.flush()
+
+    def flush(self):
+        """Apply pending bindings now. Returns the number of writes issued."""
+        if self._idle_id is not None:
+            self._root.after_cancel(self._idle_id)
+            object.__setattr__(self, "_idle_id", None)
+        dirty = list(self._dirty)
+        self._dirty.clear()
+
+        applied = 0
+        batches = set()
+        for binding in dirty:
+            try:
+                value = binding.value(self._values)
+                if value == binding.last:
+                    self.skipped += 1
+                    continue
+                binding.last = value
+                wrapper = binding.wrapper
+                option = getattr(wrapper, "bind_options", {}).get(binding.prop)
+                if option is not None:
+                    batch = AnimationManager.for_widget(wrapper.widget).batch
+                    batch.write(wrapper.widget, **{option: value})
+                    batches.add(batch)
+                else:
+                    getattr(wrapper, "set_" + binding.prop)(value)
+                applied += 1
+            except Exception:
+                self._root.report_callback_exception(*sys.exc_info())
+        for batch in batches:
+            batch.flush()
+        self.applied += applied
+        return applied
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+from .easing import ease
+
+# normalized color string -> (r, g, b), 8 bits per channel
+_rgb_cache = OrderedDict()
+_rgb_cache_size = 1024
+_stats = {"hits": 0, "misses": 0}
+
+
+def _parse_hex(color):
+    digits = color[1:]
+    if len(digits) not in (3, 6, 9, 12):
+        raise ValueError(f"invalid color: {color!r}")
+    n = len(digits) // 3
+    channels = [int(digits[i * n:(i + 1) * n], 16) for i in range(3)]
+    if n == 1:
+        return tuple(c * 17 for c in channels)
+    return tuple(c >> (4 * n - 8) for c in channels)
+
+
+def to_rgb(color, widget=None):
+    """
+    Resolve a hex string or Tk color name to an (r, g, b) tuple.
+    Color names need `widget` for the one Tk lookup; results are cached.
+    """
+    key = color.strip().lower()
+    rgb = _rgb_cache.get(key)
+    if rgb is not None:
+        _stats["hits"] += 1
+        _rgb_cache.move_to_end(key)
+        return rgb
+
+    _stats["misses"] += 1
+    if key.startswith("#"):
+        rgb = _parse_hex(key)
+    elif widget is not None:
+        r, g, b = widget.winfo_rgb(color)
+        rgb = (r // 256, g // 256, b // 256)
+    else:
+        raise ValueError(f"cannot resolve color name {color!r} without a widget")
+
+    _rgb_cache[key] = rgb
+    if len(_rgb_cache) > _rgb_cache_size:
+        _rgb_cache.popitem(last=False)
+    return rgb
+
+
+def to_hex(rgb):
+    return '#%02x%02x%02x' % (int(rgb[0]), int(rgb[1]), int(rgb[2]))
+
+
+@lru_cache(maxsize=256)
+def gradient(from_rgb, to_rgb, steps, easing="linear"):
+    """Hex strings for `steps` + 1 evenly spaced points from from_rgb to to_rgb."""
+    frames = []
+    for i in range(steps + 1):
+        t = ease(easing, i / steps)
+        frames.append(to_hex([a + (b - a) * t for a, b in zip(from_rgb, to_rgb)]))
+    return tuple(frames)
+
+
+def coverage(distance):
+    """Anti-aliased pixel coverage from a signed distance to a shape's edge (negative inside)."""
+    return min(1.0, max(0.0, 0.5 - distance))
+
+
+def cache_stats():
+    info = gradient.cache_info()
+    return {
+        "rgb_hits": _stats["hits"],
+        "rgb_misses": _stats["misses"],
+        "rgb_size": len(_rgb_cache),
+        "gradient_hits": info.hits,
+        "gradient_misses": info.misses,
+        "gradient_size": info.currsize,
+    }
+
+
+def clear_cache():
+    _rgb_cache.clear()
+    _stats["hits"] = _stats["misses"] = 0
+    gradient.cache_clear()
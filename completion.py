@@ -0,0 +1,43 @@
+from bisect import bisect_left
+
+_executor = None
+
+
+def executor():
+    """Worker pool shared by background lookups and validators."""
+    global _executor
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tkinterpp")
+    return _executor
+
+
+class PrefixIndex:
+    """
+    Prefix lookup over a fixed set of strings: the keys are sorted once,
+    and a query is one bisect plus a scan of at most `limit` entries, so
+    it stays in the microseconds for hundreds of thousands of items.
+    Matching is case-insensitive unless another `key` is given.
+    """
+    def __init__(self, items, key=str.casefold):
+        items = list(items)
+        keys = [key(item) for item in items]
+        order = sorted(range(len(items)), key=keys.__getitem__)
+        self.key = key
+        self.keys = [keys[i] for i in order]
+        self.items = [items[i] for i in order]
+
+    def __len__(self):
+        return len(self.items)
+
+    def complete(self, prefix, limit=10):
+        """Up to `limit` items starting with `prefix`, in key order."""
+        prefix = self.key(prefix)
+        keys = self.keys
+        start = bisect_left(keys, prefix)
+        end = min(start + limit, len(keys))
+        for i in range(start, end):
+            if not keys[i].startswith(prefix):
+                end = i
+                break
+        return self.items[start:end]
@@ -0,0 +1,57 @@
+class Compositor:
+    """
+    Opt-in motion mode: widgets are hosted as window items on a Canvas and
+    moved with canvas.coords instead of place(), so a moving widget does
+    not send its parent through the geometry manager every frame. Moves
+    are buffered and applied once per frame by the WriteBatch.
+
+    Widgets must be children of the canvas (or of the canvas's parent).
+    """
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = {}
+        self.positions = {}
+        self.pending = {}
+
+    def add(self, widget, x=0, y=0, anchor="nw"):
+        widget = getattr(widget, "widget", widget)
+        item = self.canvas.create_window(x, y, window=widget, anchor=anchor)
+        self.items[widget] = item
+        self.positions[widget] = (x, y)
+        return item
+
+    def remove(self, widget):
+        widget = getattr(widget, "widget", widget)
+        item = self.items.pop(widget, None)
+        self.positions.pop(widget, None)
+        self.pending.pop(widget, None)
+        if item is not None:
+            self.canvas.delete(item)
+
+    def hosts(self, widget):
+        return widget in self.items
+
+    def position(self, widget):
+        widget = getattr(widget, "widget", widget)
+        return self.pending.get(widget) or self.positions[widget]
+
+    def move(self, widget, x=None, y=None, **ignored):
+        """Buffer a move; the last one per widget before flush() wins."""
+        old_x, old_y = self.position(widget)
+        self.pending[widget] = (old_x if x is None else x, old_y if y is None else y)
+
+    def flush(self, profiler=None):
+        """Apply buffered moves; returns the number of canvas calls made."""
+        pending, self.pending = self.pending, {}
+        calls = 0
+        coords = self.canvas.coords
+        for widget, xy in pending.items():
+            if self.positions.get(widget) == xy:
+                continue
+            if profiler is None:
+                coords(self.items[widget], *xy)
+            else:
+                profiler.timed(widget, "coords", coords, self.items[widget], *xy)
+            self.positions[widget] = xy
+            calls += 1
+        return calls
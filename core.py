@@ -1,23 +1,121 @@
+import time
+
+_import_started = time.perf_counter()
+
 import tkinter
 
-from .ttkpp import ttkpp
-from .widget import Widget
-from .animation import Animation, AnimationManager
+from .startup import StartupTimeline, DISABLED
+
+IMPORT_SECONDS = time.perf_counter() - _import_started
 
 class Tkpp:
-    def __init__(self, master=None, css="default.css"):
-        self.tkinterpp = tkinter.Tk() if master is None else master
-        self.tkinterpp.withdraw()
-        self.tkinterpp.title("tkinter++")
+    """
+    The theme, animation, widget and stylesheet subsystems are created on
+    first access (the theme at the latest right before the window is shown),
+    so nothing beyond the Tk root is built up front. Pass
+    profile_startup=True to get a timeline of that work in `self.startup`.
+    """
+    def __init__(self, master=None, css="default.css", profile_startup=False):
+        self.startup = StartupTimeline() if profile_startup else None
+        self._timeline = self.startup or DISABLED
+        self._timeline.record("import", IMPORT_SECONDS)
+
+        with self._timeline.measure("tk"):
+            self.tkinterpp = tkinter.Tk() if master is None else master
+            self.tkinterpp.withdraw()
+            self.tkinterpp.title("tkinter++")
+
+        self.css = css
+        self._theme = None
+        self._widget = None
+        self._animation = None
+        self._stylesheet = None
+        self._updates = None
+        self._screen = None
+
+    @property
+    def width(self):
+        return self._screen_size()[0]
+
+    @property
+    def height(self):
+        return self._screen_size()[1]
+
+    def _screen_size(self):
+        if self._screen is None:
+            self._screen = (self.tkinterpp.winfo_screenwidth(), self.tkinterpp.winfo_screenheight())
+        return self._screen
 
-        self.width = self.tkinterpp.winfo_screenwidth()
-        self.height = self.tkinterpp.winfo_screenheight()
+    @property
+    def theme(self):
+        if self._theme is None:
+            with self._timeline.measure("theme"):
+                from .ttkpp import ttkpp
+                self._theme = ttkpp(root=self.tkinterpp)
+        return self._theme
 
-        self.theme = ttkpp(root=self.tkinterpp)
+    @property
+    def widget(self):
+        if self._widget is None:
+            with self._timeline.measure("widget"):
+                from .widget import Widget
+                self._widget = Widget(master=self.tkinterpp)
+        return self._widget
 
-        self.widget = Widget(master=self.tkinterpp)
-        # Use AnimationManager which accepts (root, theme)
-        self.animation = AnimationManager(self.tkinterpp, self.theme)
+    @property
+    def animation(self):
+        if self._animation is None:
+            with self._timeline.measure("animation"):
+                from .animation import AnimationManager
+                # reuse the manager widget animations may already have started
+                self._animation = AnimationManager.for_widget(self.tkinterpp)
+                self._animation.theme = self.theme
+        return self._animation
+
+    @property
+    def stylesheet(self):
+        if self._stylesheet is None:
+            with self._timeline.measure("stylesheet"):
+                from .stylesheet import Stylesheet
+                self._stylesheet = Stylesheet.find(self.css)
+        return self._stylesheet
+
+    @property
+    def updates(self):
+        """
+        Thread-safe update channel: workers call app.updates.post(widget,
+        "text", value) and the main loop applies the latest values per frame.
+        Touch it on the main thread before starting the workers.
+        """
+        if self._updates is None:
+            from .updates import UpdateChannel
+            self._updates = UpdateChannel.for_widget(self.tkinterpp)
+        return self._updates
+
+    def enable_tracing(self, capacity=100000, dump_signal=False):
+        """
+        Keep a ring buffer of frame, animation, write and command spans.
+        Dump it with app.tracer.dump(), which writes trace-event JSON that
+        Perfetto and chrome://tracing open. dump_signal=True also dumps
+        on `kill -USR1 <pid>` (or pass another signal number). That replaces
+        the app's own handler for the signal until animation.disable_tracing(),
+        and the dump happens when Tk next processes an event.
+        """
+        tracer = self.animation.enable_tracing(capacity)
+        if dump_signal:
+            if dump_signal is True:
+                tracer.dump_on_signal()
+            else:
+                tracer.dump_on_signal(dump_signal)
+        return tracer
+
+    @property
+    def tracer(self):
+        return self._animation.tracer if self._animation is not None else None
+
+    def style(self, widget, classes=(), id=None):
+        """Apply the stylesheet to a Button/Entry/Label/Switch and track its states."""
+        self.stylesheet.attach(widget, classes, id, theme=self.theme)
 
     def geometry(self, width, height):
         self.tkinterpp.geometry(f"{width}x{height}")
@@ -26,5 +124,20 @@ class Tkpp:
         self.tkinterpp.title(title)
 
     def mainloop(self):
+        self.theme  # the theme has to be applied before the window is shown
+        if self.startup is not None:
+            self.tkinterpp.after_idle(self.startup.mark, "first_frame")
         self.tkinterpp.deiconify()
         self.tkinterpp.mainloop()
+
+    async def run_async(self):
+        """
+        Like mainloop(), but awaitable: Tk and the running asyncio loop share
+        the thread, and this returns once the window is destroyed.
+        """
+        from .aio import run
+        self.theme
+        if self.startup is not None:
+            self.tkinterpp.after_idle(self.startup.mark, "first_frame")
+        self.tkinterpp.deiconify()
+        await run(self.tkinterpp)
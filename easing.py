@@ -0,0 +1,8 @@
+def ease(name, t):
+    if name == "ease_in_out":
+        return t * t * (3 - 2 * t)
+    elif name == "ease_out":
+        return 1 - (1 - t) * (1 - t)
+    elif name == "ease_in":
+        return t * t
+    return t  # linear
@@ -0,0 +1,150 @@
+import tkinter
+import tkinter.font
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+
+from .stylesheet import parse_font
+
+DEFAULT = ("Arial", 11)
+
+# root -> {normalized spec: named Font}
+_fonts = weakref.WeakKeyDictionary()
+# (font name, text) -> width in pixels
+_widths = OrderedDict()
+_widths_size = 4096
+# font name -> Tk font metrics
+_metrics = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=256)
+def normalize(spec):
+    """
+    Canonical (family, size, *styles) tuple for a "family size [style...]"
+    string or a Tk font tuple, so equivalent specs share one Font. None
+    for anything else, e.g. a named font or "-family Courier -size 10".
+    """
+    spec = parse_font(spec)
+    if isinstance(spec, str) or not spec:
+        return None
+    try:
+        size = int(spec[1]) if len(spec) > 1 else DEFAULT[1]
+    except (TypeError, ValueError):
+        return None
+    styles = set()
+    for style in spec[2:]:
+        styles.update(str(style).split())
+    styles -= {"normal", "roman"}
+    return (str(spec[0]), size, *sorted(styles))
+
+
+def get(spec=DEFAULT, widget=None):
+    """
+    The shared named Font for `spec` on `widget`'s root (the default root
+    if omitted). Configuring widgets with it spares Tk from resolving the
+    font description again on every call. A named font such as
+    "TkDefaultFont" gives that Font; any other description this module
+    does not understand is returned unchanged for Tk to interpret.
+    """
+    if isinstance(spec, tkinter.font.Font):
+        return spec
+    root = widget._root() if widget is not None else tkinter._default_root
+    if root is None:
+        raise RuntimeError("too early to create a font: no default root window")
+    key = normalize(spec)
+    if key is None and isinstance(spec, str):
+        # Tcl list syntax, e.g. "{Courier New} 10 bold" or a bare family
+        try:
+            parts = root.tk.splitlist(spec)
+        except tkinter.TclError:
+            return spec
+        if len(parts) == 1 and parts[0] in root.tk.splitlist(root.tk.call("font", "names")):
+            return tkinter.font.Font(root=root, name=parts[0], exists=True)
+        key = normalize(parts)
+    if key is None:
+        return spec
+    fonts = _fonts.get(root)
+    if fonts is None:
+        fonts = _fonts[root] = {}
+    font = fonts.get(key)
+    if font is None:
+        family, size, *styles = key
+        name = "tkpp-" + "-".join(str(part) for part in key).replace(" ", "_")
+        font = tkinter.font.Font(
+            root=root, name=name, exists=False, family=family, size=size,
+            weight="bold" if "bold" in styles else "normal",
+            slant="italic" if "italic" in styles else "roman",
+            underline="underline" in styles, overstrike="overstrike" in styles,
+        )
+        fonts[key] = font
+    return font
+
+
+def _font(spec, widget):
+    font = get(spec, widget)
+    if isinstance(font, tkinter.font.Font):
+        return font
+    # a description only Tk understands: measure it with one Font per spec
+    root = widget._root() if widget is not None else tkinter._default_root
+    fonts = _fonts.setdefault(root, {})
+    measured = fonts.get(font)
+    if measured is None:
+        measured = fonts[font] = tkinter.font.Font(root=root, font=font)
+    return measured
+
+
+def measure(text, font=DEFAULT, widget=None):
+    """Width of `text` in pixels, asking Tk only once per font and text."""
+    font = _font(font, widget)
+    key = (font.name, text)
+    width = _widths.get(key)
+    if width is not None:
+        _stats["hits"] += 1
+        _widths.move_to_end(key)
+        return width
+
+    _stats["misses"] += 1
+    width = font.measure(text)
+    _widths[key] = width
+    if len(_widths) > _widths_size:
+        _widths.popitem(last=False)
+    return width
+
+
+def metrics(font=DEFAULT, widget=None):
+    """Cached ascent, descent, linespace and fixed of `font`; treat as read-only."""
+    font = _font(font, widget)
+    result = _metrics.get(font.name)
+    if result is None:
+        result = _metrics[font.name] = font.metrics()
+    return result
+
+
+def line_height(font=DEFAULT, widget=None):
+    return metrics(font, widget)["linespace"]
+
+
+def text_size(text, font=DEFAULT, widget=None):
+    """(width, height) of possibly multi-line `text`."""
+    lines = text.split("\n")
+    return max(measure(line, font, widget) for line in lines), line_height(font, widget) * len(lines)
+
+
+def cache_stats():
+    info = normalize.cache_info()
+    return {
+        "width_hits": _stats["hits"],
+        "width_misses": _stats["misses"],
+        "width_size": len(_widths),
+        "metrics_size": len(_metrics),
+        "spec_hits": info.hits,
+        "spec_misses": info.misses,
+    }
+
+
+def clear_cache():
+    _widths.clear()
+    _metrics.clear()
+    _stats["hits"] = _stats["misses"] = 0
+    normalize.cache_clear()
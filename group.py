@@ -0,0 +1,139 @@
+try:
+    import numpy
+except ImportError:  # pure-Python fallback below
+    numpy = None
+
+from . import color
+
+
+def _per_widget(values, count):
+    """Accept one value for every widget or one value per widget."""
+    if isinstance(values, (str, bytes)) or (
+        isinstance(values, tuple) and len(values) == 2 and all(isinstance(v, (int, float)) for v in values)
+    ):
+        return [values] * count
+    values = list(values)
+    if len(values) != count:
+        raise ValueError(f"expected {count} values, got {len(values)}")
+    return values
+
+
+class GroupAnimation:
+    """
+    Interpolates colors and/or positions for a whole group of widgets in
+    one step per frame, and writes only the widgets whose value changed
+    since the previous frame. Uses NumPy when it is installed. drop()
+    masks a widget out once another animation takes it over.
+    """
+    def __init__(self, batch, widgets, from_colors=None, to_colors=None, from_pos=None, to_pos=None,
+                 target="bg", use_numpy=None):
+        self.batch = batch
+        self.widgets = [getattr(w, "widget", w) for w in widgets]
+        self.target = target
+        self.numpy = numpy if use_numpy is None or use_numpy else None
+        if use_numpy and numpy is None:
+            raise ImportError("numpy is not installed")
+        count = len(self.widgets)
+
+        self.colors = None
+        if to_colors is not None:
+            if from_colors is None:
+                from_colors = [batch.cget(w, target) for w in self.widgets]
+            start = [color.to_rgb(c, w) for c, w in zip(_per_widget(from_colors, count), self.widgets)]
+            end = [color.to_rgb(c, w) for c, w in zip(_per_widget(to_colors, count), self.widgets)]
+            self.colors = self._endpoints(start, end)
+            self.last_colors = None
+            self.color_mask = self._mask(count)
+
+        self.positions = None
+        if to_pos is not None:
+            if from_pos is None:
+                from_pos = [(w.winfo_x(), w.winfo_y()) for w in self.widgets]
+            self.positions = self._endpoints(_per_widget(from_pos, count), _per_widget(to_pos, count))
+            self.last_positions = None
+            self.position_mask = self._mask(count)
+
+        self.writes = 0
+
+    def _endpoints(self, start, end):
+        if self.numpy is not None:
+            start = self.numpy.asarray(start, dtype=self.numpy.float64)
+            return start, self.numpy.asarray(end, dtype=self.numpy.float64) - start
+        return start, [tuple(b - a for a, b in zip(s, e)) for s, e in zip(start, end)]
+
+    def _mask(self, count):
+        if self.numpy is not None:
+            return self.numpy.ones(count, dtype=bool)
+        return [True] * count
+
+    def drop(self, widget, prop):
+        """Stop writing `prop` ("position" or the color target) of `widget`."""
+        if prop == "position":
+            mask = self.positions is not None and self.position_mask
+        else:
+            mask = prop == self.target and self.colors is not None and self.color_mask
+        if mask is False:
+            return
+        for i, w in enumerate(self.widgets):
+            if w is widget:
+                mask[i] = False
+
+    def update(self, t):
+        if self.numpy is not None:
+            self._update_numpy(t)
+        else:
+            self._update_python(t)
+
+    def _update_numpy(self, t):
+        np = self.numpy
+        if self.colors is not None:
+            start, delta = self.colors
+            rgb = (start + delta * t).astype(np.int64)
+            packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+            if self.last_colors is None:
+                changed = np.flatnonzero(self.color_mask)
+            else:
+                changed = np.flatnonzero((packed != self.last_colors) & self.color_mask)
+            self.last_colors = packed
+            for i in changed.tolist():
+                self.batch.write(self.widgets[i], **{self.target: '#%06x' % packed[i]})
+            self.writes += len(changed)
+
+        if self.positions is not None:
+            start, delta = self.positions
+            xy = (start + delta * t).astype(np.int64)
+            if self.last_positions is None:
+                changed = np.flatnonzero(self.position_mask)
+            else:
+                changed = np.flatnonzero((xy != self.last_positions).any(axis=1) & self.position_mask)
+            self.last_positions = xy
+            for i in changed.tolist():
+                self.batch.place(self.widgets[i], x=int(xy[i, 0]), y=int(xy[i, 1]))
+            self.writes += len(changed)
+
+    def _update_python(self, t):
+        if self.colors is not None:
+            start, delta = self.colors
+            last = self.last_colors
+            mask = self.color_mask
+            packed = []
+            for i, (s, d) in enumerate(zip(start, delta)):
+                value = (int(s[0] + d[0] * t) << 16) | (int(s[1] + d[1] * t) << 8) | int(s[2] + d[2] * t)
+                packed.append(value)
+                if mask[i] and (last is None or last[i] != value):
+                    self.batch.write(self.widgets[i], **{self.target: '#%06x' % value})
+                    self.writes += 1
+            self.last_colors = packed
+
+        if self.positions is not None:
+            start, delta = self.positions
+            last = self.last_positions
+            mask = self.position_mask
+            positions = []
+            for i, (s, d) in enumerate(zip(start, delta)):
+                xy = (int(s[0] + d[0] * t), int(s[1] + d[1] * t))
+                positions.append(xy)
+                if mask[i] and (last is None or last[i] != xy):
+                    self.batch.place(self.widgets[i], x=xy[0], y=xy[1])
+                    self.writes += 1
+            self.last_positions = positions
@@ -0,0 +1,85 @@
+import time
+from collections import Counter, deque
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round((len(values) - 1) * p / 100.0)))]
+
+
+class Profiler:
+    """
+    Per-frame counts and timings for one AnimationManager: every
+    update_func, configure/place write (batched or made directly by a
+    wrapper), after() call and Button/Switch command. Installed with AnimationManager.enable_profiling(); when it is
+    not installed the hooks cost one attribute check.
+    """
+    def __init__(self, history=600):
+        self.frames = deque(maxlen=history)
+        self.frame_calls = deque(maxlen=history)
+        self.animations = {}
+        self.widget_calls = {}
+        self.call_times = {}
+        self._frame = Counter()
+
+    def record_call(self, widget, kind, seconds=0.0):
+        key = str(widget)
+        calls = self.widget_calls.get(key)
+        if calls is None:
+            calls = self.widget_calls[key] = Counter()
+        calls[kind] += 1
+        entry = self.call_times.get(kind)
+        if entry is None:
+            entry = self.call_times[kind] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        self._frame[kind] += 1
+
+    def timed(self, widget, kind, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record_call(widget, kind, time.perf_counter() - start)
+
+    def record_animation(self, animation, seconds):
+        label = animation.name
+        entry = self.animations.get(label)
+        if entry is None:
+            entry = self.animations[label] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+        self._frame["update_func"] += 1
+
+    def record_frame(self, seconds):
+        self.frames.append(seconds)
+        self.frame_calls.append(self._frame)
+        self._frame = Counter()
+
+    def stats(self, top=5):
+        frames = list(self.frames)
+        totals = Counter()
+        for calls in self.frame_calls:
+            totals.update(calls)
+        n = len(self.frame_calls) or 1
+        slowest = sorted(self.animations.items(), key=lambda item: item[1][1] / item[1][0], reverse=True)
+        return {
+            "frames": len(frames),
+            "frame_ms_p50": _percentile(frames, 50) * 1000,
+            "frame_ms_p99": _percentile(frames, 99) * 1000,
+            "frame_ms_max": max(frames, default=0.0) * 1000,
+            "calls_per_frame": {kind: count / n for kind, count in totals.items()},
+            "call_ms": {kind: total * 1000 / count for kind, (count, total) in self.call_times.items()},
+            "slowest_animations": [
+                {"name": name, "calls": count, "avg_ms": total * 1000 / count, "max_ms": worst * 1000}
+                for name, (count, total, worst) in slowest[:top]
+            ],
+            "calls_per_widget": {key: dict(calls) for key, calls in self.widget_calls.items()},
+        }
+
+    def reset(self):
+        self.__init__(self.frames.maxlen)
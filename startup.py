@@ -0,0 +1,49 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTimeline:
+    """Opt-in record of where Tkpp spends its time before the first frame."""
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+
+    def record(self, name, seconds):
+        self.events.append((name, seconds))
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def mark(self, name):
+        """Record the time elapsed since the timeline was created."""
+        self.record(name, time.perf_counter() - self.origin)
+
+    def as_dict(self):
+        return {name: seconds for name, seconds in self.events}
+
+    def report(self):
+        width = max((len(name) for name, _ in self.events), default=0)
+        return "\n".join(f"{name:<{width}}  {seconds * 1000:8.2f} ms" for name, seconds in self.events)
+
+
+@contextmanager
+def _noop(name):
+    yield
+
+
+class _Disabled:
+    measure = staticmethod(_noop)
+
+    def record(self, name, seconds):
+        pass
+
+    def mark(self, name):
+        pass
+
+
+DISABLED = _Disabled()
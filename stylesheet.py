@@ -0,0 +1,224 @@
+import os
+import re
+from functools import lru_cache
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_SELECTOR = re.compile(r"^(\*|[A-Za-z][\w-]*)?((?:[.#][\w-]+)*)((?::[\w-]+)*)$")
+_PART = re.compile(r"([.#])([\w-]+)")
+_VAR = re.compile(r"var\(\s*([\w-]+)\s*\)")
+_NUMBER = re.compile(r"^-?\d+(px)?$")
+
+STATES = ("hover", "active")
+# a pressed widget is also hovered, as in CSS
+_STATE_FLAGS = {
+    "normal": frozenset(),
+    "hover": frozenset(("hover",)),
+    "active": frozenset(("hover", "active")),
+}
+
+
+@lru_cache(maxsize=256)
+def parse_font(font):
+    """
+    Turn a "family size [style...]" string into a Tk font tuple. Anything
+    else (a named font, a Tcl list such as "{Courier New} 10", a bare
+    family) is returned unchanged for Tk, or fonts.get, to interpret.
+    """
+    if not isinstance(font, str):
+        return font
+    parts = font.split()
+    if len(parts) < 2 or any(c in font for c in "{}\"\\"):
+        return font
+    try:
+        return (parts[0], int(parts[1]), *parts[2:])
+    except ValueError:
+        return font
+
+
+def _parse_value(value):
+    parts = value.split()
+    if parts and all(_NUMBER.match(p) for p in parts):
+        numbers = tuple(int(p[:-2] if p.endswith("px") else p) for p in parts)
+        return numbers[0] if len(numbers) == 1 else numbers
+    if value[:1] in "\"'" and value[-1:] == value[:1]:
+        return value[1:-1]
+    return value
+
+
+class Selector:
+    def __init__(self, text):
+        match = _SELECTOR.match(text.strip())
+        if not match:
+            raise ValueError(f"unsupported selector: {text!r}")
+        type_name, parts, pseudo = match.groups()
+        self.text = text.strip()
+        self.type = None if type_name in (None, "*") else type_name
+        self.classes = frozenset(n for kind, n in _PART.findall(parts) if kind == ".")
+        ids = [n for kind, n in _PART.findall(parts) if kind == "#"]
+        self.id = ids[0] if ids else None
+        self.states = frozenset(p for p in pseudo.split(":") if p)
+        unknown = self.states.difference(STATES)
+        if unknown:
+            raise ValueError(f"unsupported state :{sorted(unknown)[0]} in {text!r}")
+        self.specificity = (
+            1 if self.id else 0,
+            len(self.classes) + len(self.states),
+            1 if self.type else 0,
+        )
+
+    def matches(self, type_name, classes, id, flags):
+        return (
+            (self.type is None or self.type == type_name)
+            and self.classes <= classes
+            and (self.id is None or self.id == id)
+            and self.states <= flags
+        )
+
+
+class Stylesheet:
+    """
+    Type, .class and #id selectors with :hover/:active states. Rules are
+    indexed by their most specific part, so resolving a widget only looks
+    at rules that can match it, and computed styles are memoized.
+    """
+    def __init__(self, text=""):
+        self.rules = []
+        self.by_id = {}
+        self.by_class = {}
+        self.by_type = {}
+        self.universal = []
+        self._computed = {}
+        self._deltas = {}
+        if text:
+            self.parse(text)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    @classmethod
+    def find(cls, name):
+        """Load `name` from the working directory or the bundled themes/ folder."""
+        if not name:
+            return cls()
+        for path in (name, os.path.join(os.path.dirname(__file__), "themes", name)):
+            if os.path.isfile(path):
+                return cls.load(path)
+        return cls()
+
+    def parse(self, text):
+        for selectors, body in _RULE.findall(_COMMENT.sub("", text)):
+            declarations = {}
+            for declaration in body.split(";"):
+                if ":" not in declaration:
+                    continue
+                prop, value = declaration.split(":", 1)
+                declarations[prop.strip()] = value.strip()
+            for text_selector in selectors.split(","):
+                self.add_rule(Selector(text_selector), declarations)
+
+    def add_rule(self, selector, declarations):
+        rule = (selector, len(self.rules), declarations)
+        self.rules.append(rule)
+        if selector.id:
+            self.by_id.setdefault(selector.id, []).append(rule)
+        elif selector.classes:
+            self.by_class.setdefault(min(selector.classes), []).append(rule)
+        elif selector.type:
+            self.by_type.setdefault(selector.type, []).append(rule)
+        else:
+            self.universal.append(rule)
+        self._computed.clear()
+        self._deltas.clear()
+
+    def compute(self, type_name, classes=frozenset(), id=None, state="normal", theme=None):
+        """
+        Merged declarations for a widget. `theme` (a ttkpp) resolves var(key)
+        references. The returned dict is shared, treat it as read-only.
+        """
+        classes = frozenset(classes)
+        theme_name = theme.theme_name if theme is not None else None
+        key = (type_name, classes, id, state, theme_name)
+        style = self._computed.get(key)
+        if style is not None:
+            return style
+
+        flags = _STATE_FLAGS[state]
+        candidates = list(self.universal)
+        candidates += self.by_type.get(type_name, ())
+        for name in classes:
+            candidates += self.by_class.get(name, ())
+        if id is not None:
+            candidates += self.by_id.get(id, ())
+        matched = [r for r in candidates if r[0].matches(type_name, classes, id, flags)]
+        matched.sort(key=lambda r: (r[0].specificity, r[1]))
+
+        values = theme.theme if theme is not None else {}
+        style = {}
+        for _, _, declarations in matched:
+            for prop, value in declarations.items():
+                value = _VAR.sub(lambda m: values.get(m.group(1), m.group(0)), value)
+                style[prop] = _parse_value(value)
+        if "font" in style:
+            style["font"] = parse_font(style["font"])
+        self._computed[key] = style
+        return style
+
+    def delta(self, type_name, classes, id, from_state, to_state, theme=None, defaults=None):
+        """
+        Only the properties that change between two states of a widget.
+        Properties set by `from_state` but not by `to_state` are reset to
+        their value in `defaults` (the widget's own style) if given.
+        """
+        classes = frozenset(classes)
+        theme_name = theme.theme_name if theme is not None else None
+        key = (type_name, classes, id, from_state, to_state, theme_name)
+        cached = self._deltas.get(key)
+        if cached is None:
+            before = self.compute(type_name, classes, id, from_state, theme)
+            after = self.compute(type_name, classes, id, to_state, theme)
+            changed = {k: v for k, v in after.items() if before.get(k) != v}
+            removed = tuple(k for k in before if k not in after)
+            cached = self._deltas[key] = (changed, removed)
+        changed, removed = cached
+        if not removed or not defaults:
+            return changed
+        delta = dict(changed)
+        for k in removed:
+            if k in defaults:
+                delta[k] = defaults[k]
+        return delta
+
+    def attach(self, wrapper, classes=(), id=None, theme=None):
+        """
+        Style `wrapper` and keep it in sync with :hover/:active. Only the
+        properties that differ between states are written on transitions;
+        ones only a state rule sets go back to the widget's own values.
+        """
+        type_name = type(wrapper).__name__
+        classes = frozenset(classes.split() if isinstance(classes, str) else classes)
+        current = ["normal"]
+        normal = self.compute(type_name, classes, id, "normal", theme)
+        state_only = set()
+        for state in STATES:
+            state_only.update(self.compute(type_name, classes, id, state, theme))
+        state_only.difference_update(normal)
+        # read before styling; the normal style does not touch these keys
+        defaults = wrapper.current_style(state_only) if state_only else None
+        wrapper.apply_style(normal)
+
+        def move(state):
+            if state == current[0]:
+                return
+            delta = self.delta(type_name, classes, id, current[0], state, theme, defaults)
+            current[0] = state
+            if delta:
+                wrapper.apply_style(delta)
+
+        widget = wrapper.widget
+        widget.bind("<Enter>", lambda e: move("hover"), add="+")
+        widget.bind("<Leave>", lambda e: move("normal"), add="+")
+        widget.bind("<ButtonPress-1>", lambda e: move("active"), add="+")
+        widget.bind("<ButtonRelease-1>", lambda e: move("hover"), add="+")
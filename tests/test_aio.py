@@ -0,0 +1,38 @@
+import asyncio
+
+from ..aio import _Bridge
+from ..benchmarks.harness import FakeTk
+
+
+class BindingRoot(FakeTk):
+    """Keeps <Destroy> as one Tcl script the way tkinter's bind() builds it."""
+    def __init__(self):
+        super().__init__()
+        self.script = 'if {"[other %W]" == "break"} break\n'
+        self.deleted = []
+        self.tk = None
+
+    def bind(self, sequence, func=None, add=None):
+        if func is None:
+            return self.script
+        if isinstance(func, str):
+            self.script = func
+            return None
+        funcid = f"{id(func)}_on_destroy"
+        self.script += f'if {{"[{funcid} %W]" == "break"}} break\n'
+        return funcid
+
+    def deletecommand(self, name):
+        self.deleted.append(name)
+
+
+def test_unbinding_keeps_other_destroy_handlers():
+    root = BindingRoot()
+    loop = asyncio.new_event_loop()
+    bridge = _Bridge(root, loop)
+    loop.close()
+    assert bridge._bind_id in root.script
+    bridge._unbind()
+    assert bridge._bind_id not in root.script
+    assert "[other %W]" in root.script
+    assert root.deleted == [bridge._bind_id]
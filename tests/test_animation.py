@@ -0,0 +1,59 @@
+import gc
+import weakref
+from types import SimpleNamespace
+
+from ..animation import Animation
+from ..benchmarks.harness import FakeTk, FakeWidget, fake_manager
+
+
+def test_retargeting_retires_the_previous_animation():
+    root = FakeTk()
+    manager = fake_manager(root)
+    widget = FakeWidget(root)
+    first = Animation.animate_color(widget, "#000000", "#ffffff", 200)
+    Animation.animate_color(widget, "#000000", "#ff0000", 200)
+    root.run(1.0)
+    assert not first.running
+    assert manager.superseded == 1
+    assert widget.options["bg"] == "#ff0000"
+
+
+def test_dropped_root_and_manager_are_collected():
+    root = FakeTk()
+    manager = fake_manager(root)
+    Animation.animate_color(FakeWidget(root), "#000000", "#ffffff", 100)
+    root.run(1.0)
+    refs = weakref.ref(root), weakref.ref(manager)
+    del root, manager
+    gc.collect()
+    assert refs[0]() is None and refs[1]() is None
+
+
+def test_group_claims_each_widget():
+    root = FakeTk()
+    manager = fake_manager(root)
+    widgets = [FakeWidget(root) for _ in range(3)]
+    single = Animation.animate_color(widgets[1], "#000000", "#ff0000", 200)
+    group = manager.animate_group(widgets, "#000000", "#ffffff", duration=200)
+    assert not single.running
+    Animation.animate_color(widgets[2], "#ffffff", "#0000ff", 100)
+    assert group.running
+    root.run(1.0)
+    assert widgets[2].options["bg"] == "#0000ff"
+    assert widgets[0].options["bg"] == widgets[1].options["bg"] == "#ffffff"
+    assert not manager.slots
+
+
+def test_manager_of_a_hidden_root_starts_suspended():
+    root = FakeTk()
+    root.mapped = False  # e.g. withdrawn by Tkpp until mainloop
+    manager = fake_manager(root)
+    assert manager.suspended_at is not None
+    widget = FakeWidget(root)
+    Animation.animate_color(widget, "#000000", "#ffffff", 100)
+    root.run(1.0)
+    assert widget.options["bg"] == "#000000"
+    root.mapped = True
+    manager._on_map(SimpleNamespace(widget=root))
+    root.run(2.0)
+    assert widget.options["bg"] == "#ffffff"
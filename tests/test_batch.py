@@ -0,0 +1,38 @@
+from ..batch import WriteBatch
+from ..benchmarks.harness import FakeCanvas, FakeTk, FakeWidget, fake_manager
+
+
+def test_writes_coalesce_into_one_configure():
+    root = FakeTk()
+    batch = WriteBatch(root)
+    widget = FakeWidget(root)
+    batch.write(widget, bg="#000000")
+    batch.write(widget, bg="#111111", fg="#222222")
+    assert batch.cget(widget, "bg") == "#111111"
+    assert root.calls["config"] == 0
+    batch.flush()
+    assert root.calls["config"] == 1
+    assert widget.options["bg"] == "#111111"
+    assert batch.saved == 1
+
+
+def test_pending_writes_flush_on_idle():
+    root = FakeTk()
+    batch = WriteBatch(root)
+    widget = FakeWidget(root)
+    batch.write(widget, fg="#abcdef")
+    root.run(root.clock.now)
+    assert widget.options["fg"] == "#abcdef"
+
+
+def test_flushing_one_widget_keeps_composited_moves():
+    root = FakeTk()
+    manager = fake_manager(root)
+    compositor = manager.enable_compositing(FakeCanvas(root))
+    moved, styled = FakeWidget(root), FakeWidget(root)
+    compositor.add(moved, 0, 0)
+    manager.batch.place(moved, x=50, y=5)
+    manager.batch.write(styled, bg="#ffffff")
+    manager.batch.flush(styled)
+    root.run(root.clock.now)
+    assert compositor.positions[moved] == (50, 5)
@@ -0,0 +1,7 @@
+from ..benchmarks import check_baselines
+
+
+def test_no_regressions():
+    # the 10000-widget runs take most of the suite's time and add nothing
+    # the exact Tcl call counts of the smaller ones would not catch
+    check_baselines(counts=(1, 100))
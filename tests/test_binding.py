@@ -0,0 +1,52 @@
+from ..benchmarks.harness import FakeTk, FakeWidget
+from ..binding import Model
+from ..widget import Widget
+
+
+class Label(Widget):
+    __slots__ = ()
+    bind_options = {"text": "text", "fg": "fg"}
+
+
+def _label(root):
+    label = Label(root)
+    label.widget = FakeWidget(root)
+    return label
+
+
+def test_bind_applies_now_and_on_idle():
+    root = FakeTk()
+    label = _label(root)
+    model = Model(price=1.0)
+    model.bind(label, "text", "price", "{:.2f}".format)
+    assert label.widget.options["text"] == "1.00"
+    model.price = 2.5
+    assert label.widget.options["text"] == "1.00"
+    root.run(root.clock.now)
+    assert label.widget.options["text"] == "2.50"
+
+
+def test_unchanged_values_are_skipped():
+    root = FakeTk()
+    label = _label(root)
+    model = Model(price=1.0, limit=10.0)
+    model.bind(label, "fg", ("price", "limit"), lambda p, l: "red" if p > l else "black")
+    calls = root.calls["config"]
+    model.price = 2.0
+    root.run(root.clock.now)
+    assert root.calls["config"] == calls
+    assert model.skipped == 1
+    model.price = 20.0
+    root.run(root.clock.now)
+    assert label.widget.options["fg"] == "red"
+
+
+def test_unbind_stops_updates():
+    root = FakeTk()
+    label = _label(root)
+    model = Model(name="a")
+    model.bind(label, "text", "name")
+    model.unbind(label)
+    model.name = "b"
+    root.run(root.clock.now)
+    assert label.widget.options["text"] == "a"
@@ -0,0 +1,32 @@
+import pytest
+
+from .. import color
+from ..benchmarks.harness import FakeTk
+
+
+def test_to_rgb_parses_hex_forms():
+    assert color.to_rgb("#fff") == (255, 255, 255)
+    assert color.to_rgb("#102030") == (16, 32, 48)
+    assert color.to_rgb("#ffff00000000") == (255, 0, 0)
+
+
+def test_to_rgb_resolves_names_through_the_widget_once():
+    color.clear_cache()
+    root = FakeTk()
+    root.winfo_rgb = lambda name: (257 * 1, 257 * 2, 257 * 3)
+    assert color.to_rgb("SomeName", root) == (1, 2, 3)
+    root.winfo_rgb = None  # a second lookup must come from the cache
+    assert color.to_rgb("somename", root) == (1, 2, 3)
+
+
+def test_to_rgb_rejects_names_without_widget():
+    with pytest.raises(ValueError):
+        color.to_rgb("not-a-cached-name")
+
+
+def test_gradient_endpoints_and_length():
+    frames = color.gradient((0, 0, 0), (255, 255, 255), 4)
+    assert len(frames) == 5
+    assert frames[0] == "#000000"
+    assert frames[-1] == "#ffffff"
+    assert frames[2] == color.to_hex((127.5, 127.5, 127.5))
@@ -0,0 +1,15 @@
+from ..completion import PrefixIndex
+
+
+def test_complete_is_case_insensitive_and_sorted():
+    index = PrefixIndex(["banana", "Apple", "apricot", "avocado", "APX"])
+    assert index.complete("ap") == ["Apple", "apricot", "APX"]
+    assert index.complete("AV") == ["avocado"]
+
+
+def test_complete_respects_limit_and_misses():
+    index = PrefixIndex(f"item{i:03d}" for i in range(200))
+    assert index.complete("item", limit=3) == ["item000", "item001", "item002"]
+    assert index.complete("zzz") == []
+    assert index.complete("item199") == ["item199"]
+    assert len(index) == 200
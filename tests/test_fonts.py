@@ -0,0 +1,50 @@
+import tkinter
+import tkinter.font
+
+import pytest
+
+from .. import fonts
+from ..benchmarks.harness import FakeTk
+from ..stylesheet import parse_font
+
+
+@pytest.fixture
+def root():
+    # a Tcl interpreter with a stand-in for Tk's font command; no display needed
+    root = FakeTk()
+    root.tk = tkinter.Tcl().tk
+    root.tk.eval("""proc font {command args} {
+        switch $command names {return {TkDefaultFont TkFixedFont}} actual {return {-size 10}}
+    }""")
+    yield root
+    fonts.clear_cache()
+
+
+@pytest.mark.parametrize("spec", ["TkDefaultFont", "Helvetica", "{Courier New} 10", "Arial big", ""])
+def test_parse_font_passes_other_descriptions_through(spec):
+    assert parse_font(spec) == spec
+
+
+def test_parse_font_splits_family_size_styles():
+    assert parse_font("Arial 12 bold italic") == ("Arial", 12, "bold", "italic")
+
+
+def test_get_shares_one_font_per_spec(root):
+    font = fonts.get("Arial 12 bold", root)
+    assert font is fonts.get(("Arial", 12, "bold"), root)
+    assert font.name == "tkpp-Arial-12-bold"
+
+
+def test_get_parses_tcl_lists(root):
+    assert fonts.get("{Courier New} 10 italic", root).name == "tkpp-Courier_New-10-italic"
+    assert fonts.get("Helvetica", root).name == f"tkpp-Helvetica-{fonts.DEFAULT[1]}"
+
+
+def test_get_returns_named_fonts(root):
+    font = fonts.get("TkDefaultFont", root)
+    assert isinstance(font, tkinter.font.Font) and font.name == "TkDefaultFont"
+
+
+def test_get_leaves_unknown_descriptions_to_tk(root):
+    assert fonts.get("-family Courier -size 10", root) == "-family Courier -size 10"
+    assert fonts.get("{unbalanced", root) == "{unbalanced"
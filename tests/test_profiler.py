@@ -0,0 +1,40 @@
+from ..animation import Animation
+from ..benchmarks.harness import FakeTk, FakeWidget, fake_manager
+from ..widget import Widget
+
+
+def wrapped(root):
+    wrapper = Widget(root)
+    wrapper.widget = FakeWidget(root)
+    return wrapper
+
+
+def test_direct_wrapper_writes_are_profiled():
+    root = FakeTk()
+    profiler = fake_manager(root).enable_profiling()
+    wrapper = wrapped(root)
+    wrapper.config(text="hello")
+    wrapper.place(x=10, y=20)
+    calls = profiler.stats()["calls_per_widget"][str(wrapper.widget)]
+    assert calls == {"config": 1, "place": 1}
+    assert wrapper.widget.options["text"] == "hello"
+
+
+def test_direct_write_carries_pending_writes_along():
+    root = FakeTk()
+    manager = fake_manager(root)
+    wrapper = wrapped(root)
+    manager.batch.write(wrapper.widget, bg="#000000", fg="#111111")
+    wrapper.config(bg="#ffffff")
+    root.run(1.0)
+    assert wrapper.widget.options == {"bg": "#ffffff", "fg": "#111111"}
+    assert root.calls["config"] == 1
+
+
+def test_after_calls_are_timed():
+    root = FakeTk()
+    profiler = fake_manager(root).enable_profiling()
+    Animation.animate_color(FakeWidget(root), "#000000", "#ffffff", 100)
+    root.run(1.0)
+    count, seconds = profiler.call_times["after"]
+    assert count > 1 and seconds > 0
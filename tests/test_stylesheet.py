@@ -0,0 +1,59 @@
+import pytest
+
+from ..benchmarks.harness import FakeTk, FakeWidget
+from ..stylesheet import Stylesheet
+from ..widget import Widget
+
+CSS = """
+* { fg: #000000 }
+Label { bg: #111111; padding: 4px 2px }
+.primary { bg: #0000ff }
+#save { bg: #00ff00 }
+Label:hover { fg: #ff0000 }
+Button:active { relief: sunken }
+"""
+
+
+class Label(Widget):
+    __slots__ = ()
+
+
+def _label(root):
+    label = Label(root)
+    label.widget = FakeWidget(root)
+    label.widget.bindings = {}
+    label.widget.bind = lambda sequence, func, add=None: label.widget.bindings.setdefault(sequence, func)
+    return label
+
+
+def test_cascade_orders_by_specificity():
+    sheet = Stylesheet(CSS)
+    assert sheet.compute("Label") == {"fg": "#000000", "bg": "#111111", "padding": (4, 2)}
+    assert sheet.compute("Label", {"primary"})["bg"] == "#0000ff"
+    assert sheet.compute("Label", {"primary"}, "save")["bg"] == "#00ff00"
+    assert sheet.compute("Label", state="hover")["fg"] == "#ff0000"
+
+
+def test_unknown_state_is_rejected():
+    with pytest.raises(ValueError):
+        Stylesheet("Label:focus { fg: red }")
+
+
+def test_delta_resets_state_only_properties():
+    sheet = Stylesheet(CSS)
+    assert sheet.delta("Button", (), None, "normal", "active") == {"relief": "sunken"}
+    assert sheet.delta("Button", (), None, "active", "hover") == {}
+    assert sheet.delta("Button", (), None, "active", "hover", defaults={"relief": "raised"}) == {"relief": "raised"}
+
+
+def test_attach_restores_the_widget_after_hover():
+    root = FakeTk()
+    label = _label(root)
+    label.widget.options["fg"] = "#ffffff"
+    Stylesheet("Label:hover { fg: #ff0000 }").attach(label)
+    label.widget.bindings["<Enter>"](None)
+    root.run(root.clock.now)
+    assert label.widget.options["fg"] == "#ff0000"
+    label.widget.bindings["<Leave>"](None)
+    root.run(root.clock.now)
+    assert label.widget.options["fg"] == "#ffffff"
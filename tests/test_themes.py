@@ -0,0 +1,26 @@
+import pytest
+
+from .. import ttkpp
+
+
+def test_loading_one_theme_parses_only_its_file(monkeypatch):
+    monkeypatch.setattr(ttkpp, "_files", {})
+    name, theme, key = ttkpp.load_theme("dark")
+    assert name == "dark" and theme["accent"]
+    assert list(ttkpp._files) == [key[0]]
+
+
+def test_unknown_theme_falls_back_to_default():
+    assert ttkpp.load_theme("no_such_theme")[0] == "default"
+
+
+def test_every_bundled_theme_is_listed():
+    themes = ttkpp.load_themes()
+    assert len(themes) == 24
+    assert {"default", "light", "dark"} <= set(themes)
+
+
+@pytest.mark.parametrize("name", ["../../x", "/etc/passwd", "dark.json", "a b", ""])
+def test_names_that_are_not_identifiers_are_rejected(name):
+    with pytest.raises(ValueError):
+        ttkpp.load_theme(name)
@@ -0,0 +1,85 @@
+import pytest
+
+from ..benchmarks.harness import FakeTk, FakeWidget, fake_manager
+from ..animation import Animation
+from ..timeline import Keyframes, Parallel, Pause, Sequence
+
+
+def test_keyframes_compile_to_a_value_per_frame():
+    compiled = Keyframes("x", {0: 0, 1: 100}, duration=160).compile(16)
+    assert compiled.frames == 11
+    track, = compiled.tracks
+    assert len(track) == 11
+    assert track.value(0) == 0
+    assert track.value(10) == 100
+    assert track.value(5) == 50
+
+
+def test_compile_is_cached_per_interval():
+    timeline = Keyframes("bg", {0: "#000000", 1: "#ffffff"}, duration=100)
+    assert timeline.compile(16) is timeline.compile(16)
+    assert timeline.compile(16) is not timeline.compile(20)
+
+
+def test_sequence_offsets_children():
+    compiled = Sequence(Pause(32), Keyframes("x", {0: 0, 1: 10}, duration=32)).compile(16)
+    track, = compiled.tracks
+    assert track.start == 2
+    assert compiled.duration == 64
+
+
+def test_endless_repeat_must_be_outermost():
+    endless = Keyframes("x", {0: 0, 1: 10}, duration=32).repeat()
+    endless.compile(16)
+    with pytest.raises(ValueError):
+        endless.delay(16).compile(16)
+
+
+def test_play_ends_on_the_last_keyframe():
+    root = FakeTk()
+    manager = fake_manager(root)
+    widgets = [FakeWidget(root) for _ in range(3)]
+    shared = Parallel(
+        Keyframes("bg", {0: "#000000", 1: "#ffffff"}, duration=200),
+        Keyframes("position", {0: (0, 0), 1: (40, 20)}, duration=200),
+    )
+    manager.play(shared, widgets, stagger=50)
+    root.run(1.0)
+    for widget in widgets:
+        assert widget.options["bg"] == "#ffffff"
+        assert (widget.x, widget.y) == (40, 20)
+    assert not manager.animations
+
+
+def test_timeline_and_tween_on_one_property_retire_each_other():
+    root = FakeTk()
+    manager = fake_manager(root)
+    widget = FakeWidget(root)
+    pulse = Keyframes("bg", {0: "#000000", 1: "#ffffff"}, duration=200)
+    timeline = manager.play(pulse, widget)
+    Animation.animate_color(widget, "#000000", "#ff0000", 100)
+    assert not timeline.running
+    manager.play(pulse, widget)
+    root.run(1.0)
+    assert widget.options["bg"] == "#ffffff"
+    assert manager.superseded == 2
+    assert not manager.slots
+
+
+def test_tween_takes_over_one_widget_of_a_timeline():
+    root = FakeTk()
+    manager = fake_manager(root)
+    widgets = [FakeWidget(root) for _ in range(10)]
+    fade = Parallel(
+        Keyframes("bg", {0: "#000000", 1: "#ffffff"}, duration=200),
+        Keyframes("position", {0: (0, 0), 1: (40, 20)}, duration=200),
+    )
+    timeline = manager.play(fade, widgets, stagger=20)
+    Animation.animate_color(widgets[0], "#000000", "#ff0000", 100)
+    assert timeline.running
+    root.run(1.0)
+    assert widgets[0].options["bg"] == "#ff0000"
+    assert (widgets[0].x, widgets[0].y) == (40, 20)
+    for widget in widgets[1:]:
+        assert widget.options["bg"] == "#ffffff"
+    assert not manager.slots
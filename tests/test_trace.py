@@ -0,0 +1,55 @@
+import gc
+import signal
+import weakref
+
+import pytest
+
+from ..animation import Animation
+from ..benchmarks.harness import FakeTk, FakeWidget, fake_manager
+
+
+def test_spans_do_not_keep_animations_alive():
+    root = FakeTk()
+    manager = fake_manager(root)
+    tracer = manager.enable_tracing()
+
+    def update(progress):
+        pass
+    Animation(FakeWidget(root), 0.1, update, name="fade").start()
+    root.run(1.0)
+    ref = weakref.ref(update)
+    del update
+    gc.collect()
+    assert ref() is None
+    names = {event["name"] for event in tracer.events() if event.get("cat") == "animation"}
+    assert names == {"fade"}
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_disable_tracing_restores_the_signal_handler():
+    def handler(number, frame):
+        pass
+    previous = signal.signal(signal.SIGUSR1, handler)
+    try:
+        manager = fake_manager(FakeTk())
+        manager.enable_tracing().dump_on_signal()
+        assert signal.getsignal(signal.SIGUSR1) is not handler
+        manager.disable_tracing()
+        assert signal.getsignal(signal.SIGUSR1) is handler
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+
+def test_direct_wrapper_writes_are_traced():
+    from ..widget import Widget
+    root = FakeTk()
+    manager = fake_manager(root)
+    profiler = manager.enable_profiling()
+    tracer = manager.enable_tracing()
+    wrapper = Widget(root)
+    wrapper.widget = FakeWidget(root)
+    wrapper.config(text="hello")
+    wrapper.place(x=1, y=2)
+    spans = [(event["name"], event["args"]["widget"]) for event in tracer.events() if event.get("cat") == "tk"]
+    assert spans == [("config", str(wrapper.widget)), ("place", str(wrapper.widget))]
+    assert profiler.stats()["calls_per_widget"][str(wrapper.widget)] == {"config": 1, "place": 1}
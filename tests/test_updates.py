@@ -0,0 +1,59 @@
+import os
+import tkinter
+from types import SimpleNamespace
+
+import pytest
+
+from ..benchmarks.harness import FakeTk, FakeWidget, fake_manager
+from ..updates import UpdateChannel
+
+
+def test_latest_value_per_property_wins():
+    root = FakeTk()
+    channel = UpdateChannel.for_widget(root)
+    widget = FakeWidget(root)
+    channel.post(widget, "bg", "#000001")
+    channel.post(widget, "bg", "#000002")
+    assert channel.coalesced == 1
+    assert channel.drain() == 1
+    root.run(root.clock.now)
+    assert widget.options["bg"] == "#000002"
+
+
+def test_idle_channel_backs_off():
+    root = FakeTk()
+    UpdateChannel.for_widget(root)
+    root.calls.clear()
+    root.run(2.0)
+    # polling every 16 ms would be 125 wakeups
+    assert root.calls["after"] < 15
+
+
+def test_nothing_is_drained_while_suspended():
+    root = FakeTk()
+    manager = fake_manager(root)
+    channel = UpdateChannel.for_widget(root)
+    widget = FakeWidget(root)
+    manager.suspend()
+    channel.post(widget, "fg", "#123456")
+    root.run(1.0)
+    assert widget.options["fg"] != "#123456"
+    manager.resume()
+    root.run(1.5)
+    assert widget.options["fg"] == "#123456"
+
+
+def test_destroying_the_root_closes_the_channel():
+    root = FakeTk()
+    root.tk = tkinter.Tcl().tk  # can watch file descriptors, no display needed
+    handlers = {}
+    root.bind = lambda sequence, func, add=None: handlers.setdefault(sequence, func)
+    channel = UpdateChannel.for_widget(root)
+    read, write = channel._wakeup
+    handlers["<Destroy>"](SimpleNamespace(widget=FakeWidget(root)))
+    assert not channel._closed  # a child went away, not the root
+    handlers["<Destroy>"](SimpleNamespace(widget=root))
+    assert channel._closed and channel._wakeup is None
+    for fd in (read, write):
+        with pytest.raises(OSError):
+            os.fstat(fd)
@@ -0,0 +1,412 @@
+"""
+Keyframe timelines. A timeline is built from Keyframes and Spring tracks
+combined with Sequence, Parallel (optionally staggered) and repeat(), then
+compiled once per frame interval into per-track tables of sampled values.
+Playback only indexes those tables, so a frame does no easing or spring
+math, and one compiled timeline can drive any number of widgets:
+
+    pulse = Sequence(
+        Keyframes("bg", {0: "#202020", 0.3: "#ff4040", 1: "#202020"}, duration=600, easing="ease_out"),
+        Spring("position", (0, 0), (40, 0), stiffness=200, damping=12),
+    ).repeat(3, yoyo=True)
+    manager.play(pulse, [a.widget, b.widget, c.widget], stagger=80)
+"""
+import math
+from array import array
+
+from . import color
+from .animation import Animation, AnimationManager
+from .easing import ease
+
+# properties written with place() instead of configure()
+PLACE_PROPERTIES = frozenset({"x", "y", "relx", "rely", "relwidth", "relheight"})
+
+
+def _ease(easing, t):
+    return easing(t) if callable(easing) else ease(easing, t)
+
+
+def _integral(vectors):
+    return all(isinstance(c, int) for vector in vectors for c in vector)
+
+
+def _slot_property(prop):
+    # x and y tracks move the widget just like animate_move
+    return "position" if prop in ("x", "y") else prop
+
+
+def _kind(value):
+    if isinstance(value, str):
+        return "color"
+    if isinstance(value, (tuple, list)):
+        return "vector"
+    return "number"
+
+
+class Track:
+    """Compiled values of one property, starting at frame `start`."""
+    __slots__ = ("prop", "start", "values", "width")
+
+    def __init__(self, prop, start, values, width=1):
+        self.prop = prop
+        self.start = start
+        self.values = values
+        self.width = width
+
+    def __len__(self):
+        return len(self.values) // self.width
+
+    def value(self, i):
+        if self.width == 1:
+            return self.values[i]
+        w = self.width
+        return tuple(self.values[i * w:(i + 1) * w])
+
+    def shifted(self, offset, reverse=False, period=0):
+        if not reverse:
+            return Track(self.prop, self.start + offset, self.values, self.width)
+        n = len(self)
+        if self.width == 1:
+            values = self.values[::-1]
+        else:
+            values = type(self.values)(self.values.typecode, [])
+            for i in range(n - 1, -1, -1):
+                values.extend(self.values[i * self.width:(i + 1) * self.width])
+        return Track(self.prop, offset + period - (self.start + n - 1), values, self.width)
+
+
+class Compiled:
+    """A timeline sampled every `interval` ms: `frames` frames of tracks."""
+    __slots__ = ("tracks", "frames", "interval", "loop", "yoyo")
+
+    def __init__(self, tracks, frames, interval, loop=False, yoyo=False):
+        self.tracks = tracks
+        self.frames = frames
+        self.interval = interval
+        self.loop = loop
+        self.yoyo = yoyo
+
+    @property
+    def duration(self):
+        """Length in ms of one pass."""
+        return (self.frames - 1) * self.interval
+
+
+class Timeline:
+    duration = 0
+
+    def _length(self, interval):
+        return int(round(self.duration / interval))
+
+    def _tracks(self, interval, start, widget):
+        raise NotImplementedError
+
+    def then(self, *others):
+        return Sequence(self, *others)
+
+    def delay(self, ms):
+        return Sequence(Pause(ms), self)
+
+    def repeat(self, count=None, yoyo=False):
+        """Play `count` times (forever if None); yoyo plays every other pass backwards."""
+        return Repeat(self, count, yoyo)
+
+    def compile(self, interval=AnimationManager.frame_interval, widget=None):
+        """
+        Sample every track at `interval` ms. Color names need `widget`;
+        hex colors do not. The result is cached per interval.
+        """
+        cache = self.__dict__.setdefault("_compiled", {})
+        compiled = cache.get(interval)
+        if compiled is None:
+            if isinstance(self, Repeat) and self.count is None:
+                tracks = self.child._tracks(interval, 0, widget)
+                compiled = Compiled(tracks, self.child._length(interval) + 1, interval, True, self.yoyo)
+            else:
+                compiled = Compiled(self._tracks(interval, 0, widget), self._length(interval) + 1, interval)
+            cache[interval] = compiled
+        return compiled
+
+
+class _Sampled(Timeline):
+    """A single-property track whose values are interpolated from a progress curve."""
+    def _table(self, kind, samples, originals):
+        if kind == "color":
+            return list(samples), 1
+        if kind == "vector":
+            first = samples[0]
+            # pixel positions stay ints; anything given as floats stays float
+            typecode = "i" if _integral(originals) else "d"
+            values = array(typecode)
+            for sample in samples:
+                values.extend([int(round(v)) for v in sample] if typecode == "i" else sample)
+            return values, len(first)
+        return array("d", samples), 1
+
+    @staticmethod
+    def _resolve(kind, value, widget):
+        if kind == "color":
+            return color.to_rgb(value, widget)
+        if kind == "vector":
+            return tuple(value)
+        return value
+
+    @staticmethod
+    def _lerp(kind, a, b, t):
+        if kind == "color":
+            return color.to_hex([min(255, max(0, x + (y - x) * t)) for x, y in zip(a, b)])
+        if kind == "vector":
+            return tuple(x + (y - x) * t for x, y in zip(a, b))
+        return a + (b - a) * t
+
+
+class Keyframes(_Sampled):
+    """
+    Values of one property at offsets 0..1 of `duration` ms. `frames` is a
+    {offset: value} dict or a list of (offset, value[, easing]); the easing
+    (a name or a function of t) shapes the segment leading to that key.
+    """
+    def __init__(self, prop, frames, duration=300, easing="linear"):
+        if isinstance(frames, dict):
+            frames = list(frames.items())
+        keys = []
+        for frame in frames:
+            offset, value = frame[0], frame[1]
+            keys.append((float(offset), value, frame[2] if len(frame) > 2 else easing))
+        keys.sort(key=lambda key: key[0])
+        if not keys:
+            raise ValueError("Keyframes needs at least one key")
+        self.prop = prop
+        self.keys = keys
+        self.duration = duration
+        self.kind = _kind(keys[0][1])
+
+    def _tracks(self, interval, start, widget):
+        kind = self.kind
+        keys = [(offset, self._resolve(kind, value, widget), easing) for offset, value, easing in self.keys]
+        n = self._length(interval)
+        samples = []
+        segment = 0
+        for i in range(n + 1):
+            t = i / n if n else 1.0
+            while segment < len(keys) - 1 and keys[segment + 1][0] <= t:
+                segment += 1
+            offset, value, _ = keys[segment]
+            if segment == len(keys) - 1 or t <= offset:
+                samples.append(self._lerp(kind, value, value, 0))
+                continue
+            next_offset, next_value, easing = keys[segment + 1]
+            u = (t - offset) / (next_offset - offset)
+            samples.append(self._lerp(kind, value, next_value, _ease(easing, u)))
+        values, width = self._table(kind, samples, [value for _, value, _ in self.keys])
+        return [Track(self.prop, start, values, width)]
+
+
+class Spring(_Sampled):
+    """
+    Damped spring from `from_value` to `to_value`. The motion is simulated
+    once at compile time until it settles within `precision` of the
+    distance, which also fixes the duration.
+    """
+    step = 0.001  # s, simulation time step
+
+    def __init__(self, prop, from_value, to_value, stiffness=170.0, damping=26.0, mass=1.0,
+                 velocity=0.0, precision=0.001, max_duration=10000):
+        self.prop = prop
+        self.from_value = from_value
+        self.to_value = to_value
+        self.kind = _kind(from_value)
+        self.curve = self._simulate(stiffness, damping, mass, velocity, precision, max_duration)
+        self.duration = len(self.curve) - 1
+
+    def _simulate(self, stiffness, damping, mass, velocity, precision, max_duration):
+        """Progress 0 -> 1 sampled every ms, overshoot included."""
+        x, v = 0.0, velocity
+        dt = self.step
+        curve = array("d", [0.0])
+        for _ in range(int(max_duration)):
+            a = (-stiffness * (x - 1.0) - damping * v) / mass
+            v += a * dt
+            x += v * dt
+            curve.append(x)
+            if abs(x - 1.0) < precision and abs(v) < precision * 10:
+                break
+        curve[-1] = 1.0
+        return curve
+
+    def _tracks(self, interval, start, widget):
+        kind = self.kind
+        a = self._resolve(kind, self.from_value, widget)
+        b = self._resolve(kind, self.to_value, widget)
+        n = self._length(interval)
+        last = len(self.curve) - 1
+        samples = [self._lerp(kind, a, b, self.curve[min(last, int(round(i * interval)))]) for i in range(n + 1)]
+        samples[-1] = self._lerp(kind, a, b, 1.0)
+        values, width = self._table(kind, samples, (self.from_value, self.to_value))
+        return [Track(self.prop, start, values, width)]
+
+
+class Pause(Timeline):
+    def __init__(self, duration):
+        self.duration = duration
+
+    def _tracks(self, interval, start, widget):
+        return []
+
+
+class Sequence(Timeline):
+    def __init__(self, *children):
+        self.children = children
+        self.duration = sum(child.duration for child in children)
+
+    def _length(self, interval):
+        return sum(child._length(interval) for child in self.children)
+
+    def _tracks(self, interval, start, widget):
+        tracks = []
+        for child in self.children:
+            tracks.extend(child._tracks(interval, start, widget))
+            start += child._length(interval)
+        return tracks
+
+
+class Parallel(Timeline):
+    """Children start together, or `stagger` ms apart in order."""
+    def __init__(self, *children, stagger=0):
+        self.children = children
+        self.stagger = stagger
+        self.duration = max((i * stagger + child.duration for i, child in enumerate(children)), default=0)
+
+    def _offset(self, i, interval):
+        return int(round(i * self.stagger / interval))
+
+    def _length(self, interval):
+        return max((self._offset(i, interval) + child._length(interval)
+                    for i, child in enumerate(self.children)), default=0)
+
+    def _tracks(self, interval, start, widget):
+        tracks = []
+        for i, child in enumerate(self.children):
+            tracks.extend(child._tracks(interval, start + self._offset(i, interval), widget))
+        return tracks
+
+
+def stagger(children, each):
+    """Parallel(*children) with child i starting i * `each` ms late."""
+    return Parallel(*children, stagger=each)
+
+
+class Repeat(Timeline):
+    def __init__(self, child, count=None, yoyo=False):
+        self.child = child
+        self.count = count
+        self.yoyo = yoyo
+        self.duration = math.inf if count is None else child.duration * count
+
+    def _length(self, interval):
+        if self.count is None:
+            raise ValueError("an endless repeat() can only be the outermost timeline")
+        return self.child._length(interval) * self.count
+
+    def _tracks(self, interval, start, widget):
+        if self.count is None:
+            raise ValueError("an endless repeat() can only be the outermost timeline")
+        period = self.child._length(interval)
+        tracks = self.child._tracks(interval, 0, widget)
+        result = []
+        for k in range(self.count):
+            reverse = self.yoyo and k % 2 == 1
+            for track in tracks:
+                result.append(track.shifted(start + k * period, reverse, period))
+        return result
+
+
+class TimelineAnimation(Animation):
+    """
+    Plays a Compiled timeline on one or more widgets, widget i running
+    i * `stagger` frames behind the first. The frame index comes straight
+    from the clock, and a value is only written when it changed. It owns
+    each animated property of each widget like a single-property tween:
+    it retires the tweens already running there, and a tween started
+    later takes over that property of that widget only.
+    """
+    __slots__ = ("compiled", "targets", "offsets", "batch", "last", "total", "active")
+
+    def __init__(self, compiled, widgets, stagger=0, on_complete=None, name=None):
+        self.compiled = compiled
+        self.targets = widgets
+        self.offsets = [int(round(i * stagger / compiled.interval)) for i in range(len(widgets))]
+        self.total = compiled.frames - 1 + (self.offsets[-1] if widgets else 0)
+        self.last = [[None] * len(compiled.tracks) for _ in widgets]
+        # per widget, the indices of the tracks it still owns
+        self.active = [list(range(len(compiled.tracks))) for _ in widgets]
+        duration = math.inf if compiled.loop else self.total * compiled.interval / 1000.0
+        props = {_slot_property(track.prop) for track in compiled.tracks}
+        super().__init__(widgets[0], duration, None, on_complete, name=name or f"timeline on {len(widgets)}",
+                         slot={(widget, prop) for widget in widgets for prop in props})
+        self.batch = AnimationManager.for_widget(widgets[0]).batch
+
+    def _step(self, now):
+        if not self.running:
+            return False
+        compiled = self.compiled
+        frame = int((now - self.start_time) * 1000.0 / compiled.interval + 0.5)
+        if not compiled.loop:
+            frame = min(frame, self.total)
+        for widget, offset, last, active in zip(self.targets, self.offsets, self.last, self.active):
+            self._apply(widget, frame - offset, last, active)
+        if compiled.loop or frame < self.total:
+            return True
+        self.running = False
+        if self.on_complete:
+            self.on_complete()
+        self._finish(True)
+        return False
+
+    def _drop(self, key):
+        widget, prop = key
+        tracks = self.compiled.tracks
+        for i, target in enumerate(self.targets):
+            if target is widget:
+                self.active[i] = [t for t in self.active[i] if _slot_property(tracks[t].prop) != prop]
+        return True
+
+    def _apply(self, widget, frame, last, active):
+        if frame < 0 or not active:
+            return
+        compiled = self.compiled
+        period = compiled.frames - 1
+        if compiled.loop and period > 0:
+            cycle, frame = divmod(frame, period)
+            if compiled.yoyo and cycle % 2:
+                frame = period - frame
+        options = None
+        place = None
+        tracks = compiled.tracks
+        for t in active:
+            track = tracks[t]
+            i = frame - track.start
+            if i < 0:
+                continue
+            # a skipped frame must not leave a finished track short of its end
+            i = min(i, len(track) - 1)
+            value = track.value(i)
+            if value == last[t]:
+                continue
+            last[t] = value
+            prop = track.prop
+            if prop == "position":
+                place = place or {}
+                place["x"], place["y"] = int(value[0]), int(value[1])
+            elif prop in PLACE_PROPERTIES:
+                place = place or {}
+                place[prop] = int(value) if prop in ("x", "y") else value
+            elif prop == "alpha":
+                widget.attributes("-alpha", value)
+            else:
+                options = options or {}
+                options[prop] = value
+        if options:
+            self.batch.write(widget, **options)
+        if place:
+            self.batch.place(widget, **place)
@@ -0,0 +1,124 @@
+import json
+import os
+import signal
+import tempfile
+import threading
+import time
+from collections import deque
+
+# record_call kind -> trace category; other kinds are Tk writes
+_CATEGORIES = {"command": "input", "after": "scheduler"}
+
+
+class Tracer:
+    """
+    Bounded record of what the frame loop did, for loading a session into
+    a trace viewer: a span per frame, update_func, configure/place/coords
+    write (batched or direct from a wrapper, both timed in
+    WriteBatch._call), after() call and Button/Switch command. Installed with
+    AnimationManager.enable_tracing(); it takes the profiler's hooks, and
+    an installed Profiler keeps receiving them through `inner`.
+    """
+    def __init__(self, capacity=100000, inner=None):
+        # (category, name, start, seconds, widget or None); widget paths are
+        # only turned into strings on export
+        self.spans = deque(maxlen=capacity)
+        self.inner = inner
+        self.origin = time.perf_counter()
+        self.thread = threading.get_ident()
+        self._previous_handler = None
+        self._signum = None
+
+    def __getattr__(self, name):
+        # stats(), reset() and friends of the wrapped Profiler
+        inner = self.__dict__.get("inner")
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    # --- profiler hooks ---
+    def record_call(self, widget, kind, seconds=0.0):
+        self.spans.append((_CATEGORIES.get(kind, "tk"), kind, time.perf_counter() - seconds, seconds, widget))
+        if self.inner is not None:
+            self.inner.record_call(widget, kind, seconds)
+
+    def timed(self, widget, kind, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record_call(widget, kind, time.perf_counter() - start)
+
+    def record_animation(self, animation, seconds):
+        # the name, not the animation: a span must not keep its tween, frames
+        # or callbacks alive after it finished
+        self.spans.append(("animation", animation.name, time.perf_counter() - seconds, seconds, None))
+        if self.inner is not None:
+            self.inner.record_animation(animation, seconds)
+
+    def record_frame(self, seconds):
+        self.spans.append(("frame", "frame", time.perf_counter() - seconds, seconds, None))
+        if self.inner is not None:
+            self.inner.record_frame(seconds)
+
+    # --- export ---
+    def events(self):
+        """The buffered spans as Chrome trace events (timestamps in microseconds)."""
+        pid, tid = os.getpid(), self.thread
+        events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "tkinterpp"}},
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "Tk main loop"}},
+        ]
+        origin = self.origin
+        for category, name, start, seconds, widget in list(self.spans):
+            event = {"name": name, "cat": category, "ts": round((start - origin) * 1e6, 3), "pid": pid, "tid": tid}
+            if seconds:
+                event["ph"] = "X"
+                event["dur"] = round(seconds * 1e6, 3)
+            else:
+                event["ph"] = "i"
+                event["s"] = "t"
+            if widget is not None:
+                event["args"] = {"widget": str(widget)}
+            events.append(event)
+        return events
+
+    def dump(self, path=None):
+        """
+        Write the buffer as trace-event JSON, loadable in Perfetto or
+        chrome://tracing. Returns the path; defaults to a timestamped file
+        in the temp directory.
+        """
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(tempfile.gettempdir(), f"tkinterpp-{os.getpid()}-{stamp}.trace.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, path)
+        return path
+
+    def dump_on_signal(self, signum=getattr(signal, "SIGUSR1", None), path=None):
+        """
+        Dump to `path` whenever the process gets `signum` (SIGUSR1 by
+        default, e.g. `kill -USR1 <pid>`), replacing its current handler
+        until stop_signal(). Must be called on the main thread. Python runs
+        the handler only once Tk hands control back to it, so the dump is
+        written when the main loop next processes an event or after()
+        callback; a busy or fully idle app may dump late.
+        """
+        if signum is None:
+            raise ValueError("this platform has no SIGUSR1; pass another signal")
+        self.stop_signal()
+        self._previous_handler = signal.signal(signum, lambda number, frame: self.dump(path))
+        self._signum = signum
+
+    def stop_signal(self):
+        if self._signum is not None:
+            previous = self._previous_handler
+            signal.signal(self._signum, signal.SIG_DFL if previous is None else previous)
+            self._signum = None
+            self._previous_handler = None
+
+    def clear(self):
+        self.spans.clear()
@@ -1,37 +1,191 @@
 import json
 import os
+import weakref
 from tkinter import ttk
 
+from .animation import Animation, AnimationManager
+
+THEME_DIR = os.path.join(os.path.dirname(__file__), "themes")
+CATALOG = os.path.join(THEME_DIR, "theme.json")
+REQUIRED_KEYS = ("bg", "fg", "button_bg", "button_fg", "entry_bg", "entry_fg", "accent")
+
+# path -> (mtime_ns, {theme name: theme dict}); parsed once per process and
+# re-read only when the file changes on disk
+_files = {}
+# (path, mtime_ns, theme name) -> compiled style operations
+_compiled = {}
+# root -> compiled operations last applied to it
+_applied = weakref.WeakKeyDictionary()
+# theme key -> {wrapper: tkinter widget}, for every live themed wrapper
+_themed = {}
+
+
+def register_themed(wrapper, widget):
+    """
+    Track `wrapper` so theme switches reach it. `wrapper.theme_options` maps
+    theme keys to the widget options they drive. Only a weak reference to
+    the wrapper is kept.
+    """
+    for key in wrapper.theme_options:
+        _themed.setdefault(key, weakref.WeakKeyDictionary())[wrapper] = widget
+
+
+def validate_theme(name, theme):
+    if not isinstance(theme, dict):
+        raise ValueError(f"theme {name!r} must be an object, got {type(theme).__name__}")
+    for key in REQUIRED_KEYS:
+        value = theme.get(key)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"theme {name!r} is missing color {key!r}")
+
+
+def _load_file(path, single=None):
+    mtime = os.stat(path).st_mtime_ns
+    cached = _files.get(path)
+    if cached is not None and cached[0] == mtime:
+        return mtime, cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    themes = {single: data} if single else data
+    for name, theme in themes.items():
+        validate_theme(name, theme)
+    _files[path] = (mtime, themes)
+    return mtime, themes
+
+
+def _locate(theme_name):
+    """
+    Find the file that defines `theme_name`. Each bundled theme has its own
+    themes/<name>.json, so loading one theme parses only that file; names
+    without a file are looked up in a themes/theme.json catalog if present.
+    """
+    # the name becomes a path: no separators, dots or drive letters
+    if not isinstance(theme_name, str) or not theme_name.isidentifier():
+        raise ValueError(f"invalid theme name: {theme_name!r}")
+    path = os.path.join(THEME_DIR, theme_name + ".json")
+    if theme_name != "theme" and os.path.isfile(path):
+        mtime, themes = _load_file(path, single=theme_name)
+        return path, mtime, themes[theme_name]
+    if os.path.isfile(CATALOG):
+        mtime, themes = _load_file(CATALOG)
+        return CATALOG, mtime, themes.get(theme_name)
+    return None, None, None
+
+
+def load_themes():
+    """Every available theme by name; this parses all theme files."""
+    themes = {}
+    if os.path.isfile(CATALOG):
+        themes.update(_load_file(CATALOG)[1])
+    for entry in sorted(os.listdir(THEME_DIR)):
+        name, ext = os.path.splitext(entry)
+        if ext == ".json" and name != "theme":
+            path = os.path.join(THEME_DIR, entry)
+            themes[name] = _load_file(path, single=name)[1][name]
+    return themes
+
+
+def load_theme(theme_name, fallback="default"):
+    path, mtime, theme = _locate(theme_name)
+    if theme is None and fallback:
+        theme_name = fallback
+        path, mtime, theme = _locate(fallback)
+    if theme is None:
+        raise KeyError(theme_name)
+    return theme_name, dict(theme), (path, mtime, theme_name)
+
+
+def compile_theme(theme, key=None):
+    """Turn a theme dict into the list of ttk.Style calls that apply it."""
+    if key is not None and key in _compiled:
+        return _compiled[key]
+    ops = (
+        ("configure", "TButton", {
+            "background": theme["button_bg"],
+            "foreground": theme["button_fg"],
+            "font": ("Arial", 12),
+            "padding": 8,
+            "borderwidth": 0,
+        }),
+        ("map", "TButton", {
+            "background": [("active", theme["accent"])],
+        }),
+    )
+    if key is not None:
+        _compiled[key] = ops
+    return ops
+
+
 class ttkpp:
     def __init__(self, theme_name="default", root=None):
-        self.theme_name = theme_name
-        self.themes = self.load_themes()
-        self.theme = self.themes.get(self.theme_name, self.themes["default"])
+        self.theme_name, self.theme, self._key = load_theme(theme_name)
+        self.ops = compile_theme(self.theme, self._key)
 
         self.root = root
         self.apply_theme()
 
+    @property
+    def themes(self):
+        return self.load_themes()
+
     def load_themes(self):
-        path = os.path.join(os.path.dirname(__file__), "themes", "theme.json")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_themes()
 
     def apply_theme(self):
         if self.root:
             self.root.configure(bg=self.theme["bg"])
-        style = ttk.Style()
-        style.theme_use("clam")
-
-        style.configure(
-            "TButton",
-            background=self.theme["button_bg"],
-            foreground=self.theme["button_fg"],
-            font=("Arial", 12),
-            padding=8,
-            borderwidth=0
-        )
-
-        style.map(
-            "TButton",
-            background=[("active", self.theme["accent"])]
-        )
+            if _applied.get(self.root._root()) is self.ops:
+                return
+        style = ttk.Style(self.root)
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
+
+        for op, name, options in self.ops:
+            getattr(style, op)(name, **options)
+        if self.root:
+            _applied[self.root._root()] = self.ops
+
+    def switch_theme(self, theme_name, duration=0):
+        """
+        Switch to another theme in place. Only theme keys whose value changed
+        are pushed, and only to the registered wrappers that use them; with
+        `duration` (ms) colors cross-fade through the animation engine.
+        Returns the dict of changed keys.
+        """
+        old = self.theme
+        self.theme_name, self.theme, self._key = load_theme(theme_name)
+        self.ops = compile_theme(self.theme, self._key)
+        changed = {k: v for k, v in self.theme.items() if old.get(k) != v}
+        if not changed:
+            return changed
+
+        root = self.root._root() if self.root else None
+        updates = {}
+        for key, value in changed.items():
+            for wrapper, widget in list(_themed.get(key, {}).items()):
+                if root is not None and widget._root() is not root:
+                    continue
+                entry = updates.get(wrapper)
+                if entry is None:
+                    entry = updates[wrapper] = (widget, {})
+                entry[1][wrapper.theme_options[key]] = (old.get(key), value)
+
+        batches = set()
+        for wrapper, (widget, options) in updates.items():
+            wrapper.theme = self.theme
+            if wrapper.theme_redraw:
+                wrapper.apply_theme()
+                continue
+            batch = AnimationManager.for_widget(widget).batch
+            batches.add(batch)
+            for option, (before, after) in options.items():
+                if duration and before:
+                    Animation.animate_color(widget, before, after, duration, target=option)
+                else:
+                    batch.write(widget, **{option: after})
+        for batch in batches:
+            batch.flush()
+
+        self.apply_theme()
+        return changed
@@ -0,0 +1,212 @@
+import os
+import sys
+import threading
+import tkinter
+import weakref
+
+from .animation import AnimationManager
+
+
+def _close_pipe(read, write):
+    os.close(read)
+    os.close(write)
+
+
+class UpdateChannel:
+    """
+    Thread-safe way to update widgets from worker threads. post() may be
+    called from any thread; the Tk main loop drains the channel once per
+    frame and only the latest value per (widget, property) is applied.
+
+    Create the channel on the main thread (e.g. by touching Tkpp.updates)
+    before starting the workers.
+
+    Where Tk can watch a file descriptor (Unix), the first post() after a
+    drain writes to a pipe and wakes the loop, so an idle channel costs
+    nothing. Elsewhere the channel polls, backing off to `idle_interval`
+    ms while nothing is posted. Nothing is drained while the window is
+    hidden and the frame clock is suspended. Destroying the root closes
+    the channel.
+    """
+    _channels = weakref.WeakKeyDictionary()
+
+    def __init__(self, root, interval=16, max_pending=None, idle_interval=250):
+        # weak: the registry value must not keep its own key alive
+        self._root = weakref.ref(root)
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.posted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.applied = 0
+        self.drains = 0
+        self._after_id = None
+        self._delay = interval
+        self._closed = False
+        self._wakeup = None
+        UpdateChannel._channels[root] = self
+        self._watch_pipe(root)
+        root.bind("<Map>", self._on_map, add="+")
+        root.bind("<Destroy>", self._on_destroy, add="+")
+        if self._wakeup is None:
+            self._schedule(interval)
+
+    @property
+    def root(self):
+        return self._root()
+
+    @classmethod
+    def for_widget(cls, widget):
+        """Return the channel of `widget`'s root, creating one if needed."""
+        root = widget._root()
+        channel = cls._channels.get(root)
+        if channel is None or channel._closed:
+            channel = cls(root)
+        return channel
+
+    @property
+    def depth(self):
+        return len(self._pending)
+
+    def stats(self):
+        return {
+            "depth": self.depth,
+            "posted": self.posted,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "applied": self.applied,
+            "drains": self.drains,
+        }
+
+    def post(self, widget, prop, value):
+        """
+        Queue `widget.<prop> = value`. Returns False if the update was
+        dropped because max_pending distinct updates are already waiting.
+        """
+        key = (widget, prop)
+        with self._lock:
+            wake = not self._pending
+            if key in self._pending:
+                self.coalesced += 1
+            elif self.max_pending is not None and len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending[key] = value
+            self.posted += 1
+        if wake and self._wakeup is not None:
+            try:
+                os.write(self._wakeup[1], b"\0")
+            except OSError:
+                pass  # the pipe is full, so a wakeup is already pending
+        return True
+
+    def drain(self):
+        """Apply everything posted so far. Must run on the Tk main thread."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+        self.drains += 1
+
+        batches = set()
+        for (widget, prop), value in pending.items():
+            try:
+                setter = getattr(widget, "set_" + prop, None)
+                if setter is not None:
+                    setter(value)
+                else:
+                    target = getattr(widget, "widget", widget)
+                    batch = AnimationManager.for_widget(target).batch
+                    batch.write(target, **{prop: value})
+                    batches.add(batch)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        for batch in batches:
+            batch.flush()
+        self.applied += len(pending)
+        return len(pending)
+
+    # --- scheduling ---
+    def _watch_pipe(self, root):
+        createfilehandler = getattr(getattr(root, "tk", None), "createfilehandler", None)
+        if createfilehandler is None:
+            return
+        read, write = os.pipe()
+        os.set_blocking(read, False)
+        os.set_blocking(write, False)
+        try:
+            createfilehandler(read, tkinter.READABLE, self._on_wakeup)
+        except Exception:
+            _close_pipe(read, write)
+            return
+        self._wakeup = (read, write)
+        self._close_pipe = weakref.finalize(self, _close_pipe, read, write)
+
+    def _on_wakeup(self, fd, mask):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        # wait one frame so posts arriving together are applied together
+        self._schedule(self.interval)
+
+    def _on_map(self, event):
+        if event.widget is self.root and self._pending:
+            self._delay = self.interval
+            self._schedule(0, replace=True)
+
+    def _on_destroy(self, event):
+        # release the pipe and Tcl file handler with the interpreter
+        if event.widget is self.root:
+            self.close()
+
+    def _suspended(self):
+        manager = AnimationManager._managers.get(self.root)
+        return manager is not None and manager.suspended_at is not None
+
+    def _schedule(self, delay, replace=False):
+        if self._closed:
+            return
+        if self._after_id is not None:
+            if not replace:
+                return
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(int(delay), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        if self._suspended():
+            # hidden: keep the updates; <Map> drains them, a slow retry covers
+            # a clock resumed without one
+            if self._pending or self._wakeup is None:
+                self._schedule(self.idle_interval)
+            return
+        applied = 0
+        try:
+            applied = self.drain()
+        finally:
+            if self._wakeup is None:
+                self._delay = self.interval if applied else min(self._delay * 2, self.idle_interval)
+                self._schedule(self._delay)
+
+    def close(self):
+        self._closed = True
+        root = self.root
+        if self._after_id is not None and root is not None:
+            try:
+                root.after_cancel(self._after_id)
+            except tkinter.TclError:
+                pass  # the interpreter is being torn down
+        self._after_id = None
+        if self._wakeup is not None:
+            read = self._wakeup[0]
+            self._wakeup = None
+            try:
+                root.tk.deletefilehandler(read)
+            except Exception:
+                pass  # the root is gone or already destroyed
+            self._close_pipe()
@@ -1,21 +1,173 @@
+import tkinter
+import tkinter.font
+
+from .animation import Animation, AnimationManager
+from . import fonts
+from .ttkpp import register_themed
+
+# geometry manager -> options it accepts; anything else is dropped before
+# the call reaches Tk. "round" is taken out first by Widget._take_round
+GEOMETRY_OPTIONS = {
+    "pack": frozenset({"after", "anchor", "before", "expand", "fill", "in", "in_",
+                       "ipadx", "ipady", "padx", "pady", "side"}),
+    "grid": frozenset({"column", "columnspan", "in", "in_", "ipadx", "ipady",
+                       "padx", "pady", "row", "rowspan", "sticky"}),
+    "place": frozenset({"anchor", "bordermode", "height", "in", "in_", "relheight",
+                        "relwidth", "relx", "rely", "width", "x", "y"}),
+}
+
+
+def _filter_geom_kwargs(kwargs, manager):
+    # normalize padding -> padx/pady
+    if "padding" in kwargs:
+        p = kwargs.pop("padding")
+        if isinstance(p, (list, tuple)) and len(p) >= 2:
+            kwargs.setdefault("padx", p[0])
+            kwargs.setdefault("pady", p[1])
+        else:
+            kwargs.setdefault("padx", p)
+            kwargs.setdefault("pady", p)
+    allowed = GEOMETRY_OPTIONS[manager]
+    return {k: v for k, v in kwargs.items() if k in allowed}
+
+
+def _as_font(widget, value):
+    # cget("font") gives a named font or a description; apply_style wants a Font
+    if isinstance(value, tkinter.font.Font):
+        return value
+    try:
+        return tkinter.font.Font(root=widget, name=str(value), exists=True)
+    except tkinter.TclError:
+        return tkinter.font.Font(root=widget, font=value)
+
 
 class Widget:
-    def __init__(self, master=None):
+    """
+    Shared base of the widget wrappers. `widget` is the wrapped tkinter
+    widget. Instances use __slots__ and keep no per-animation state: that
+    lives in the animation engine.
+    """
+    __slots__ = ("master", "widget", "theme", "__weakref__")
+
+    # theme key -> widget option, used by apply_theme and theme switching
+    theme_options = {}
+    # True for wrappers that redraw themselves via apply_theme() on a theme
+    # switch instead of having theme_options written to the widget
+    theme_redraw = False
+    # Model-bindable property -> configure option written through the batch;
+    # other bound properties go through the wrapper's set_<prop> method
+    bind_options = {}
+
+    def __init__(self, master=None, theme=None):
         self.master = master
         self.widget = None
+        self.theme = theme
+
+    def _init_theme(self):
+        if self.theme:
+            self.apply_theme()
+            register_themed(self, self.widget)
 
     def pack(self, **kwargs):
-        if self.widget:
-            self.widget.pack(**kwargs)
+        if self.widget is not None:
+            self._take_round(kwargs)
+            self._call("pack", self.widget.pack, _filter_geom_kwargs(kwargs, "pack"))
 
     def grid(self, **kwargs):
-        if self.widget:
-            self.widget.grid(**kwargs)
+        if self.widget is not None:
+            self._take_round(kwargs)
+            self._call("grid", self.widget.grid, _filter_geom_kwargs(kwargs, "grid"))
 
     def place(self, **kwargs):
-        if self.widget:
-            self.widget.place(**kwargs)
+        if self.widget is not None:
+            self._take_round(kwargs)
+            self._call("place", self.widget.place, _filter_geom_kwargs(kwargs, "place"))
+
+    def _take_round(self, kwargs):
+        # round=<radius> in a geometry call rounds wrappers that support it
+        radius = kwargs.pop("round", None)
+        set_round = getattr(self, "set_round", None)
+        if radius and set_round is not None:
+            set_round(8 if radius is True else radius)
 
     def config(self, **kwargs):
-        if self.widget:
-            self.widget.config(**kwargs)
\ No newline at end of file
+        if self.widget is not None:
+            self._configure(**kwargs)
+
+    # direct writes go through the root's WriteBatch, which times them for
+    # an installed profiler or tracer
+    def _configure(self, **options):
+        AnimationManager.for_widget(self.widget).batch.configure(self.widget, **options)
+
+    def _call(self, kind, func, options):
+        AnimationManager.for_widget(self.widget).batch.call(self.widget, kind, func, **options)
+
+    def apply_theme(self):
+        self._configure(**{
+            option: self.theme[key] for key, option in self.theme_options.items() if key in self.theme
+        })
+
+    # --- animation helpers ---
+    def animate_bg(self, to_color, duration=300, steps=None):
+        """
+        Animate background color from current to to_color over duration (ms).
+        Returns a cancel() function to stop the animation early.
+        """
+        widget = self.widget
+        start_color = AnimationManager.for_widget(widget).batch.cget(widget, 'bg') or '#ffffff'
+        animation = Animation.animate_color(widget, start_color, to_color, duration, target="bg", steps=steps)
+        return animation.stop
+
+    def animate_fg(self, to_color, duration=300, steps=None):
+        widget = self.widget
+        start_color = AnimationManager.for_widget(widget).batch.cget(widget, 'fg') or '#000000'
+        animation = Animation.animate_color(widget, start_color, to_color, duration, target="fg", steps=steps)
+        return animation.stop
+
+    def animate_move(self, to_x, to_y, duration=300, steps=None):
+        """
+        Animate widget position. Works only if widget is managed by place()
+        or hosted by a compositor. Returns a cancel() function.
+        """
+        widget = self.widget
+        try:
+            current = (widget.winfo_x(), widget.winfo_y())
+        except Exception:
+            return lambda: None
+        animation = Animation.animate_move(widget, current, (to_x, to_y), duration, steps)
+        return animation.stop
+
+    def current_style(self, keys):
+        """The widget's current values of the style properties in `keys`."""
+        widget = self.widget
+        batch = AnimationManager.for_widget(widget).batch
+        style = {}
+        for key in keys:
+            if key == "padding":
+                style[key] = (batch.cget(widget, "padx"), batch.cget(widget, "pady"))
+            elif key == "font":
+                style[key] = _as_font(widget, batch.cget(widget, "font"))
+            elif key in ("bg", "fg", "borderwidth", "relief"):
+                style[key] = batch.cget(widget, key)
+        return style
+
+    def apply_style(self, style):
+        widget = self.widget
+        batch = AnimationManager.for_widget(widget).batch
+        if "bg" in style:
+            batch.write(widget, bg=style["bg"])
+        if "fg" in style:
+            batch.write(widget, fg=style["fg"])
+        if "font" in style:
+            batch.write(widget, font=fonts.get(style["font"], widget))
+        if "padding" in style:
+            p = style["padding"]
+            if isinstance(p, (list, tuple)) and len(p) >= 2:
+                batch.write(widget, padx=p[0], pady=p[1])
+            else:
+                batch.write(widget, padx=p, pady=p)
+        if "borderwidth" in style:
+            batch.write(widget, borderwidth=style["borderwidth"])
+        if "relief" in style:
+            batch.write(widget, relief=style["relief"])
+        batch.flush(widget)
@@ -0,0 +1,15 @@
+import importlib
+
+__all__ = ["Button", "CanvasSwitch", "Entry", "Label", "Switch", "Table"]
+
+_modules = {"Button": "button", "CanvasSwitch": "switch", "Entry": "entry", "Label": "label", "Switch": "switch", "Table": "table"}
+
+
+def __getattr__(name):
+    # each widget module is only imported when its class is first used
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
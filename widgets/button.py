@@ -1,156 +1,102 @@
 import tkinter
 import time
 
-class Button:
-    def __init__(self, master=None, text="", command=None):
-        self.button = tkinter.Button(master, text=text, command=command)
-
-    def _filter_geom_kwargs(self, kwargs):
-        allowed = {"after","anchor","before","expand","fill","in","ipadx","ipady","padx","pady","side"}
-        # normalize padding -> padx/pady
-        if "padding" in kwargs:
-            p = kwargs.pop("padding")
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                kwargs.setdefault("padx", p[0])
-                kwargs.setdefault("pady", p[1])
-            else:
-                kwargs.setdefault("padx", p)
-                kwargs.setdefault("pady", p)
-        # remove styling-only or unknown keys
-        kwargs.pop("round", None)
-        return {k: v for k, v in kwargs.items() if k in allowed}
-
-    def pack(self, **kwargs):
-        self.button.pack(**self._filter_geom_kwargs(kwargs))
-
-    def grid(self, **kwargs):
-        self.button.grid(**self._filter_geom_kwargs(kwargs))
-
-    def place(self, **kwargs):
-        self.button.place(**self._filter_geom_kwargs(kwargs))
-
-    def config(self, **kwargs):
-        self.button.config(**kwargs)
+from .. import assets
+from ..animation import AnimationManager
+from ..widget import Widget
+
+class Button(Widget):
+    __slots__ = ("_listeners", "_round")
+
+    theme_options = {"button_bg": "bg", "button_fg": "fg", "accent": "activebackground"}
+    bind_options = {"text": "text", "fg": "fg", "bg": "bg"}
+
+    def __init__(self, master=None, text="", command=None, theme=None):
+        super().__init__(master, theme)
+        self._listeners = None
+        self._round = None
+        self.widget = tkinter.Button(master, text=text, command=self._command_hook(command))
+        self._init_theme()
+
+    @property
+    def button(self):
+        return self.widget
+
+    def _command_hook(self, command):
+        def invoke():
+            result = None
+            if command is not None:
+                profiler = AnimationManager.for_widget(self.widget).profiler
+                if profiler is None:
+                    result = command()
+                else:
+                    result = profiler.timed(self.widget, "command", command)
+            for listener in list(self._listeners or ()):
+                listener()
+            return result
+        return invoke
+
+    def add_command_listener(self, func):
+        """Call func() every time the button's command fires."""
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(func)
+
+    def remove_command_listener(self, func):
+        if self._listeners and func in self._listeners:
+            self._listeners.remove(func)
+
+    @property
+    def theme_redraw(self):
+        # a rounded button re-requests its images instead of taking the colors
+        return self._round is not None
+
+    def apply_theme(self):
+        if self._round is None:
+            super().apply_theme()
+        else:
+            self.set_round(self._round[0])
+
+    def set_round(self, radius=8):
+        """
+        Draw the button as a rounded rectangle with a soft shadow in its
+        theme colors, with hover and pressed states. The images come from
+        the asset pipeline; the first time a size is used they are rendered
+        off the UI thread and the button stays flat until they arrive.
+        """
+        widget = self.widget
+        if self._round is None:
+            # radius, width, height, state -> image, request generation
+            self._round = [radius, widget.winfo_reqwidth(), widget.winfo_reqheight() + 2, {}, 0]
+            for sequence, state in (("<Enter>", "hover"), ("<Leave>", "normal"),
+                                    ("<ButtonPress-1>", "active"), ("<ButtonRelease-1>", "hover")):
+                widget.bind(sequence, lambda event, state=state: self._show_round(state), add="+")
+        self._round[0] = radius
+        self._round[4] += 1
+        _, width, height, images, generation = self._round
+        images.clear()
+        theme = assets.resolve_theme(self)
+
+        def ready(state, image):
+            if self._round[4] != generation:
+                return  # an earlier set_round, e.g. in the previous theme
+            images[state] = image
+            if state == "normal":
+                self._configure(image=image, compound="center", relief="flat", borderwidth=0,
+                                highlightthickness=0, padx=0, pady=0,
+                                bg=theme["bg"], activebackground=theme["bg"])
+        assets.AssetPipeline.for_widget(widget).request_states(theme, width, height, radius, "button", ready)
+
+    def _show_round(self, state):
+        image = self._round[3].get(state)
+        if image is not None and self._round[3].get("normal") is not None:
+            self._configure(image=image)
 
     def set_text(self, text):
-        self.button.config(text=text)
+        self._configure(text=text)
 
     def get_text(self):
-        return self.button.cget("text")
-
-    # --- animation helpers ---
-    def _hex_to_rgb(self, hex_color):
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 3:
-            hex_color = ''.join(c*2 for c in hex_color)
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-    def _color_to_rgb(self, color):
-        # try hex first, otherwise use winfo_rgb
-        try:
-            if isinstance(color, str) and color.startswith('#'):
-                return self._hex_to_rgb(color)
-            r, g, b = self.button.winfo_rgb(color)
-            return (r // 256, g // 256, b // 256)
-        except Exception:
-            return (255, 255, 255)
-
-    def _rgb_to_hex(self, rgb):
-        return '#%02x%02x%02x' % (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-
-    def animate_bg(self, to_color, duration=300, steps=None):
-        """
-        Animate background color from current to to_color over duration (ms).
-        Returns a cancel() function to stop the animation early.
-        """
-        widget = self.button
-        start_color = widget.cget('bg') or widget.cget('background') or '#ffffff'
-        start_rgb = self._color_to_rgb(start_color)
-        end_rgb = self._color_to_rgb(to_color)
-        if steps is None:
-            steps = max(2, int(duration / 20))
-
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            t = step / float(steps)
-            cur = tuple(start_rgb[i] + (end_rgb[i] - start_rgb[i]) * t for i in range(3))
-            widget.config(bg=self._rgb_to_hex(cur))
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-
-        def cancel():
-            cancelled['v'] = True
-
-        return cancel
-
-    def animate_move(self, to_x, to_y, duration=300, steps=None):
-        """
-        Animate widget position. Works only if widget is managed by place().
-        Returns a cancel() function.
-        """
-        widget = self.button
-        try:
-            current_x = widget.winfo_x()
-            current_y = widget.winfo_y()
-        except Exception:
-            return lambda: None
-
-        if steps is None:
-            steps = max(2, int(duration / 20))
-
-        dx = (to_x - current_x) / float(steps)
-        dy = (to_y - current_y) / float(steps)
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            nx = int(current_x + dx * step)
-            ny = int(current_y + dy * step)
-            try:
-                widget.place_configure(x=nx, y=ny)
-            except Exception:
-                pass
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-
-        def cancel():
-            cancelled['v'] = True
-
-        return cancel
-
-    def apply_style(self, style):
-        if "bg" in style:
-            self.button.config(bg=style["bg"])
-        if "fg" in style:
-            self.button.config(fg=style["fg"])
-        if "font" in style:
-            parts = style["font"].split()
-            self.button.config(font=(parts[0], int(parts[1]), *parts[2:]))
-        if "padding" in style:
-            p = style["padding"]
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                self.button.config(padx=p[0], pady=p[1])
-            else:
-                self.button.config(padx=p, pady=p)
-        if "borderwidth" in style:
-            self.button.config(borderwidth=style["borderwidth"])
-        if "relief" in style:
-            self.button.config(relief=style["relief"])
-
+        return self.widget.cget("text")
 
 
 # compatibility: expose 'widgets' namespace so callers using module.widgets.Button work
@@ -1,137 +1,341 @@
 import tkinter
 import time
 
-class Entry:
-    def __init__(self, master=None, textvariable=None):
-        self.entry = tkinter.Entry(master, textvariable=textvariable)
-
-    def _filter_geom_kwargs(self, kwargs):
-        allowed = {"after","anchor","before","expand","fill","in","ipadx","ipady","padx","pady","side"}
-        if "padding" in kwargs:
-            p = kwargs.pop("padding")
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                kwargs.setdefault("padx", p[0])
-                kwargs.setdefault("pady", p[1])
-            else:
-                kwargs.setdefault("padx", p)
-                kwargs.setdefault("pady", p)
-        kwargs.pop("round", None)
-        return {k: v for k, v in kwargs.items() if k in allowed}
-
-    def pack(self, **kwargs):
-        self.entry.pack(**self._filter_geom_kwargs(kwargs))
-
-    def grid(self, **kwargs):
-        self.entry.grid(**self._filter_geom_kwargs(kwargs))
-
-    def place(self, **kwargs):
-        self.entry.place(**self._filter_geom_kwargs(kwargs))
-
-    def config(self, **kwargs):
-        self.entry.config(**kwargs)
+from .. import assets
+from ..completion import PrefixIndex, executor
+from ..updates import UpdateChannel
+from ..widget import Widget
+
+# keys that navigate the suggestion list instead of editing the text
+_NAVIGATION_KEYS = frozenset({"Up", "Down", "Return", "KP_Enter", "Escape", "Tab",
+                              "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"})
+
+
+def _focus_get(widget):
+    try:
+        return widget.focus_get()
+    except KeyError:
+        return None  # focus is in a widget Tk knows but tkinter does not, e.g. a combobox popdown
+
+
+class _Completer:
+    """
+    Debounced lookups for one Entry. Each keystroke restarts a `delay` ms
+    timer; when it fires the lookup runs inline or on the worker pool, and
+    background results come back through the root's UpdateChannel. Results
+    for text that has changed since are dropped.
+    """
+    def __init__(self, entry):
+        self.entry = entry
+        self.lookup = None
+        self.limit = 8
+        self.delay = 120
+        self.background = False
+        self.on_select = None
+        self.validator = None
+        self.on_validate = None
+        self.validate_delay = 300
+        self.validate_background = True
+        self.generation = 0
+        self.keystroke = None
+        self.latency = None
+        self.popup = None
+        self.listbox = None
+        self._lookup_id = None
+        self._validate_id = None
+        self._bound = False
+
+    def bind(self):
+        if self._bound:
+            return
+        widget = self.entry.widget
+        widget.bind("<KeyRelease>", self._on_key, add="+")
+        widget.bind("<Down>", lambda event: self._move(1), add="+")
+        widget.bind("<Up>", lambda event: self._move(-1), add="+")
+        widget.bind("<Return>", self._on_return, add="+")
+        widget.bind("<Escape>", lambda event: self.hide(), add="+")
+        widget.bind("<FocusOut>", lambda event: widget.after(100, self._focus_lost), add="+")
+        self._bound = True
+
+    def _on_key(self, event):
+        if event.keysym in _NAVIGATION_KEYS:
+            return
+        self.changed()
+
+    def changed(self):
+        """The text changed: restart the debounce timers."""
+        widget = self.entry.widget
+        self.generation += 1
+        self.keystroke = time.perf_counter()
+        if self.lookup is not None:
+            if self._lookup_id is not None:
+                widget.after_cancel(self._lookup_id)
+            self._lookup_id = widget.after(self.delay, self._run_lookup)
+        if self.validator is not None:
+            if self._validate_id is not None:
+                widget.after_cancel(self._validate_id)
+            self._validate_id = widget.after(self.validate_delay, self._run_validator)
+
+    def _run_lookup(self):
+        self._lookup_id = None
+        text = self.entry.get_text()
+        if not text:
+            self.hide()
+            return
+        self._run(self.lookup, text, "suggestions", self.background)
+
+    def _run_validator(self):
+        self._validate_id = None
+        self._run(self.validator, self.entry.get_text(), "validation", self.validate_background)
+
+    def _run(self, func, text, prop, background):
+        generation = self.generation
+        if not background:
+            getattr(self, "set_" + prop)((generation, func(text)))
+            return
+        channel = UpdateChannel.for_widget(self.entry.widget)
+
+        def work():
+            try:
+                result = func(text)
+            except Exception as e:
+                result = e
+            channel.post(self, prop, (generation, result))
+        executor().submit(work)
+
+    # called on the Tk thread, directly or by the UpdateChannel
+    def set_suggestions(self, result):
+        generation, items = result
+        if generation != self.generation:
+            return
+        if isinstance(items, Exception):
+            raise items
+        if self.keystroke is not None:
+            self.latency = time.perf_counter() - self.keystroke
+        self.show(list(items)[:self.limit])
+
+    def set_validation(self, result):
+        generation, value = result
+        if generation != self.generation:
+            return
+        if isinstance(value, Exception):
+            raise value
+        if self.on_validate is not None:
+            self.on_validate(value)
+
+    # --- popup ---
+    def show(self, items):
+        if not items:
+            self.hide()
+            return
+        widget = self.entry.widget
+        if self.popup is None:
+            self.popup = tkinter.Toplevel(widget)
+            self.popup.wm_overrideredirect(True)
+            self.listbox = tkinter.Listbox(self.popup, activestyle="none", exportselection=False)
+            self.listbox.pack(fill="both", expand=True)
+            # accept on press and skip the class binding, which would take
+            # the focus away from the entry
+            self.listbox.bind("<ButtonPress-1>", self._on_click)
+            theme = self.entry.theme
+            if theme:
+                self.listbox.config(**{
+                    option: theme[key] for key, option in self.entry.theme_options.items() if key in theme
+                })
+        listbox = self.listbox
+        listbox.delete(0, tkinter.END)
+        listbox.insert(0, *items)
+        listbox.config(height=len(items))
+        x = widget.winfo_rootx()
+        y = widget.winfo_rooty() + widget.winfo_height()
+        self.popup.wm_geometry(f"{widget.winfo_width()}x{listbox.winfo_reqheight()}+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+
+    def _on_click(self, event):
+        listbox = self.listbox
+        index = listbox.nearest(event.y)
+        if index >= 0:
+            listbox.selection_clear(0, tkinter.END)
+            listbox.selection_set(index)
+            self.accept()
+        return "break"
+
+    def _focus_lost(self):
+        focus = _focus_get(self.entry.widget)
+        if focus is not None and self.popup is not None:
+            path, popup = str(focus), str(self.popup)
+            if path == popup or path.startswith(popup + "."):
+                return
+        self.hide()
+
+    def hide(self):
+        if self.popup is not None:
+            self.popup.withdraw()
+
+    def visible(self):
+        return self.popup is not None and self.popup.winfo_ismapped()
+
+    def _move(self, step):
+        if not self.visible():
+            return None
+        listbox = self.listbox
+        size = listbox.size()
+        current = listbox.curselection()
+        index = (current[0] + step) % size if current else (0 if step > 0 else size - 1)
+        listbox.selection_clear(0, tkinter.END)
+        listbox.selection_set(index)
+        listbox.see(index)
+        return "break"
+
+    def _on_return(self, event):
+        if self.visible() and self.listbox.curselection():
+            self.accept()
+            return "break"
+        return None
+
+    def accept(self):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        value = self.listbox.get(selection[0])
+        self.hide()
+        self.generation += 1  # drop lookups still in flight
+        self.entry.set_text(value)
+        self.entry.widget.icursor(tkinter.END)
+        self.entry.widget.focus_set()
+        if self.on_select is not None:
+            self.on_select(value)
+
+
+class Entry(Widget):
+    __slots__ = ("_completer", "_round")
+
+    theme_options = {"entry_bg": "bg", "entry_fg": "fg"}
+
+    def __init__(self, master=None, textvariable=None, theme=None):
+        super().__init__(master, theme)
+        self._completer = None
+        self._round = None
+        self.widget = tkinter.Entry(master, textvariable=textvariable)
+        self._init_theme()
+
+    @property
+    def entry(self):
+        return self.widget
 
     def set_text(self, text):
-        self.entry.delete(0, tkinter.END)
-        self.entry.insert(0, text)
+        self.widget.delete(0, tkinter.END)
+        self.widget.insert(0, text)
 
     def get_text(self):
-        return self.entry.get()
-
-    # --- animation helpers (same approach as Button) ---
-    def _color_to_rgb(self, color):
-        try:
-            if isinstance(color, str) and color.startswith('#'):
-                hex_color = color.lstrip('#')
-                if len(hex_color) == 3:
-                    hex_color = ''.join(c*2 for c in hex_color)
-                return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            r, g, b = self.entry.winfo_rgb(color)
-            return (r // 256, g // 256, b // 256)
-        except Exception:
-            return (255, 255, 255)
-
-    def _rgb_to_hex(self, rgb):
-        return '#%02x%02x%02x' % (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-
-    def animate_bg(self, to_color, duration=300, steps=None):
-        widget = self.entry
-        start_color = widget.cget('bg') or '#ffffff'
-        start_rgb = self._color_to_rgb(start_color)
-        end_rgb = self._color_to_rgb(to_color)
-        if steps is None:
-            steps = max(2, int(duration / 20))
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            t = step / float(steps)
-            cur = tuple(start_rgb[i] + (end_rgb[i] - start_rgb[i]) * t for i in range(3))
-            widget.config(bg=self._rgb_to_hex(cur))
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-
-        def cancel():
-            cancelled['v'] = True
-
-        return cancel
-
-    def animate_move(self, to_x, to_y, duration=300, steps=None):
-        widget = self.entry
-        try:
-            current_x = widget.winfo_x()
-            current_y = widget.winfo_y()
-        except Exception:
-            return lambda: None
-        if steps is None:
-            steps = max(2, int(duration / 20))
-        dx = (to_x - current_x) / float(steps)
-        dy = (to_y - current_y) / float(steps)
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            nx = int(current_x + dx * step)
-            ny = int(current_y + dy * step)
-            try:
-                widget.place_configure(x=nx, y=ny)
-            except Exception:
-                pass
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-        def cancel():
-            cancelled['v'] = True
-        return cancel
-
-    def apply_style(self, style):
-        if "bg" in style:
-            self.entry.config(bg=style["bg"])
-        if "fg" in style:
-            self.entry.config(fg=style["fg"])
-        if "font" in style:
-            parts = style["font"].split()
-            self.entry.config(font=(parts[0], int(parts[1]), *parts[2:]))
-        if "padding" in style:
-            p = style["padding"]
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                self.entry.config(padx=p[0], pady=p[1])
-            else:
-                self.entry.config(padx=p, pady=p)
-        if "borderwidth" in style:
-            self.entry.config(borderwidth=style["borderwidth"])
-        if "relief" in style:
-            self.entry.config(relief=style["relief"])
+        return self.widget.get()
+
+    def _get_completer(self):
+        if self._completer is None:
+            self._completer = _Completer(self)
+            self._completer.bind()
+        return self._completer
+
+    def autocomplete(self, source, limit=8, delay=120, background=None, on_select=None):
+        """
+        Suggest completions while typing. `source` is a PrefixIndex, an
+        iterable of strings (indexed once here) or a callable text -> items.
+        Lookups start `delay` ms after the last keystroke; callables run on
+        the worker pool unless background=False, index lookups inline.
+        """
+        if callable(source) and not isinstance(source, PrefixIndex):
+            lookup = source
+            if background is None:
+                background = True
+        else:
+            if not isinstance(source, PrefixIndex):
+                source = PrefixIndex(source)
+            index = source
+
+            def lookup(text):
+                return index.complete(text, limit)
+        completer = self._get_completer()
+        completer.lookup = lookup
+        completer.limit = limit
+        completer.delay = delay
+        completer.background = bool(background)
+        completer.on_select = on_select
+        return source
+
+    def set_validator(self, func, on_result, delay=300, background=True):
+        """
+        Run func(text) `delay` ms after the last keystroke, on the worker
+        pool by default, and pass its result to on_result on the Tk thread.
+        """
+        completer = self._get_completer()
+        completer.validator = func
+        completer.on_validate = on_result
+        completer.validate_delay = delay
+        completer.validate_background = background
+
+    @property
+    def theme_redraw(self):
+        return self._round is not None
+
+    def apply_theme(self):
+        super().apply_theme()
+        if self._round is not None:
+            self._round_to(self.widget.winfo_width(), self.widget.winfo_height(), force=True)
+
+    def set_round(self, radius=8):
+        """
+        Give the entry a rounded frame that turns the accent color while it
+        has focus. The frame is a label behind the flat entry showing
+        images from the asset pipeline, re-requested when the entry is
+        resized.
+        """
+        widget = self.widget
+        if self._round is None:
+            label = tkinter.Label(widget.master, borderwidth=0, highlightthickness=0)
+            # radius, width, height, state -> image, backing label, request generation
+            self._round = [radius, 0, 0, {}, label, 0]
+            widget.config(relief="flat", borderwidth=0, highlightthickness=0)
+            widget.bind("<Configure>", lambda event: self._round_to(event.width, event.height), add="+")
+            widget.bind("<FocusIn>", lambda event: self._show_round("focus"), add="+")
+            widget.bind("<FocusOut>", lambda event: self._show_round("normal"), add="+")
+        self._round[0] = radius
+        self._round_to(widget.winfo_reqwidth(), widget.winfo_reqheight(), force=True)
+
+    def _round_to(self, width, height, force=False):
+        radius, old_width, old_height, images, label, generation = self._round
+        if width <= 1 or (not force and (width, height) == (old_width, old_height)):
+            return
+        self._round[1:3] = width, height
+        generation = self._round[5] = generation + 1
+        images.clear()
+        # the frame reaches past the entry far enough to clear the corners
+        pad = radius // 2 + 1
+        widget = self.widget
+        theme = assets.resolve_theme(self)
+
+        def ready(state, image):
+            if self._round[5] != generation:
+                return  # resized or re-themed while rendering
+            images[state] = image
+            if state == "normal":
+                label.config(bg=theme["bg"])
+                label.place(in_=widget, x=-pad, y=-pad, width=width + 2 * pad, height=height + 2 * pad)
+                label.lower(widget)
+                self._show_round("focus" if _focus_get(widget) is widget else "normal")
+        assets.AssetPipeline.for_widget(widget).request_states(
+            theme, width + 2 * pad, height + 2 * pad, radius, "entry", ready)
+
+    def _show_round(self, state):
+        images = self._round[3]
+        image = images.get(state) or images.get("normal")
+        if image is not None:
+            self._round[4].config(image=image)
+
+    @property
+    def suggestion_latency(self):
+        """Seconds from the last keystroke to its suggestions being shown."""
+        return self._completer.latency if self._completer is not None else None
 
 # compatibility: expose 'widgets' namespace so callers using module.widgets.Entry work
 try:
@@ -1,156 +1,218 @@
+import math
 import tkinter
 import time
+import weakref
 
-class Switch:
-    def __init__(self, master=None, on_text="On", off_text="Off", command=None):
+from .. import color, fonts
+from ..animation import Animation, AnimationManager
+from ..widget import Widget
+
+class Switch(Widget):
+    __slots__ = ("var", "on_text", "off_text", "_listeners")
+
+    theme_options = {"bg": "bg", "fg": "fg", "accent": "activebackground"}
+
+    def __init__(self, master=None, on_text="On", off_text="Off", command=None, theme=None):
+        super().__init__(master, theme)
+        self._listeners = None
         self.var = tkinter.BooleanVar()
-        self.switch = tkinter.Checkbutton(
+        self.widget = tkinter.Checkbutton(
             master,
             text=off_text,
             variable=self.var,
-            command=self._toggle_command(command, on_text, off_text)
+            command=self._toggle_command(command)
         )
         self.on_text = on_text
         self.off_text = off_text
+        self._init_theme()
 
-    def _toggle_command(self, command, on_text, off_text):
+    @property
+    def switch(self):
+        return self.widget
+
+    def _toggle_command(self, command):
         def toggle():
-            if self.var.get():
-                self.switch.config(text=on_text)
-            else:
-                self.switch.config(text=off_text)
+            self._show(self.var.get(), animate=True)
             if command:
-                command()
+                profiler = AnimationManager.for_widget(self.widget).profiler
+                if profiler is None:
+                    command()
+                else:
+                    profiler.timed(self.widget, "command", command)
+            for listener in list(self._listeners or ()):
+                listener()
         return toggle
 
-    def _filter_geom_kwargs(self, kwargs):
-        allowed = {"after","anchor","before","expand","fill","in","ipadx","ipady","padx","pady","side"}
-        if "padding" in kwargs:
-            p = kwargs.pop("padding")
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                kwargs.setdefault("padx", p[0])
-                kwargs.setdefault("pady", p[1])
-            else:
-                kwargs.setdefault("padx", p)
-                kwargs.setdefault("pady", p)
-        kwargs.pop("round", None)
-        return {k: v for k, v in kwargs.items() if k in allowed}
-
-    def pack(self, **kwargs):
-        self.switch.pack(**self._filter_geom_kwargs(kwargs))
+    def _show(self, on, animate=False):
+        self._configure(text=self.on_text if on else self.off_text)
 
-    def grid(self, **kwargs):
-        self.switch.grid(**self._filter_geom_kwargs(kwargs))
+    def add_command_listener(self, func):
+        """Call func() every time the switch is toggled by the user."""
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(func)
 
-    def place(self, **kwargs):
-        self.switch.place(**self._filter_geom_kwargs(kwargs))
-
-    def config(self, **kwargs):
-        self.switch.config(**kwargs)
+    def remove_command_listener(self, func):
+        if self._listeners and func in self._listeners:
+            self._listeners.remove(func)
 
     def is_on(self):
         return self.var.get()
 
     def set_on(self, value):
         self.var.set(value)
-        if value:
-            self.switch.config(text=self.on_text)
+        self._show(value)
+
+
+# root -> {(colors, size, count): tuple of PhotoImage}, shared by every CanvasSwitch
+_frames = weakref.WeakKeyDictionary()
+
+
+def switch_pixels(bg, off_color, on_color, knob_color, width, height, t):
+    """
+    Rows of hex pixels for a sliding toggle with its knob at `t` (0 = off,
+    1 = on): an anti-aliased capsule track blended from off_color to
+    on_color and a round knob, over `bg`. Colors are (r, g, b) tuples.
+    """
+    radius = height / 2.0
+    knob_radius = radius - 2.0
+    track = [a + (b - a) * t for a, b in zip(off_color, on_color)]
+    knob_x = radius + t * (width - 2 * radius)
+    left, right = radius, width - radius
+    rows = []
+    for py in range(height):
+        y = py + 0.5
+        row = []
+        for px in range(width):
+            x = px + 0.5
+            nearest = min(max(x, left), right)
+            track_cover = color.coverage(math.hypot(x - nearest, y - radius) - radius)
+            knob_cover = color.coverage(math.hypot(x - knob_x, y - radius) - knob_radius)
+            pixel = [c + (tc - c) * track_cover for c, tc in zip(bg, track)]
+            pixel = [c + (kc - c) * knob_cover for c, kc in zip(pixel, knob_color)]
+            row.append(color.to_hex(pixel))
+        rows.append(row)
+    return rows
+
+
+def switch_frames(widget, bg, off_color, on_color, knob_color, width=40, height=22, count=8):
+    """
+    The `count` knob positions of a toggle as PhotoImages, rendered once
+    per root, colors and size and shared by every switch that matches.
+    """
+    root = widget._root()
+    cache = _frames.get(root)
+    if cache is None:
+        cache = _frames[root] = {}
+    key = (bg, off_color, on_color, knob_color, width, height, count)
+    frames = cache.get(key)
+    if frames is None:
+        colors = [color.to_rgb(c, widget) for c in (bg, off_color, on_color, knob_color)]
+        frames = []
+        for i in range(count):
+            rows = switch_pixels(*colors, width, height, i / (count - 1))
+            image = tkinter.PhotoImage(master=root, width=width, height=height)
+            image.put(" ".join("{" + " ".join(row) + "}" for row in rows))
+            frames.append(image)
+        frames = cache[key] = tuple(frames)
+    return frames
+
+
+class _KnobTween:
+    __slots__ = ("switch", "start", "delta", "value")
+
+    def __init__(self, switch, start, end):
+        self.switch = switch
+        self.start = start
+        self.delta = end - start
+        self.value = start
+
+    def __call__(self, progress):
+        index = int(round(self.start + self.delta * progress))
+        if index != self.value:
+            self.value = index
+            self.switch._draw(index)
+
+
+class CanvasSwitch(Switch):
+    """
+    Sliding toggle drawn on a Canvas. The knob positions are pre-rendered
+    images shared by every switch with the same colors and size, so
+    toggling only swaps the canvas image on the shared frame clock.
+    is_on/set_on/command behave as on Switch.
+    """
+    __slots__ = ("size", "duration", "frames", "position", "_image", "_text", "_toggle")
+
+    # theme keys the frames are redrawn for; see apply_theme
+    theme_options = {"bg": "bg", "fg": "fg", "accent": "accent"}
+    theme_redraw = True
+    frame_count = 8
+
+    def __init__(self, master=None, on_text="On", off_text="Off", command=None, theme=None,
+                 width=40, height=22, duration=150):
+        Widget.__init__(self, master, theme)
+        self._listeners = None
+        self.var = tkinter.BooleanVar()
+        self.on_text = on_text
+        self.off_text = off_text
+        self.size = (width, height)
+        self.duration = duration
+        self.position = 0
+        self.frames = None
+        self.widget = tkinter.Canvas(master, width=width, height=height, highlightthickness=0, borderwidth=0)
+        self._image = self.widget.create_image(0, 0, anchor="nw")
+        self._text = None
+        if on_text or off_text:
+            font = fonts.get((theme or {}).get("font", fonts.DEFAULT), self.widget)
+            self._text = self.widget.create_text(width + 6, height // 2, anchor="w", text=off_text, font=font)
+            text_width = max(fonts.measure(on_text, font), fonts.measure(off_text, font))
+            self.widget.config(width=width + 6 + text_width)
+        self._toggle = self._toggle_command(command)
+        self.widget.bind("<ButtonRelease-1>", lambda event: self.toggle(), add="+")
+        if theme:
+            self._init_theme()
         else:
-            self.switch.config(text=self.off_text)
-
-    # --- animation helpers ---
-    def _color_to_rgb(self, color):
-        try:
-            if isinstance(color, str) and color.startswith('#'):
-                hex_color = color.lstrip('#')
-                if len(hex_color) == 3:
-                    hex_color = ''.join(c*2 for c in hex_color)
-                return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            r, g, b = self.switch.winfo_rgb(color)
-            return (r // 256, g // 256, b // 256)
-        except Exception:
-            return (255, 255, 255)
-
-    def _rgb_to_hex(self, rgb):
-        return '#%02x%02x%02x' % (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-
-    def animate_bg(self, to_color, duration=300, steps=None):
-        widget = self.switch
-        start_color = widget.cget('bg') or widget.cget('background') or '#ffffff'
-        start_rgb = self._color_to_rgb(start_color)
-        end_rgb = self._color_to_rgb(to_color)
-        if steps is None:
-            steps = max(2, int(duration / 20))
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            t = step / float(steps)
-            cur = tuple(start_rgb[i] + (end_rgb[i] - start_rgb[i]) * t for i in range(3))
-            widget.config(bg=self._rgb_to_hex(cur))
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-        def cancel():
-            cancelled['v'] = True
-        return cancel
-
-    def animate_move(self, to_x, to_y, duration=300, steps=None):
-        widget = self.switch
-        try:
-            current_x = widget.winfo_x()
-            current_y = widget.winfo_y()
-        except Exception:
-            return lambda: None
-        if steps is None:
-            steps = max(2, int(duration / 20))
-        dx = (to_x - current_x) / float(steps)
-        dy = (to_y - current_y) / float(steps)
-        step = 0
-        cancelled = {'v': False}
-
-        def tick():
-            nonlocal step
-            if cancelled['v']:
-                return
-            nx = int(current_x + dx * step)
-            ny = int(current_y + dy * step)
-            try:
-                widget.place_configure(x=nx, y=ny)
-            except Exception:
-                pass
-            step += 1
-            if step <= steps:
-                widget.after(int(duration / steps), tick)
-
-        widget.after(0, tick)
-        def cancel():
-            cancelled['v'] = True
-        return cancel
-
-    def apply_style(self, style):
-        if "bg" in style:
-            self.switch.config(bg=style["bg"])
-        if "fg" in style:
-            self.switch.config(fg=style["fg"])
-        if "font" in style:
-            parts = style["font"].split()
-            self.switch.config(font=(parts[0], int(parts[1]), *parts[2:]))
-        if "padding" in style:
-            p = style["padding"]
-            if isinstance(p, (list, tuple)) and len(p) >= 2:
-                self.switch.config(padx=p[0], pady=p[1])
-            else:
-                self.switch.config(padx=p, pady=p)
-        if "borderwidth" in style:
-            self.switch.config(borderwidth=style["borderwidth"])
-        if "relief" in style:
-            self.switch.config(relief=style["relief"])
+            self.apply_theme()
+
+    def toggle(self):
+        self.var.set(not self.var.get())
+        self._toggle()
+
+    def apply_theme(self):
+        theme = self.theme or {}
+        bg = theme.get("bg", "#ffffff")
+        fg = theme.get("fg", "#000000")
+        off_color = color.to_hex([a + (b - a) * 0.35 for a, b in
+                                  zip(color.to_rgb(bg, self.widget), color.to_rgb(fg, self.widget))])
+        self.frames = switch_frames(self.widget, bg, off_color, theme.get("accent", "#007acc"), "#ffffff",
+                                    *self.size, self.frame_count)
+        self._configure(bg=bg)
+        if self._text is not None:
+            self.widget.itemconfigure(self._text, fill=fg)
+        self._draw(self.position)
+
+    def _show(self, on, animate=False):
+        widget = self.widget
+        if self._text is not None:
+            widget.itemconfigure(self._text, text=self.on_text if on else self.off_text)
+        target = self.frame_count - 1 if on else 0
+        manager = AnimationManager.for_widget(widget)
+        start = manager.current(widget, "knob", self.position)
+        if not animate or not self.duration:
+            running = manager.slots.get((widget, "knob"))
+            if running is not None:
+                running.stop()
+            self._draw(target)
+            return
+        if start == target:
+            return
+        duration = self.duration * abs(target - start) / (self.frame_count - 1)
+        Animation(widget, duration / 1000.0, _KnobTween(self, start, target), easing="ease_out",
+                  slot=(widget, "knob")).start()
+
+    def _draw(self, index):
+        self.position = index
+        self.widget.itemconfigure(self._image, image=self.frames[index])
 
 # compatibility: expose 'widgets' namespace so callers using module.widgets.Switch work
 try:
@@ -159,3 +221,4 @@ except NameError:
     class _WidgetsNamespace: ...
     widgets = _WidgetsNamespace()
     widgets.Switch = Switch
+    widgets.CanvasSwitch = CanvasSwitch
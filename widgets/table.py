@@ -0,0 +1,187 @@
+import math
+import tkinter
+
+from .. import fonts
+from ..animation import Animation, AnimationManager
+from ..widget import Widget
+from .label import Label
+
+
+class _ScrollTween:
+    __slots__ = ("table", "start", "delta")
+
+    def __init__(self, table, start, end):
+        self.table = table
+        self.start = start
+        self.delta = end - start
+
+    def __call__(self, progress):
+        self.table._set_offset(self.start + self.delta * progress)
+
+
+class Table(Widget):
+    """
+    Virtualized list/table. Rows come from `source`, either a sequence or a
+    callable index -> row (then `row_count` is required), and are only
+    fetched while visible. A fixed pool of themed Label rows sized to the
+    viewport is recycled as it scrolls, so memory and per-frame cost do not
+    depend on the number of rows. With row_height=None the height is
+    derived from the theme font's line spacing.
+    """
+    __slots__ = ("source", "row_count", "columns", "row_height", "offset", "body", "scrollbar",
+                 "rows", "cells", "_slot_rows", "_viewport", "_scroll")
+
+    theme_options = {"bg": "bg"}
+
+    def __init__(self, master=None, source=(), columns=1, row_count=None, row_height=22,
+                 width=400, height=300, theme=None, scrollbar=True):
+        super().__init__(master, theme)
+        self.widget = tkinter.Frame(master, width=width, height=height)
+        self.body = tkinter.Frame(self.widget, width=width, height=height)
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = None
+        if scrollbar:
+            self.scrollbar = tkinter.Scrollbar(self.widget, orient="vertical", command=self.yview)
+            self.scrollbar.pack(side="right", fill="y")
+
+        self.columns = columns
+        if row_height is None:
+            font = theme.get("font", fonts.DEFAULT) if theme else fonts.DEFAULT
+            row_height = fonts.line_height(font, self.widget) + 6
+        self.row_height = row_height
+        self.offset = 0.0
+        self.rows = []
+        self.cells = []
+        self._slot_rows = []
+        self._viewport = 0
+        self._scroll = None
+        self.set_source(source, row_count, render=False)
+        self._ensure_pool(height)
+        self._init_theme()
+
+        self.body.bind("<Configure>", self._on_configure, add="+")
+        self._bind_wheel(self.body)
+        self._render()
+
+    # --- data ---
+    def set_source(self, source, row_count=None, render=True):
+        if callable(source):
+            if row_count is None:
+                raise ValueError("row_count is required when source is a callable")
+        elif row_count is None:
+            row_count = len(source)
+        self.source = source
+        self.row_count = row_count
+        self._slot_rows = [None] * len(self.rows)
+        if render:
+            self._set_offset(self.offset)
+
+    def refresh(self):
+        """Re-read the visible rows, e.g. after the data source changed."""
+        if not callable(self.source):
+            self.row_count = len(self.source)
+        self.set_source(self.source, self.row_count)
+
+    def _row(self, index):
+        row = self.source(index) if callable(self.source) else self.source[index]
+        if self.columns == 1:
+            return (row,)
+        return row
+
+    # --- pool ---
+    def _ensure_pool(self, height):
+        self._viewport = height
+        needed = math.ceil(height / self.row_height) + 1
+        while len(self.rows) < needed:
+            row = tkinter.Frame(self.body, height=self.row_height)
+            cells = []
+            for c in range(self.columns):
+                cell = Label(row, theme=self.theme)
+                cell.widget.configure(anchor="w")
+                cell.widget.place(relx=c / self.columns, relwidth=1.0 / self.columns, relheight=1.0)
+                self._bind_wheel(cell.widget)
+                cells.append(cell)
+            row.place(x=0, y=-self.row_height, relwidth=1.0, height=self.row_height)
+            self._bind_wheel(row)
+            self.rows.append(row)
+            self.cells.append(cells)
+            self._slot_rows.append(None)
+
+    def _on_configure(self, event):
+        if event.height > self._viewport:
+            self._ensure_pool(event.height)
+        else:
+            self._viewport = event.height
+        self._set_offset(self.offset)
+
+    # --- scrolling ---
+    def _max_offset(self):
+        return max(0, self.row_count * self.row_height - self._viewport)
+
+    def _set_offset(self, offset):
+        self.offset = min(max(0.0, offset), self._max_offset())
+        self._render()
+
+    def _render(self):
+        batch = AnimationManager.for_widget(self.widget).batch
+        pool = len(self.rows)
+        offset = int(self.offset)
+        first = offset // self.row_height
+        # every row keeps the same slot while it is visible, so scrolling
+        # within a row only moves frames; text is written for new rows only
+        for index in range(first, first + pool):
+            slot = index % pool
+            if self._slot_rows[slot] != index:
+                values = tuple(self._row(index)) if index < self.row_count else ()
+                # a short row must blank the cells the slot's last row filled
+                values += ("",) * (self.columns - len(values))
+                for cell, value in zip(self.cells[slot], values):
+                    batch.write(cell.widget, text=value)
+                self._slot_rows[slot] = index
+            batch.place(self.rows[slot], y=index * self.row_height - offset)
+
+        if self.scrollbar is not None and self.row_count:
+            total = self.row_count * self.row_height
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self._viewport) / total))
+
+    def scroll_to(self, index, duration=0):
+        """Scroll so row `index` is at the top, animated over `duration` ms."""
+        self.scroll_to_offset(index * self.row_height, duration)
+
+    def scroll_to_offset(self, offset, duration=0):
+        if self._scroll is not None:
+            self._scroll.stop()
+            self._scroll = None
+        if not duration:
+            self._set_offset(offset)
+            return
+        target = min(max(0.0, offset), self._max_offset())
+        self._scroll = Animation(self.widget, duration / 1000.0, _ScrollTween(self, self.offset, target),
+                                 easing="ease_out")
+        self._scroll.start()
+
+    def scroll_by(self, pixels, duration=0):
+        self.scroll_to_offset(self.offset + pixels, duration)
+
+    def yview(self, *args):
+        """Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")."""
+        if not args:
+            total = max(1, self.row_count * self.row_height)
+            return self.offset / total, min(1.0, (self.offset + self._viewport) / total)
+        if args[0] == "moveto":
+            self.scroll_to_offset(float(args[1]) * self.row_count * self.row_height)
+        elif args[0] == "scroll":
+            step = self._viewport if args[2] == "pages" else self.row_height
+            self.scroll_by(int(args[1]) * step)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            direction = -1
+        else:
+            direction = 1
+        self.scroll_by(direction * 3 * self.row_height, duration=120)